@@ -0,0 +1,287 @@
+# qmind_quant/analytics/performance_metrics.py
+
+# Performance metrics over one return series or a (T x N) matrix of them,
+# one column per strategy, parameter set or allocation. Each metric is a few
+# NumPy reductions along the time axis, so scoring thousands of curves costs
+# about as much as scoring one. The definitions follow quantstats (rf=0).
+#
+# A 1-D input gives a float, a DataFrame a Series indexed by its columns and
+# a 2-D array an array. Returns are simple per-period returns without NaNs,
+# e.g. an equity curve's 'returns' column.
+
+import numpy as np
+import pandas as pd
+
+# Trading days per year, used to annualize as quantstats does
+PERIODS_PER_YEAR = 252
+
+
+def _as_2d(returns) -> tuple[np.ndarray, bool, pd.Index | None]:
+    columns = returns.columns if isinstance(returns, pd.DataFrame) else None
+    values = np.asarray(returns, dtype=np.float64)
+    squeeze = values.ndim == 1
+    return values.reshape(len(values), -1), squeeze, columns
+
+
+def _result(values: np.ndarray, squeeze: bool, columns: pd.Index | None):
+    if squeeze:
+        return float(values[0])
+    if columns is not None:
+        return pd.Series(values, index=columns)
+    return values
+
+
+def equity_curves(returns, base: float = 1.0) -> np.ndarray:
+    """The compounded (T x N) equity curves, starting from 'base'."""
+    values, _, _ = _as_2d(returns)
+    return base * np.cumprod(1.0 + values, axis=0)
+
+
+def drawdowns(returns) -> np.ndarray:
+    """
+    The (T x N) drawdowns from the running peak, as negative fractions.
+    The starting equity counts as a peak, so a loss on the first period is
+    a drawdown.
+    """
+    equity = equity_curves(returns)
+    peaks = np.maximum.accumulate(np.maximum(equity, 1.0), axis=0)
+    return equity / peaks - 1.0
+
+
+def sharpe(returns, periods: int = PERIODS_PER_YEAR):
+    """The annualized Sharpe Ratio (rf=0)."""
+    values, squeeze, columns = _as_2d(returns)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = values.mean(axis=0) / values.std(axis=0, ddof=1)
+    return _result(ratio * np.sqrt(periods), squeeze, columns)
+
+
+def sortino(returns, periods: int = PERIODS_PER_YEAR):
+    """
+    The annualized Sortino Ratio: the mean return over the downside
+    deviation, the root mean square of the negative returns over all periods.
+    """
+    values, squeeze, columns = _as_2d(returns)
+    downside = np.sqrt(np.sum(np.minimum(values, 0.0) ** 2, axis=0) / len(values))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(downside > 0, values.mean(axis=0) / downside, np.nan)
+    return _result(ratio * np.sqrt(periods), squeeze, columns)
+
+
+def volatility(returns, periods: int = PERIODS_PER_YEAR):
+    """The annualized standard deviation of returns."""
+    values, squeeze, columns = _as_2d(returns)
+    return _result(values.std(axis=0, ddof=1) * np.sqrt(periods), squeeze, columns)
+
+
+def max_drawdown(returns):
+    """The largest peak-to-trough loss, as a negative fraction."""
+    values, squeeze, columns = _as_2d(returns)
+    return _result(drawdowns(values).min(axis=0), squeeze, columns)
+
+
+def max_drawdown_duration(returns):
+    """The longest run of consecutive periods spent below a previous peak."""
+    values, squeeze, columns = _as_2d(returns)
+    underwater = drawdowns(values) < 0
+    # The index of the last period at the peak, carried forward
+    at_peak = np.where(~underwater, np.arange(len(values))[:, None], -1)
+    last_peak = np.maximum.accumulate(at_peak, axis=0)
+    run_lengths = np.where(underwater, np.arange(len(values))[:, None] - last_peak, 0)
+    return _result(run_lengths.max(axis=0, initial=0), squeeze, columns)
+
+
+def cagr(returns, periods: int = PERIODS_PER_YEAR):
+    """The compound annual growth rate, with 'periods' periods per year."""
+    values, squeeze, columns = _as_2d(returns)
+    years = len(values) / periods
+    growth = np.prod(1.0 + values, axis=0)
+    with np.errstate(invalid="ignore"):
+        rate = np.where(growth < 0, np.nan, np.abs(growth) ** (1.0 / years) - 1.0)
+    return _result(rate, squeeze, columns)
+
+
+def calmar(returns, periods: int = PERIODS_PER_YEAR):
+    """The CAGR over the absolute maximum drawdown."""
+    values, squeeze, columns = _as_2d(returns)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = cagr(values, periods) / np.abs(max_drawdown(values))
+    return _result(ratio, squeeze, columns)
+
+
+def win_rate(returns):
+    """
+    The hit rate: the share of periods with a gain among those with a
+    non-zero return, or 0 if there are none.
+    """
+    values, squeeze, columns = _as_2d(returns)
+    traded = np.count_nonzero(values, axis=0)
+    wins = np.count_nonzero(values > 0, axis=0)
+    rate = np.divide(wins, traded, out=np.zeros(values.shape[1]), where=traded > 0)
+    return _result(rate, squeeze, columns)
+
+
+def turnover(weights, periods: int | None = None):
+    """
+    The mean one-way turnover per period: half the summed absolute change
+    of the (T x K) portfolio weights, or of a (T x K x N) stack of them.
+    With 'periods', it is annualized.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.ndim == 1:
+        weights = weights[:, None]
+    traded = 0.5 * np.abs(np.diff(weights, axis=0)).sum(axis=1)
+    mean = traded.mean(axis=0) * (periods or 1)
+    return float(mean) if np.ndim(mean) == 0 else mean
+
+
+def summary(returns, periods: int = PERIODS_PER_YEAR) -> pd.DataFrame:
+    """All return-based metrics, one row per metric and one column per curve."""
+    values, _, columns = _as_2d(returns)
+    if columns is None:
+        columns = (
+            [returns.name or "returns"]
+            if isinstance(returns, pd.Series)
+            else pd.RangeIndex(values.shape[1])
+        )
+    metrics = {
+        "sharpe": sharpe(values, periods),
+        "sortino": sortino(values, periods),
+        "cagr": cagr(values, periods),
+        "volatility": volatility(values, periods),
+        "max_drawdown": max_drawdown(values),
+        "max_drawdown_duration": max_drawdown_duration(values),
+        "calmar": calmar(values, periods),
+        "win_rate": win_rate(values),
+    }
+    return pd.DataFrame(metrics, index=columns).T
+
+
+class OnlinePerformanceStats:
+    """
+    Running performance statistics of an equity curve, updated in O(1) per
+    value, so a backtest's Sharpe, drawdown and trade counts can be read
+    at any point of the run instead of after the whole curve is built.
+
+    Returns are tracked with Welford's algorithm, the running peak and
+    drawdown with a few scalars. Fed every value of an equity curve, the
+    statistics match the vectorized metrics over the curve's returns
+    (the first value counting as a zero return, as in get_equity_curve).
+    """
+
+    def __init__(self, periods: int = PERIODS_PER_YEAR):
+        self.periods = periods
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0  # Sum of squared deviations from the mean
+        self._downside_sq = 0.0
+        self.wins = 0
+        self.losses = 0
+
+        self.first_value = None
+        self.last_value = None
+        self.peak = None
+        self.drawdown = 0.0
+        self.max_drawdown = 0.0
+        self.drawdown_duration = 0
+        self.max_drawdown_duration = 0
+
+        self.trades = 0
+        self.traded_value = 0.0
+
+    def update(self, value: float) -> float:
+        """Adds the curve's next value and returns its period return."""
+        if self.last_value is None:
+            self.first_value = self.peak = value
+            period_return = 0.0
+        else:
+            period_return = value / self.last_value - 1.0 if self.last_value else 0.0
+        self.last_value = value
+
+        self.count += 1
+        delta = period_return - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (period_return - self.mean)
+        if period_return < 0:
+            self._downside_sq += period_return**2
+            self.losses += 1
+        elif period_return > 0:
+            self.wins += 1
+
+        self.peak = max(self.peak, value)
+        self.drawdown = value / self.peak - 1.0 if self.peak else 0.0
+        self.max_drawdown = min(self.max_drawdown, self.drawdown)
+        self.drawdown_duration = self.drawdown_duration + 1 if self.drawdown < 0 else 0
+        self.max_drawdown_duration = max(
+            self.max_drawdown_duration, self.drawdown_duration
+        )
+        return period_return
+
+    def record_trade(self, value: float):
+        """Counts a fill and its traded notional."""
+        self.trades += 1
+        self.traded_value += abs(value)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else float("nan")
+
+    @property
+    def volatility(self) -> float:
+        return float(np.sqrt(self.variance * self.periods))
+
+    @property
+    def sharpe(self) -> float:
+        std = np.sqrt(self.variance)
+        if not std > 0:
+            return float("nan")
+        return float(self.mean / std * np.sqrt(self.periods))
+
+    @property
+    def sortino(self) -> float:
+        if self._downside_sq == 0:
+            return float("nan")
+        downside = np.sqrt(self._downside_sq / self.count)
+        return float(self.mean / downside * np.sqrt(self.periods))
+
+    @property
+    def total_return(self) -> float:
+        if not self.first_value:
+            return 0.0
+        return self.last_value / self.first_value - 1.0
+
+    @property
+    def cagr(self) -> float:
+        growth = 1.0 + self.total_return
+        if self.count == 0 or growth < 0:
+            return float("nan")
+        return float(growth ** (self.periods / self.count) - 1.0)
+
+    @property
+    def calmar(self) -> float:
+        if self.max_drawdown == 0:
+            return float("nan")
+        return self.cagr / abs(self.max_drawdown)
+
+    @property
+    def win_rate(self) -> float:
+        traded = self.wins + self.losses
+        return self.wins / traded if traded else 0.0
+
+    def snapshot(self) -> dict:
+        """All the statistics so far."""
+        return {
+            "periods": self.count,
+            "total_return": self.total_return,
+            "sharpe": self.sharpe,
+            "sortino": self.sortino,
+            "cagr": self.cagr,
+            "volatility": self.volatility,
+            "drawdown": self.drawdown,
+            "max_drawdown": self.max_drawdown,
+            "max_drawdown_duration": self.max_drawdown_duration,
+            "calmar": self.calmar,
+            "win_rate": self.win_rate,
+            "trades": self.trades,
+            "traded_value": self.traded_value,
+        }
@@ -10,5 +10,13 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
 FEATURES_DATA_DIR = DATA_DIR / "features"
+# The feature data partitioned by ticker, for out-of-core training
+FEATURE_STORE_DIR = FEATURES_DATA_DIR / "ml_feature_store"
+LIVE_DATA_DIR = DATA_DIR / "live"
+CACHE_DIR = DATA_DIR / "cache"
+# The recent bars the live strategies held at shutdown, used to warm them up
+BAR_SNAPSHOT_FILE = LIVE_DATA_DIR / "bar_snapshot.parquet"
 MODELS_DIR = PROJECT_ROOT / "qmind_quant" / "ml_models" / "models"
+# The best XGBoost hyperparameters found by scripts/run_hyperparameter_search.py
+TUNED_PARAMS_FILE = MODELS_DIR / "xgboost_params.json"
 REPORTS_DIR = PROJECT_ROOT / "reports"
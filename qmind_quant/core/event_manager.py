@@ -1,7 +1,11 @@
 # qmind_quant/core/event_manager.py
 
+import asyncio
+import dataclasses
+import time
+from collections import OrderedDict
 from queue import Queue
-from qmind_quant.core.event_types import Event
+from qmind_quant.core.event_types import Event, MarketEvent
 
 
 class EventManager:
@@ -29,3 +33,150 @@ class EventManager:
         Checks if the event queue is empty.
         """
         return self.events.empty()
+
+
+class AsyncEventManager:
+    """
+    The asyncio counterpart of EventManager, used by the live trading engine.
+
+    put() is safe to call from any thread: components running inside an
+    executor (e.g. a strategy doing model inference) hand their events back
+    to the event loop's thread instead of touching the queue directly.
+
+    Market bars go into a separate, bounded lane so that a slow strategy
+    cannot make the backlog (and the age of the bars it trades on) grow
+    without limit. At most one bar per ticker is pending: a newer bar either
+    replaces the pending one or is merged into it OHLCV-wise. If the lane is
+    full, the oldest pending bar is dropped. Signals, orders and fills are
+    never dropped and are handed out before any pending bar, as in the
+    backtest, where a bar's events are all processed before the next bar.
+
+    With 'track_latency' on, every event is stamped with the time it was put
+    on the queue, and events without an ingress time inherit the ingress time
+    of the event being processed ('current_ingress_ns'), so a signal, its
+    order and the order's fill are all timed from the bar that caused them.
+    """
+
+    def __init__(self, max_pending_bars: int = 1000, coalesce: str = "merge"):
+        """
+        Args:
+            max_pending_bars (int): The most bars (i.e. tickers) waiting at once.
+            coalesce (str): How a newer bar for a ticker with a pending bar is
+                handled: 'merge' combines them into one bar spanning both,
+                'replace' keeps only the newer bar.
+        """
+        if coalesce not in ("merge", "replace"):
+            raise ValueError("coalesce must be 'merge' or 'replace'")
+        if max_pending_bars < 1:
+            raise ValueError("max_pending_bars must be at least 1")
+        self.max_pending_bars = max_pending_bars
+        self.coalesce = coalesce
+
+        self.events = asyncio.Queue()
+        self._bars = OrderedDict()  # ticker -> pending MarketEvent, oldest first
+        self._ready = asyncio.Event()
+        self._loop = None
+
+        self.track_latency = False
+        self.current_ingress_ns = 0
+
+        # Counters for monitoring
+        self.bars_received = 0
+        self.bars_merged = 0
+        self.bars_replaced = 0
+        self.bars_dropped = 0
+        self.max_bar_depth = 0
+        self.max_event_depth = 0
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        """Binds the manager to the event loop that consumes its events."""
+        self._loop = loop
+
+    def put(self, event: Event | None):
+        """
+        Puts an event in the queue.
+        """
+        if self.track_latency and event is not None:
+            if not event.ingress_ns:
+                event.ingress_ns = self.current_ingress_ns
+            event.enqueued_ns = time.perf_counter_ns()
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if self._loop is None or running_loop is self._loop:
+            self._put_nowait(event)
+        else:
+            self._loop.call_soon_threadsafe(self._put_nowait, event)
+
+    def _put_nowait(self, event: Event | None):
+        if isinstance(event, MarketEvent):
+            self._put_bar(event)
+        else:
+            self.events.put_nowait(event)
+            self.max_event_depth = max(self.max_event_depth, self.events.qsize())
+        self._ready.set()
+
+    def _put_bar(self, bar: MarketEvent):
+        self.bars_received += 1
+        pending = self._bars.get(bar.ticker)
+        if pending is not None:
+            # The ticker keeps its place in line, so a busy ticker cannot
+            # starve the others. Latency is timed from the newest bar.
+            if self.coalesce == "merge":
+                self._bars[bar.ticker] = dataclasses.replace(
+                    bar,
+                    open=pending.open,
+                    high=max(pending.high, bar.high),
+                    low=min(pending.low, bar.low),
+                    volume=pending.volume + bar.volume,
+                )
+                self.bars_merged += 1
+            else:
+                self._bars[bar.ticker] = bar
+                self.bars_replaced += 1
+            return
+
+        if len(self._bars) >= self.max_pending_bars:
+            self._bars.popitem(last=False)
+            self.bars_dropped += 1
+        self._bars[bar.ticker] = bar
+        self.max_bar_depth = max(self.max_bar_depth, len(self._bars))
+
+    async def get(self) -> Event | None:
+        """
+        Waits for and gets an event from the queue.
+        """
+        while True:
+            if not self.events.empty():
+                return self.events.get_nowait()
+            if self._bars:
+                return self._bars.popitem(last=False)[1]
+            self._ready.clear()
+            await self._ready.wait()
+
+    def empty(self) -> bool:
+        """
+        Checks if the event queue is empty.
+        """
+        return self.events.empty() and not self._bars
+
+    @property
+    def bar_depth(self) -> int:
+        """The number of bars currently waiting."""
+        return len(self._bars)
+
+    def stats(self) -> dict:
+        """The lane's counters and queue depths, for monitoring."""
+        return {
+            "bars_received": self.bars_received,
+            "bars_merged": self.bars_merged,
+            "bars_replaced": self.bars_replaced,
+            "bars_dropped": self.bars_dropped,
+            "bar_depth": self.bar_depth,
+            "max_bar_depth": self.max_bar_depth,
+            "event_depth": self.events.qsize(),
+            "max_event_depth": self.max_event_depth,
+        }
@@ -11,6 +11,12 @@ class Event:
     # This field is intentionally left without a default in the base class
     event_type: str
 
+    # Latency tracing for the live path, as time.perf_counter_ns() values:
+    # when the bar that caused this event arrived, and when the event was put
+    # on the queue. Zero when not traced (e.g. in backtests).
+    ingress_ns: int = field(default=0, kw_only=True, repr=False, compare=False)
+    enqueued_ns: int = field(default=0, kw_only=True, repr=False, compare=False)
+
 
 @dataclass
 class MarketEvent(Event):
@@ -49,9 +55,11 @@ class OrderEvent(Event):
 
     timestamp: datetime
     ticker: str
-    order_type: str  # 'MKT' (Market), 'LMT' (Limit)
+    order_type: str  # 'MKT' (Market), 'LMT' (Limit), 'STP' (Stop)
     direction: str  # 'BUY' or 'SELL'
     quantity: int
+    limit_price: float | None = None  # Required for 'LMT' orders
+    stop_price: float | None = None  # Required for 'STP' orders
     event_type: str = field(default="ORDER", init=False)
 
 
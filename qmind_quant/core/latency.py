@@ -0,0 +1,204 @@
+# qmind_quant/core/latency.py
+
+import asyncio
+import json
+import time
+from itertools import accumulate
+
+# The Redis key the live engine publishes its latency summary to.
+LATENCY_KEY = "qmind:latency"
+
+# The stages of the live path the engine records.
+STAGES = ("queue_wait", "strategy", "portfolio", "execution", "tick_to_order")
+
+
+class LatencyHistogram:
+    """
+    A log-linear latency histogram in the style of HdrHistogram.
+
+    Values (in nanoseconds) fall into buckets whose width doubles with every
+    power of two, each power of two being split into 2**(sub_bucket_bits - 1)
+    linear buckets. With the default of 7 bits, every recorded value is known
+    to within 1/64 (about 1.6%) of itself, from nanoseconds up to
+    'max_value_ns', in a few thousand counters. Recording is an integer
+    bit_length() and a list increment, so it is cheap enough for every event.
+    """
+
+    def __init__(self, max_value_ns: int = 60_000_000_000, sub_bucket_bits: int = 7):
+        """
+        Args:
+            max_value_ns (int): Larger values are recorded as this value.
+            sub_bucket_bits (int): The precision; see the class docstring.
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self._half = 1 << (sub_bucket_bits - 1)
+        self.max_value_ns = max_value_ns
+        self.counts = [0] * (self._index(max_value_ns) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = None
+
+    def _index(self, value: int) -> int:
+        magnitude = max(value.bit_length() - self.sub_bucket_bits, 0)
+        return magnitude * self._half + (value >> magnitude)
+
+    def _highest_equivalent_value(self, index: int) -> int:
+        """The largest value that falls into the bucket at 'index'."""
+        if index < 2 * self._half:
+            return index
+        magnitude = (index // self._half) - 1
+        sub_bucket = index - magnitude * self._half
+        return ((sub_bucket + 1) << magnitude) - 1
+
+    def record(self, value_ns: int):
+        """Records one latency, in nanoseconds."""
+        value_ns = min(max(int(value_ns), 0), self.max_value_ns)
+        self.counts[self._index(value_ns)] += 1
+        self.count += 1
+        self.total_ns += value_ns
+        if self.min_ns is None or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if self.max_ns is None or value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def percentiles(self, quantiles: list[float]) -> list[int | None]:
+        """The values at the given quantiles (e.g. 0.99), in one pass."""
+        if self.count == 0:
+            return [None] * len(quantiles)
+        targets = [max(int(q * self.count + 0.5), 1) for q in quantiles]
+        results = [None] * len(quantiles)
+        order = sorted(range(len(targets)), key=targets.__getitem__)
+        position = 0
+        for index, cumulative in enumerate(accumulate(self.counts)):
+            while position < len(order) and cumulative >= targets[order[position]]:
+                # Never report more than the largest value actually seen
+                results[order[position]] = min(
+                    self._highest_equivalent_value(index), self.max_ns
+                )
+                position += 1
+            if position == len(order):
+                break
+        return results
+
+    def percentile(self, quantile: float) -> int | None:
+        return self.percentiles([quantile])[0]
+
+    def merge(self, other: "LatencyHistogram"):
+        """Adds another histogram with the same layout into this one."""
+        if len(other.counts) != len(self.counts):
+            raise ValueError("Histograms must share max_value_ns and precision")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total_ns += other.total_ns
+        if other.count:
+            self.min_ns = (
+                other.min_ns if self.min_ns is None else min(self.min_ns, other.min_ns)
+            )
+            self.max_ns = (
+                other.max_ns if self.max_ns is None else max(self.max_ns, other.max_ns)
+            )
+
+    def reset(self):
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = None
+
+
+class LatencyRecorder:
+    """
+    Collects a LatencyHistogram per stage of the live path and reports them.
+
+    snapshot() is the in-process view (p50/p99/p999 per stage, in
+    microseconds). If given a Redis client, the live engine also publishes
+    the snapshot as JSON to LATENCY_KEY every 'publish_interval' seconds.
+    Components take an optional recorder and skip all timing when it is
+    None, so a disabled recorder costs a single 'is None' check per stage.
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        key: str = LATENCY_KEY,
+        publish_interval: float = 5.0,
+        **histogram_kwargs,
+    ):
+        """
+        Args:
+            redis_client (optional): An asyncio Redis client to publish to.
+            key (str): The Redis key the snapshot is written to.
+            publish_interval (float): Seconds between publishes.
+            **histogram_kwargs: Passed to each stage's LatencyHistogram.
+        """
+        self.redis_client = redis_client
+        self.key = key
+        self.publish_interval = publish_interval
+        self._histogram_kwargs = histogram_kwargs
+        self.histograms = {
+            stage: LatencyHistogram(**histogram_kwargs) for stage in STAGES
+        }
+
+    def record(self, stage: str, elapsed_ns: int):
+        """Records one latency for a stage, creating the stage if it is new."""
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = LatencyHistogram(
+                **self._histogram_kwargs
+            )
+        histogram.record(elapsed_ns)
+
+    def record_since(self, stage: str, start_ns: int) -> int:
+        """
+        Records the time elapsed since 'start_ns' (a perf_counter_ns value).
+        Returns the current time, so consecutive stages can be chained.
+        """
+        now = time.perf_counter_ns()
+        self.record(stage, now - start_ns)
+        return now
+
+    def snapshot(self) -> dict:
+        """Per-stage count, mean and p50/p99/p999/max latency in microseconds."""
+        summary = {}
+        for stage, histogram in self.histograms.items():
+            p50, p99, p999 = histogram.percentiles([0.5, 0.99, 0.999])
+            summary[stage] = {
+                "count": histogram.count,
+                "mean_us": (
+                    histogram.total_ns / histogram.count / 1e3
+                    if histogram.count
+                    else None
+                ),
+                "p50_us": _to_us(p50),
+                "p99_us": _to_us(p99),
+                "p999_us": _to_us(p999),
+                "max_us": _to_us(histogram.max_ns),
+            }
+        return summary
+
+    async def publish(self):
+        """Writes the snapshot to Redis as a JSON string."""
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.set(self.key, json.dumps(self.snapshot()))
+        except Exception as e:
+            print(f"!!! ERROR: Failed to publish latency metrics to Redis: {e} !!!")
+
+    async def run_publisher(self, stop: asyncio.Event):
+        """Publishes every 'publish_interval' seconds, and once more on stop."""
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.publish_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.publish()
+
+    def reset(self):
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+
+def _to_us(value_ns: int | None) -> float | None:
+    return None if value_ns is None else value_ns / 1e3
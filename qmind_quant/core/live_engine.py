@@ -0,0 +1,191 @@
+# qmind_quant/core/live_engine.py
+
+import asyncio
+import inspect
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from qmind_quant.core.event_manager import AsyncEventManager
+from qmind_quant.core.event_types import Event
+from qmind_quant.core.latency import LatencyRecorder
+from qmind_quant.strategies.base_strategy import BaseStrategy
+from qmind_quant.portfolio_management.portfolio import Portfolio
+
+
+class LiveTradingEngine:
+    """
+    Drives the live trading loop on a single asyncio event loop.
+
+    The data stream, the event dispatch loop and order submission all share
+    one loop, so nothing blocks on another thread. The only work taken off
+    the loop is the strategy's on_market_event (feature calculation and
+    model inference), which runs in an executor while the loop keeps
+    receiving bars.
+    """
+
+    def __init__(
+        self,
+        event_manager: AsyncEventManager,
+        data_handler,
+        strategy: BaseStrategy,
+        portfolio: Portfolio,
+        execution_handler,
+        executor: Executor | None = None,
+        offload_strategy: bool = True,
+        latency_recorder: LatencyRecorder | None = None,
+    ):
+        """
+        Args:
+            event_manager (AsyncEventManager): The central event queue.
+            data_handler: Provides market data through an async run_async()
+                (e.g. LiveDataHandler).
+            strategy (BaseStrategy): The strategy generating signals.
+            portfolio (Portfolio): Turns signals into orders and tracks fills.
+            execution_handler: Sends orders to a broker. Its on_order may be a
+                coroutine function or a regular (blocking) function. Its
+                close(), if it has one, is called at shutdown.
+            executor (Executor, optional): Where blocking strategy work runs.
+                Defaults to a single worker thread, so the strategy's state is
+                only ever touched from one thread.
+            offload_strategy (bool): Run the strategy in the executor. Disable
+                for cheap strategies where the hand-off costs more than it saves.
+            latency_recorder (LatencyRecorder, optional): Records per-stage and
+                tick-to-order latency. No timing is done without one.
+        """
+        self.event_manager = event_manager
+        self.data_handler = data_handler
+        self.strategy = strategy
+        self.portfolio = portfolio
+        self.execution_handler = execution_handler
+        self.offload_strategy = offload_strategy
+        self.latency_recorder = latency_recorder
+        if latency_recorder is not None:
+            event_manager.track_latency = True
+
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="strategy"
+        )
+        self._feed_task = None
+        self._feed_done = False
+
+    async def run(self):
+        """
+        Runs until the data stream finishes (or stop() is called) and every
+        event it caused has been processed.
+        """
+        loop = asyncio.get_running_loop()
+        self.event_manager.bind(loop)
+
+        print("--- Starting Live Trading Engine ---")
+        self._feed_task = asyncio.create_task(self.data_handler.run_async())
+        # A None sentinel tells the loop the stream is done
+        self._feed_task.add_done_callback(lambda _: self.event_manager.put(None))
+
+        publisher_stop = asyncio.Event()
+        publisher_task = None
+        if self.latency_recorder is not None:
+            publisher_task = asyncio.create_task(
+                self.latency_recorder.run_publisher(publisher_stop)
+            )
+
+        self._feed_done = False
+        try:
+            await self._process_events()
+            # Orders may still be in flight at the broker; wait for them so
+            # their fills reach the portfolio before shutting down
+            drain = getattr(self.execution_handler, "drain", None)
+            while drain is not None and self.execution_handler.busy:
+                idle = await drain()
+                await self._process_events()
+                if not idle:
+                    break
+        finally:
+            if not self._feed_task.done():
+                self._feed_task.cancel()
+            if publisher_task is not None:
+                publisher_stop.set()
+                await publisher_task
+            if self._owns_executor:
+                self.executor.shutdown(wait=False)
+            close = getattr(self.execution_handler, "close", None)
+            if close is not None:
+                close()
+
+        print("\n--- Live Trading Engine stopped ---")
+        stats = self.event_manager.stats()
+        print(
+            f"Bars received: {stats['bars_received']}, "
+            f"merged: {stats['bars_merged']}, replaced: {stats['bars_replaced']}, "
+            f"dropped: {stats['bars_dropped']}, "
+            f"max pending: {stats['max_bar_depth']}"
+        )
+        if self.latency_recorder is not None:
+            for stage, summary in self.latency_recorder.snapshot().items():
+                if summary["count"]:
+                    print(
+                        f"Latency {stage}: p50 {summary['p50_us']:.0f} us, "
+                        f"p99 {summary['p99_us']:.0f} us, "
+                        f"p99.9 {summary['p999_us']:.0f} us ({summary['count']} events)"
+                    )
+        if not self._feed_task.cancelled():
+            # Re-raise anything that made the data stream fail
+            self._feed_task.result()
+
+    async def _process_events(self):
+        """Dispatches events until the feed is done and the queue is empty."""
+        while not (self._feed_done and self.event_manager.empty()):
+            event = await self.event_manager.get()
+            if event is None:
+                self._feed_done = True
+                continue
+            try:
+                await self._dispatch(event)
+            except Exception as e:
+                print(f"!!! An error occurred: {e} !!!")
+
+    async def stop(self):
+        """Asks the data stream to close; run() returns once events drain."""
+        await self.data_handler.stop_async()
+
+    async def _dispatch(self, event: Event):
+        # Every timing below is skipped when the recorder is disabled
+        recorder = self.latency_recorder
+        if recorder is not None:
+            start = recorder.record_since("queue_wait", event.enqueued_ns)
+            # Events put while handling this one are timed from the same bar
+            self.event_manager.current_ingress_ns = event.ingress_ns
+
+        if event.event_type == "MARKET":
+            if self.offload_strategy:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    self.executor, self.strategy.on_market_event, event
+                )
+            else:
+                self.strategy.on_market_event(event)
+            if recorder is not None:
+                start = recorder.record_since("strategy", start)
+            self.portfolio.on_market_event(event)
+            if recorder is not None:
+                recorder.record_since("portfolio", start)
+
+        elif event.event_type == "SIGNAL":
+            self.portfolio.on_signal(event)
+            if recorder is not None:
+                recorder.record_since("portfolio", start)
+
+        elif event.event_type == "ORDER":
+            if inspect.iscoroutinefunction(self.execution_handler.on_order):
+                await self.execution_handler.on_order(event)
+            else:
+                await asyncio.to_thread(self.execution_handler.on_order, event)
+            if recorder is not None:
+                recorder.record_since("execution", start)
+                if event.ingress_ns:
+                    recorder.record_since("tick_to_order", event.ingress_ns)
+
+        elif event.event_type == "FILL":
+            self.portfolio.on_fill(event)
+            self.strategy.on_fill_event(event)
+            if recorder is not None:
+                recorder.record_since("portfolio", start)
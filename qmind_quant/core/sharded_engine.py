@@ -0,0 +1,392 @@
+# qmind_quant/core/sharded_engine.py
+
+import asyncio
+import multiprocessing as mp
+import queue
+import time
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from qmind_quant.core.event_manager import AsyncEventManager, EventManager
+from qmind_quant.core.event_types import OrderEvent
+from qmind_quant.data_management.price_cache import PriceCache
+
+# Seconds between order status checks while the aggregator has open orders
+FILL_POLL_INTERVAL = 0.5
+# How long the aggregator waits at shutdown for open orders to fill
+FILL_SETTLE_TIMEOUT = 10.0
+
+
+def shard_for(ticker: str, n_shards: int) -> int:
+    """
+    The shard that handles a ticker. Uses crc32 rather than hash(), which is
+    salted per process, so the router and any restarted worker always agree.
+    """
+    return zlib.crc32(ticker.encode()) % n_shards
+
+
+def net_orders(orders: list[OrderEvent]) -> list[OrderEvent]:
+    """
+    Nets market orders per ticker into at most one order each, so a BUY and
+    a SELL from the same batch cross internally instead of both going to the
+    broker. Limit and stop orders are passed through unchanged.
+    """
+    netted = {}
+    passthrough = []
+    for order in orders:
+        if order.order_type != "MKT":
+            passthrough.append(order)
+            continue
+        signed = order.quantity if order.direction == "BUY" else -order.quantity
+        quantity, _ = netted.get(order.ticker, (0, None))
+        netted[order.ticker] = (quantity + signed, order.timestamp)
+
+    result = [
+        OrderEvent(
+            timestamp, ticker, "MKT", "BUY" if quantity > 0 else "SELL", abs(quantity)
+        )
+        for ticker, (quantity, timestamp) in netted.items()
+        if quantity != 0
+    ]
+    return result + passthrough
+
+
+@dataclass(frozen=True)
+class _PriceMark:
+    """The closes of every bar of 'timestamp', sent once they are all routed."""
+
+    timestamp: object
+    prices: dict
+
+
+def _receive_result(conn, process):
+    """Waits for the aggregator's result, failing if it exits without one."""
+    while not conn.poll(0.1):
+        if not process.is_alive() and not conn.poll():
+            raise RuntimeError("The aggregator process exited without a result")
+    return conn.recv()
+
+
+def _drain(event_manager: EventManager) -> list:
+    events = []
+    while not event_manager.empty():
+        events.append(event_manager.get())
+    return events
+
+
+def _has_open_orders(execution_handler) -> bool:
+    """Whether the handler tracks orders that may still fill."""
+    return hasattr(execution_handler, "poll_fills") and bool(
+        execution_handler.open_orders
+    )
+
+
+def _execute(event_manager, portfolio, execution_handler) -> tuple[int, int]:
+    """
+    Nets and sends the queued orders, then books the fills that came back.
+
+    Returns:
+        tuple[int, int]: The number of orders sent and of fills booked.
+    """
+    orders = net_orders(_drain(event_manager))
+    for order in orders:
+        execution_handler.on_order(order)
+    if _has_open_orders(execution_handler):
+        execution_handler.poll_fills()
+    fills = _drain(event_manager)
+    for fill in fills:
+        portfolio.on_fill(fill)
+    return len(orders), len(fills)
+
+
+def _run_shard(conn, tickers, strategy_factory, signal_queue):
+    """
+    A worker process: runs its own strategy instance over the bars of its
+    tickers and forwards the signals it generates, one batch per bar.
+    """
+    event_manager = EventManager()
+    try:
+        strategy = strategy_factory(tickers, event_manager)
+        while True:
+            bar = conn.recv()
+            if bar is None:
+                break
+            strategy.on_market_event(bar)
+            signals = _drain(event_manager)
+            if signals:
+                signal_queue.put(signals)
+    finally:
+        # Tells the aggregator this shard is done
+        signal_queue.put(None)
+        conn.close()
+
+
+def _run_aggregator(
+    signal_queue,
+    result_conn,
+    n_shards,
+    cache_name,
+    tickers,
+    portfolio_factory,
+    execution_factory,
+):
+    """
+    The portfolio/risk process: turns the shards' signals into orders with a
+    single Portfolio, nets them per ticker and executes them. The router
+    sends a mark with each timestamp's closes, on which the portfolio is
+    marked through Portfolio.on_prices (its equity curve, statistics, risk
+    manager and drawdown check). Marks and signals are applied in timestamp
+    order, so orders are sized and risk checked against the prices of their
+    own timestamp rather than whatever the price cache holds by then.
+
+    Fills come back on the aggregator's event queue: at once from handlers
+    that fill on submission, or from an execution handler's poll_fills()
+    (e.g. LiveExecutionHandler), which is polled while orders are open.
+    """
+    price_cache = PriceCache.attach(cache_name, tickers)
+    event_manager = EventManager()
+    portfolio = portfolio_factory(event_manager, price_cache)
+    execution_handler = execution_factory(event_manager, price_cache)
+
+    def execute():
+        nonlocal orders_sent, fills
+        sent, filled = _execute(event_manager, portfolio, execution_handler)
+        orders_sent += sent
+        fills += filled
+
+    signals_received = orders_sent = fills = marks = 0
+    # The shards and the router each end their stream with a None
+    open_producers = n_shards + 1
+    while open_producers:
+        try:
+            # While orders are open, wake up to poll them for fills
+            timeout = (
+                FILL_POLL_INTERVAL if _has_open_orders(execution_handler) else None
+            )
+            batches = [signal_queue.get(timeout=timeout)]
+        except queue.Empty:
+            execute()
+            continue
+        # Take everything else that is already waiting, to net as one batch
+        while True:
+            try:
+                batches.append(signal_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        # timestamp -> [its mark, its signals]
+        steps = {}
+        for batch in batches:
+            if batch is None:
+                open_producers -= 1
+            elif isinstance(batch, _PriceMark):
+                steps.setdefault(batch.timestamp, [None, []])[0] = batch
+            else:
+                for signal in batch:
+                    steps.setdefault(signal.timestamp, [None, []])[1].append(signal)
+
+        for timestamp in sorted(steps):
+            mark, signals = steps[timestamp]
+            # Mark before sizing and risk checks; a drawdown breach puts
+            # liquidation orders on the queue, netted with the signals' orders
+            if mark is not None:
+                portfolio.on_prices(mark.timestamp, mark.prices)
+                marks += 1
+            signals_received += len(signals)
+            for signal in signals:
+                portfolio.on_signal(signal)
+            execute()
+
+    # Orders still open after this stay with the broker
+    deadline = time.monotonic() + FILL_SETTLE_TIMEOUT
+    while _has_open_orders(execution_handler) and time.monotonic() < deadline:
+        time.sleep(FILL_POLL_INTERVAL)
+        execute()
+
+    result_conn.send(
+        {
+            "cash": portfolio.cash,
+            "holdings": {t: q for t, q in portfolio.current_holdings.items() if q},
+            "signals_received": signals_received,
+            "orders_sent": orders_sent,
+            "fills": fills,
+            "marks": marks,
+            "open_orders": len(getattr(execution_handler, "open_orders", {})),
+            "stats": portfolio.stats.snapshot(),
+        }
+    )
+    result_conn.close()
+    close = getattr(execution_handler, "close", None)
+    if close is not None:
+        close()
+    price_cache.close()
+
+
+class ShardedLiveEngine:
+    """
+    A multi-process deployment of the live engine, for ticker universes too
+    large for one process to keep up with.
+
+    This process is the router: it runs the data stream, writes every bar to
+    a shared-memory PriceCache and sends it over a pipe to the worker that
+    owns the ticker (see shard_for()). Each of the 'n_shards' workers runs
+    its own strategy instance for its tickers, so strategy work scales with
+    the number of cores. Their signals go to one aggregator process that
+    owns the Portfolio (and its risk checks), nets orders per ticker and
+    sends them to the execution handler. Once a timestamp's bars are all
+    in, the router sends the aggregator their closes to mark the portfolio
+    to, so its equity curve and drawdown check run as in one process.
+
+    Shard strategies do not see fills. The factories are called inside the
+    child processes, so they must be picklable (module-level functions).
+    """
+
+    def __init__(
+        self,
+        event_manager: AsyncEventManager,
+        data_handler,
+        price_cache: PriceCache,
+        strategy_factory: Callable,
+        portfolio_factory: Callable,
+        execution_factory: Callable,
+        n_shards: int = 2,
+        mp_context=None,
+    ):
+        """
+        Args:
+            event_manager (AsyncEventManager): The queue the data handler
+                puts bars on.
+            data_handler: Provides market data through run_async() and must
+                write its bars to 'price_cache' (e.g. LiveDataHandler).
+            price_cache (PriceCache): A cache created with shared=True.
+            strategy_factory: strategy_factory(tickers, event_manager) builds a
+                shard's strategy.
+            portfolio_factory: portfolio_factory(event_manager, price_cache)
+                builds the aggregator's Portfolio.
+            execution_factory: execution_factory(event_manager, price_cache)
+                builds the aggregator's execution handler, whose on_order
+                is called synchronously. Its fills must be put on the given
+                event manager, either from on_order or from poll_fills().
+            n_shards (int): The number of worker processes.
+            mp_context (optional): The multiprocessing context to start
+                processes with. Defaults to the platform default.
+        """
+        if price_cache.name is None:
+            raise ValueError("The price cache must be created with shared=True")
+        self.event_manager = event_manager
+        self.data_handler = data_handler
+        self.price_cache = price_cache
+        self.strategy_factory = strategy_factory
+        self.portfolio_factory = portfolio_factory
+        self.execution_factory = execution_factory
+        self.n_shards = n_shards
+        self.mp_context = mp_context or mp.get_context()
+
+        self.shard_tickers = [[] for _ in range(n_shards)]
+        for ticker in price_cache.tickers:
+            self.shard_tickers[shard_for(ticker, n_shards)].append(ticker)
+        self.bars_routed = [0] * n_shards
+
+    async def run(self) -> dict:
+        """
+        Runs until the data stream finishes, then shuts the workers and the
+        aggregator down in order.
+
+        Returns:
+            dict: The aggregator's final cash, holdings, counters and
+                portfolio statistics.
+        """
+        ctx = self.mp_context
+        signal_queue = ctx.Queue()
+        result_recv, result_send = ctx.Pipe(duplex=False)
+        aggregator = ctx.Process(
+            target=_run_aggregator,
+            args=(
+                signal_queue,
+                result_send,
+                self.n_shards,
+                self.price_cache.name,
+                self.price_cache.tickers,
+                self.portfolio_factory,
+                self.execution_factory,
+            ),
+            name="aggregator",
+        )
+        aggregator.start()
+
+        shard_conns = []
+        workers = []
+        for shard, tickers in enumerate(self.shard_tickers):
+            recv_conn, send_conn = ctx.Pipe(duplex=False)
+            worker = ctx.Process(
+                target=_run_shard,
+                args=(recv_conn, tickers, self.strategy_factory, signal_queue),
+                name=f"shard-{shard}",
+            )
+            worker.start()
+            recv_conn.close()
+            shard_conns.append(send_conn)
+            workers.append(worker)
+
+        loop = asyncio.get_running_loop()
+        self.event_manager.bind(loop)
+        print(f"--- Starting Sharded Live Engine with {self.n_shards} shards ---")
+        feed_task = asyncio.create_task(self.data_handler.run_async())
+        feed_task.add_done_callback(lambda _: self.event_manager.put(None))
+
+        feed_done = False
+        last_timestamp = None
+        # The closes of the timestamp being routed, sent with its mark
+        prices = {}
+        try:
+            while not (feed_done and self.event_manager.empty()):
+                event = await self.event_manager.get()
+                if event is None:
+                    feed_done = True
+                    continue
+                if event.event_type != "MARKET":
+                    continue
+                # The first bar of a new timestamp completes the previous one
+                if last_timestamp is not None and event.timestamp != last_timestamp:
+                    signal_queue.put(_PriceMark(last_timestamp, prices))
+                    prices = {}
+                last_timestamp = event.timestamp
+                prices[event.ticker] = event.close
+                shard = shard_for(event.ticker, self.n_shards)
+                shard_conns[shard].send(event)
+                self.bars_routed[shard] += 1
+        finally:
+            if not feed_task.done():
+                feed_task.cancel()
+            if last_timestamp is not None:
+                signal_queue.put(_PriceMark(last_timestamp, prices))
+            # A process's puts arrive in order, so the final mark comes first
+            signal_queue.put(None)
+            for conn in shard_conns:
+                try:
+                    conn.send(None)
+                except OSError:
+                    pass  # The worker has already exited
+                conn.close()
+            # Joining blocks, so it runs off the event loop
+            for worker in workers:
+                await asyncio.to_thread(worker.join)
+            try:
+                result = await asyncio.to_thread(
+                    _receive_result, result_recv, aggregator
+                )
+            finally:
+                await asyncio.to_thread(aggregator.join)
+                result_recv.close()
+
+        print(
+            f"\n--- Sharded Live Engine stopped. Bars per shard: {self.bars_routed} ---"
+        )
+        if not feed_task.cancelled():
+            feed_task.result()
+        return result
+
+    async def stop(self):
+        """Asks the data stream to close; run() returns once workers finish."""
+        await self.data_handler.stop_async()
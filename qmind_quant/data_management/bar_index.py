@@ -0,0 +1,86 @@
+# qmind_quant/data_management/bar_index.py
+
+import numpy as np
+import pandas as pd
+
+
+class BarIndex:
+    """
+    A sorted trading-calendar and (ticker, date) index over a bar store.
+
+    The bars are sorted by (date, ticker) once, the order the backtester
+    replays them in, so every date window is one contiguous block of rows
+    found by binary search. Each ticker also keeps its row positions in
+    date order, so a ticker's window is two more binary searches. Slicing
+    costs O(log n) plus the rows returned, instead of a boolean mask over
+    the whole frame.
+    """
+
+    def __init__(self, bars: pd.DataFrame):
+        """
+        Args:
+            bars (pd.DataFrame): OHLCV (or feature) rows with 'date' and
+                'ticker' columns, in any order.
+        """
+        frame = bars.copy()
+        frame["date"] = pd.to_datetime(frame["date"])
+        frame.sort_values(by=["date", "ticker"], kind="stable", inplace=True)
+        frame.reset_index(drop=True, inplace=True)
+        self.frame = frame
+
+        self._dates = frame["date"].values
+        self.calendar = pd.DatetimeIndex(np.unique(self._dates))
+
+        codes, tickers = pd.factorize(frame["ticker"], sort=True)
+        # A stable sort by ticker keeps each ticker's rows in date order
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(tickers) + 1))
+        self.tickers = list(tickers)
+        self._ticker_rows = {}
+        for i, ticker in enumerate(self.tickers):
+            positions = order[bounds[i] : bounds[i + 1]]
+            self._ticker_rows[ticker] = (positions, self._dates[positions])
+
+    @classmethod
+    def from_parquet(cls, path) -> "BarIndex":
+        return cls(pd.read_parquet(path))
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @staticmethod
+    def _bounds(dates: np.ndarray, start, end) -> tuple[int, int]:
+        """The [lo, hi) positions of the dates within [start, end]."""
+        lo = 0 if start is None else dates.searchsorted(_key(start), side="left")
+        hi = len(dates) if end is None else dates.searchsorted(_key(end), side="right")
+        return int(lo), int(hi)
+
+    def rows(self, start=None, end=None) -> slice:
+        """The rows of all tickers dated within [start, end], as a slice."""
+        return slice(*self._bounds(self._dates, start, end))
+
+    def ticker_rows(self, ticker: str, start=None, end=None) -> np.ndarray:
+        """A ticker's row positions dated within [start, end], in date order."""
+        if ticker not in self._ticker_rows:
+            return np.empty(0, dtype=np.intp)
+        positions, dates = self._ticker_rows[ticker]
+        lo, hi = self._bounds(dates, start, end)
+        return positions[lo:hi]
+
+    def slice(self, start=None, end=None, tickers=None) -> pd.DataFrame:
+        """
+        The bars dated within [start, end] (both inclusive, either open),
+        for 'tickers' or all of them, in (date, ticker) order.
+
+        Without a ticker filter the result is a positional slice of the
+        sorted frame; otherwise only the selected tickers' rows are taken.
+        """
+        if tickers is None or set(self.tickers) <= set(tickers):
+            return self.frame.iloc[self.rows(start, end)]
+        positions = [np.empty(0, dtype=np.intp)]
+        positions += [self.ticker_rows(ticker, start, end) for ticker in tickers]
+        return self.frame.take(np.sort(np.concatenate(positions)))
+
+
+def _key(date) -> np.datetime64:
+    return pd.Timestamp(date).to_datetime64()
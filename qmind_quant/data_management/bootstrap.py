@@ -0,0 +1,109 @@
+# qmind_quant/data_management/bootstrap.py
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from qmind_quant.config.paths import PROCESSED_DATA_DIR, BAR_SNAPSHOT_FILE
+from qmind_quant.strategies.base_strategy import BaseStrategy, BAR_COLUMNS
+
+BAR_STORE_FILE = PROCESSED_DATA_DIR / "us_equities_daily.parquet"
+
+
+def load_recent_bars(
+    tickers: list[str],
+    n_bars: int,
+    store_path: str | Path | None = BAR_STORE_FILE,
+    snapshot_path: str | Path | None = BAR_SNAPSHOT_FILE,
+) -> pd.DataFrame:
+    """
+    Loads the last 'n_bars' bars for each ticker, oldest first.
+
+    Bars come from the Parquet bar store and from the snapshot the live
+    engine writes at shutdown, whichever exist. Only the bar columns of the
+    requested tickers are read, and a bar found in both sources is kept once
+    (the snapshot's copy wins). Both sources must hold bars of the same
+    size, e.g. the daily store for daily strategies.
+
+    The snapshot holds the stream's tz-aware UTC timestamps while the store
+    is tz-naive, so naive dates are taken as UTC and all dates are returned
+    in UTC.
+
+    Args:
+        tickers (list[str]): The tickers to load.
+        n_bars (int): How many bars to keep per ticker.
+        store_path: The Parquet bar store, or None to skip it.
+        snapshot_path: The shutdown snapshot, or None to skip it.
+
+    Returns:
+        pd.DataFrame: Bars with columns BAR_COLUMNS, sorted by ticker and date.
+    """
+    frames = []
+    for path in (store_path, snapshot_path):
+        if path is None or not os.path.exists(path):
+            continue
+        frame = pd.read_parquet(
+            path, columns=BAR_COLUMNS, filters=[("ticker", "in", list(tickers))]
+        )
+        # Per source, so naive and aware dates are never mixed in one column
+        frame["date"] = pd.to_datetime(frame["date"], utc=True)
+        frames.append(frame)
+
+    if not frames:
+        print("--- Bootstrap: no historical bars found ---")
+        return pd.DataFrame(columns=BAR_COLUMNS)
+
+    bars = pd.concat(frames, ignore_index=True)
+    bars = (
+        bars.drop_duplicates(subset=["ticker", "date"], keep="last")
+        .sort_values(["ticker", "date"], kind="stable")
+        .groupby("ticker", sort=False)
+        .tail(n_bars)
+        .reset_index(drop=True)
+    )
+    return bars
+
+
+def warm_start_strategies(
+    strategies: list[BaseStrategy],
+    store_path: str | Path | None = BAR_STORE_FILE,
+    snapshot_path: str | Path | None = BAR_SNAPSHOT_FILE,
+) -> pd.DataFrame:
+    """
+    Loads enough recent bars for every strategy in one read and hands each
+    strategy its share, so they can trade on the first live bar.
+
+    Returns:
+        pd.DataFrame: The bars that were loaded.
+    """
+    tickers = sorted({ticker for strategy in strategies for ticker in strategy.tickers})
+    n_bars = max(strategy.warmup_bars for strategy in strategies)
+    bars = load_recent_bars(tickers, n_bars, store_path, snapshot_path)
+
+    for strategy in strategies:
+        strategy.warm_start(bars[bars["ticker"].isin(strategy.tickers)])
+    print(
+        f"--- Bootstrap: warmed up {len(strategies)} strategies with "
+        f"{len(bars)} bars for {bars['ticker'].nunique()} tickers ---"
+    )
+    return bars
+
+
+def save_bar_snapshot(
+    strategies: list[BaseStrategy], snapshot_path: str | Path = BAR_SNAPSHOT_FILE
+):
+    """
+    Writes the bars the strategies are holding to a Parquet snapshot, so the
+    next start can warm up from them without waiting for the stream.
+    """
+    frames = [strategy.recent_bars() for strategy in strategies]
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return
+    bars = pd.concat(frames, ignore_index=True).drop_duplicates(
+        subset=["ticker", "date"], keep="last"
+    )
+    os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+    bars.to_parquet(snapshot_path, index=False)
+    print(f"--- Saved {len(bars)} bars to {snapshot_path} ---")
@@ -2,6 +2,7 @@
 
 import pandas as pd
 from qmind_quant.core.event_types import MarketEvent
+from qmind_quant.data_management.bar_index import BarIndex
 
 
 class HistoricalDataHandler:
@@ -11,7 +12,13 @@ class HistoricalDataHandler:
     """
 
     def __init__(
-        self, tickers: list[str], file_path: str = None, data_df: pd.DataFrame = None
+        self,
+        tickers: list[str],
+        file_path: str = None,
+        data_df: pd.DataFrame = None,
+        bar_index: BarIndex = None,
+        start=None,
+        end=None,
     ):
         """
         Initializes the data handler.
@@ -20,12 +27,22 @@ class HistoricalDataHandler:
             tickers (list[str]): A list of tickers to include in the backtest.
             file_path (str, optional): The path to the Parquet file.
             data_df (pd.DataFrame, optional): An in-memory DataFrame with OHLCV data.
+            bar_index (BarIndex, optional): An indexed, already sorted bar store.
+                Many backtests can share one, each slicing out its window
+                without scanning or copying the whole store.
+            start, end (optional): The first and last dates to replay from
+                'bar_index'.
         """
-        if file_path is None and data_df is None:
-            raise ValueError("Either 'file_path' or 'data_df' must be provided.")
+        if file_path is None and data_df is None and bar_index is None:
+            raise ValueError(
+                "Either 'file_path', 'data_df' or 'bar_index' must be provided."
+            )
 
         self.tickers = tickers
-        self._all_data = self._load_data(file_path, data_df)
+        if bar_index is not None:
+            self._all_data = bar_index.slice(start, end, tickers)
+        else:
+            self._all_data = self._load_data(file_path, data_df)
         self._bar_generator = self._create_bar_generator()
         self.continue_backtest = True
         self.latest_bars = {ticker: None for ticker in self.tickers}
@@ -55,6 +72,11 @@ class HistoricalDataHandler:
             return self.latest_bars[ticker].close
         return None
 
+    def get_latest_volume(self, ticker: str) -> float | None:
+        if self.latest_bars.get(ticker):
+            return self.latest_bars[ticker].volume
+        return None
+
     def stream_next_bar(self) -> MarketEvent | None:
         try:
             bar = next(self._bar_generator)
@@ -15,6 +15,15 @@ from qmind_quant.analytics.technical_indicators import (
     calculate_vwap,
 )
 
+# The target looks this many bars ahead; walk-forward training purges
+# labels whose horizon reaches into the test window
+TARGET_HORIZON = 5
+
+# Trading days dropped from the end of each training window on top of the
+# purged label horizon, for features that are serially correlated with
+# the first test bars
+EMBARGO_DAYS = 5
+
 
 class FeatureEngineer:
     """
@@ -84,7 +93,11 @@ class FeatureEngineer:
             # --- Target Variable Creation ---
             # This is what we are trying to predict: will the price be higher
             # in 5 days? (1 for 'Up', 0 for 'Down' or 'Same').
-            future_returns = group["close"].shift(-5).pct_change(5, fill_method=None)
+            future_returns = (
+                group["close"]
+                .shift(-TARGET_HORIZON)
+                .pct_change(TARGET_HORIZON, fill_method=None)
+            )
             group["target"] = (future_returns > 0).astype(int)
 
             all_features.append(group)
@@ -1,16 +1,31 @@
 # qmind_quant/data_management/live_data_handler.py
 
 import os
-import redis
+import asyncio
+import inspect
+import time
 from alpaca.data.live import StockDataStream
 
-from qmind_quant.core.event_manager import EventManager
+from qmind_quant.core.event_manager import EventManager, AsyncEventManager
 from qmind_quant.core.event_types import MarketEvent
+from qmind_quant.data_management.price_cache import PriceCache
+from qmind_quant.data_management.redis_publisher import (
+    RedisPricePublisher,
+    LIVE_PRICES_KEY,
+)
 
-# --- This is a professional improvement for maintainability ---
-# We define our Redis keys as constants in one place. This prevents typos
-# and makes it easy to change them later if we need to.
-LIVE_PRICES_KEY = "qmind:live_prices"
+
+def _check_stream(stream):
+    """
+    Fails loudly when the handler is built if the stream lacks the
+    _run_forever() coroutine run_async() awaits. It is private to alpaca-py,
+    which is pinned in pyproject.toml to the versions known to have it.
+    """
+    if not inspect.iscoroutinefunction(getattr(stream, "_run_forever", None)):
+        raise RuntimeError(
+            f"{type(stream).__name__} has no _run_forever() coroutine; this "
+            "alpaca-py version is not supported by LiveDataHandler.run_async()"
+        )
 
 
 class LiveDataHandler:
@@ -21,34 +36,44 @@ class LiveDataHandler:
     2. Publishes the latest price to a Redis cache for the dashboard to read.
     """
 
-    def __init__(self, event_manager: EventManager, tickers: list[str]):
+    def __init__(
+        self,
+        event_manager: EventManager | AsyncEventManager,
+        tickers: list[str],
+        stream=None,
+        publisher: RedisPricePublisher | None = None,
+        price_cache: PriceCache | None = None,
+    ):
         """
         Initializes the LiveDataHandler.
 
         Args:
-            event_manager (EventManager): The central event queue for the system.
+            event_manager (EventManager | AsyncEventManager): The central event
+                queue for the system.
             tickers (list[str]): The list of stock symbols to subscribe to.
+            stream (optional): A data stream with the same interface as
+                Alpaca's StockDataStream. Defaults to a live Alpaca stream.
+            publisher (RedisPricePublisher, optional): Publishes prices for the
+                dashboard. Defaults to a batched publisher on REDIS_HOST.
+            price_cache (PriceCache, optional): Receives every bar, so the
+                portfolio and execution handlers can look up live prices.
         """
-        api_key = os.getenv("APCA_API_KEY_ID")
-        secret_key = os.getenv("APCA_API_SECRET_KEY")
-
         self.event_manager = event_manager
         self.tickers = tickers
 
         # Initialize the connection to Alpaca's data stream.
-        self.stream = StockDataStream(api_key, secret_key)
-
-        # --- This is a professional improvement for flexibility ---
-        # Instead of hardcoding "localhost", we get the Redis host from an
-        # environment variable. This allows the code to work both locally and
-        # in a different environment (like Docker or the cloud) without changes.
-        # If the variable isn't set, it defaults to 'localhost'.
-        redis_host = os.getenv("REDIS_HOST", "localhost")
-        self.redis_client = redis.StrictRedis(
-            host=redis_host, port=6379, db=0, decode_responses=True
-        )
-        # Clear any old prices from a previous run to ensure a clean start.
-        self.redis_client.delete(LIVE_PRICES_KEY)
+        if stream is None:
+            api_key = os.getenv("APCA_API_KEY_ID")
+            secret_key = os.getenv("APCA_API_SECRET_KEY")
+            stream = StockDataStream(api_key, secret_key)
+        _check_stream(stream)
+        self.stream = stream
+
+        # Prices go to Redis through an async, batched publisher so that a
+        # Redis round-trip never stalls the WebSocket callback. It reads the
+        # Redis host from the REDIS_HOST environment variable.
+        self.publisher = publisher or RedisPricePublisher(key=LIVE_PRICES_KEY)
+        self.price_cache = price_cache
 
     async def _bar_handler(self, data):
         """
@@ -57,10 +82,14 @@ class LiveDataHandler:
         The 'async' keyword means this function is designed to run asynchronously,
         handling network events efficiently without blocking the rest of the program.
         """
-        # Publish the latest close price to a Redis hash for the dashboard to read.
-        self.redis_client.hset(LIVE_PRICES_KEY, data.symbol, data.close)
+        # Queue the latest close price for the dashboard. This only updates an
+        # in-memory batch; the publisher flushes it to Redis in the background.
+        self.publisher.publish(data.symbol, data.close)
+        if self.price_cache is not None:
+            self.price_cache.update(data.symbol, data.close, data.volume)
 
-        # Create a MarketEvent for the trading engine.
+        # Create a MarketEvent for the trading engine, stamped with its arrival
+        # time so the engine can measure tick-to-order latency.
         event = MarketEvent(
             timestamp=data.timestamp,
             ticker=data.symbol,
@@ -69,6 +98,7 @@ class LiveDataHandler:
             low=data.low,
             close=data.close,
             volume=data.volume,
+            ingress_ns=time.perf_counter_ns(),
         )
         # Put the event onto the central queue for the other modules to process.
         self.event_manager.put(event)
@@ -82,8 +112,24 @@ class LiveDataHandler:
         Starts the data stream. This is a blocking call that will run forever,
         listening for new market data until the program is stopped.
         """
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        """
+        Runs the data stream on the caller's event loop, so the live engine can
+        drive the stream, strategy, portfolio and execution on a single loop.
+        StockDataStream.run() is just asyncio.run() around this same coroutine.
+        """
         print("--- Starting Live Data Stream ---")
-        # Subscribe to the one-minute bar data for our list of tickers.
-        self.stream.subscribe_bars(self._bar_handler, *self.tickers)
-        # Start the main event loop for the data stream.
-        self.stream.run()
+        # Clears any old prices from a previous run and starts flushing new ones.
+        await self.publisher.start()
+        try:
+            # Subscribe to the one-minute bar data for our list of tickers.
+            self.stream.subscribe_bars(self._bar_handler, *self.tickers)
+            await self.stream._run_forever()
+        finally:
+            await self.publisher.stop()
+
+    async def stop_async(self):
+        """Signals the data stream to close its connection and return."""
+        await self.stream.stop_ws()
@@ -0,0 +1,114 @@
+# qmind_quant/data_management/price_cache.py
+
+import sys
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Column layout of the cache: one row per ticker
+_CLOSE, _VOLUME, _UPDATED_AT = range(3)
+_N_FIELDS = 3
+
+
+class PriceCache:
+    """
+    A low-latency cache of the latest bar for each ticker in live trading.
+
+    LiveDataHandler writes every incoming bar into the cache, and the
+    Portfolio and execution handlers read from it. It exposes the same
+    get_latest_close_price() / get_latest_volume() interface as
+    HistoricalDataHandler, so it can stand in for the data handler anywhere
+    a price lookup is needed.
+
+    Prices live in a (n_tickers x 3) float64 array holding close, volume and
+    the time of the update, and a lookup is a dict hit plus an array read.
+    With shared=True the array is backed by shared memory, so other
+    processes can attach to it by name and read prices without any IPC.
+    The cache assumes a single writer.
+    """
+
+    def __init__(
+        self,
+        tickers: list[str],
+        shared: bool = False,
+        name: str | None = None,
+        _attach: bool = False,
+    ):
+        """
+        Args:
+            tickers (list[str]): The tickers to cache. Every process sharing
+                the cache must use the same list, in the same order.
+            shared (bool): Back the cache with shared memory.
+            name (str, optional): The shared memory block's name. Generated
+                if not given; read it back from 'self.name' to attach.
+        """
+        self.tickers = list(tickers)
+        self._index = {ticker: i for i, ticker in enumerate(self.tickers)}
+        shape = (len(self.tickers), _N_FIELDS)
+        nbytes = max(int(np.prod(shape)) * 8, 1)
+
+        self._shm = None
+        if _attach:
+            if sys.version_info >= (3, 13):
+                self._shm = shared_memory.SharedMemory(name=name, track=False)
+            else:
+                # Older Pythons always register the block with the resource
+                # tracker. Processes started by multiprocessing share the
+                # creator's tracker, so attach from those rather than from an
+                # unrelated process, whose tracker would unlink it on exit.
+                self._shm = shared_memory.SharedMemory(name=name)
+        elif shared:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=nbytes)
+
+        if self._shm is not None:
+            self._data = np.ndarray(shape, dtype=np.float64, buffer=self._shm.buf)
+            if not _attach:
+                self._data[:] = np.nan
+        else:
+            self._data = np.full(shape, np.nan)
+
+    @classmethod
+    def attach(cls, name: str, tickers: list[str]) -> "PriceCache":
+        """Attaches to a shared cache created by another process."""
+        return cls(tickers, name=name, _attach=True)
+
+    @property
+    def name(self) -> str | None:
+        """The shared memory block's name, or None for an in-process cache."""
+        return self._shm.name if self._shm is not None else None
+
+    def update(self, ticker: str, close: float, volume: float = np.nan):
+        """Records the latest bar for a ticker. Unknown tickers are ignored."""
+        row = self._index.get(ticker)
+        if row is None:
+            return
+        self._data[row] = (close, volume, time.time())
+
+    def _get(self, ticker: str, field: int) -> float | None:
+        row = self._index.get(ticker)
+        if row is None:
+            return None
+        value = self._data[row, field]
+        return None if np.isnan(value) else float(value)
+
+    def get_latest_close_price(self, ticker: str) -> float | None:
+        return self._get(ticker, _CLOSE)
+
+    def get_latest_volume(self, ticker: str) -> float | None:
+        return self._get(ticker, _VOLUME)
+
+    def get_last_update_time(self, ticker: str) -> float | None:
+        """The wall-clock time (seconds since the epoch) of the last update."""
+        return self._get(ticker, _UPDATED_AT)
+
+    def close(self):
+        """Detaches from shared memory. The creator should also call unlink()."""
+        if self._shm is not None:
+            self._data = None
+            self._shm.close()
+
+    def unlink(self):
+        """Frees the shared memory block once every process has closed it."""
+        if self._shm is not None:
+            self._shm.unlink()
@@ -0,0 +1,122 @@
+# qmind_quant/data_management/redis_publisher.py
+
+import os
+import asyncio
+import time
+import redis.asyncio as aioredis
+
+# The Redis hash the dashboard reads the latest price of every symbol from.
+LIVE_PRICES_KEY = "qmind:live_prices"
+
+
+class RedisPricePublisher:
+    """
+    Publishes live prices to Redis without blocking the event loop.
+
+    publish() only records the price in memory, so the WebSocket callback
+    never waits on Redis. Updates for the same symbol are coalesced (only the
+    latest price matters to the dashboard), and a background task flushes
+    the pending prices through a pipeline every 'flush_interval' seconds, or
+    sooner once 'max_batch_size' symbols are waiting.
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        key: str = LIVE_PRICES_KEY,
+        flush_interval: float = 0.05,
+        max_batch_size: int = 1000,
+    ):
+        """
+        Args:
+            redis_client (optional): An asyncio Redis client. Defaults to a
+                connection to REDIS_HOST (or 'localhost').
+            key (str): The Redis hash the prices are written to.
+            flush_interval (float): The longest a price waits before a flush.
+            max_batch_size (int): Flush early once this many symbols are pending.
+                Also the maximum number of fields per HSET in a flush.
+        """
+        if redis_client is None:
+            redis_host = os.getenv("REDIS_HOST", "localhost")
+            redis_client = aioredis.Redis(
+                host=redis_host, port=6379, db=0, decode_responses=True
+            )
+        self.redis_client = redis_client
+        self.key = key
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+
+        self._pending = {}
+        self._flush_requested = asyncio.Event()
+        self._stopping = False
+        self._task = None
+
+        # Counters for monitoring
+        self.updates_received = 0
+        self.updates_coalesced = 0
+        self.prices_written = 0
+        self.flushes = 0
+        self.max_flush_seconds = 0.0
+
+    def publish(self, symbol: str, price: float):
+        """Records the latest price for a symbol. Never blocks."""
+        self.updates_received += 1
+        if symbol in self._pending:
+            self.updates_coalesced += 1
+        self._pending[symbol] = price
+        if len(self._pending) >= self.max_batch_size:
+            self._flush_requested.set()
+
+    async def start(self):
+        """Clears prices from a previous run and starts the background flusher."""
+        await self.redis_client.delete(self.key)
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stops the background flusher and writes out any pending prices."""
+        if self._task is not None:
+            # Let an in-flight flush finish rather than cancelling it midway,
+            # which would leave the client's connection in an unknown state.
+            self._stopping = True
+            self._flush_requested.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(), timeout=self.flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+    async def flush(self):
+        """Writes all pending prices to Redis in a single pipeline round-trip."""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+
+        start = time.perf_counter()
+        items = list(batch.items())
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for i in range(0, len(items), self.max_batch_size):
+                pipe.hset(self.key, mapping=dict(items[i : i + self.max_batch_size]))
+            await pipe.execute()
+        except Exception as e:
+            print(f"!!! ERROR: Failed to publish prices to Redis: {e} !!!")
+            # Keep the prices for the next flush, unless a newer one arrived
+            for symbol, price in items:
+                self._pending.setdefault(symbol, price)
+            return
+
+        self.flushes += 1
+        self.prices_written += len(items)
+        self.max_flush_seconds = max(
+            self.max_flush_seconds, time.perf_counter() - start
+        )
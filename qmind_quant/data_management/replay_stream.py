@@ -0,0 +1,155 @@
+# qmind_quant/data_management/replay_stream.py
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from qmind_quant.strategies.base_strategy import BAR_COLUMNS
+
+
+@dataclass(slots=True)
+class ReplayBar:
+    """A bar with the attributes LiveDataHandler reads from an Alpaca Bar."""
+
+    symbol: str
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+class ReplayDataStream:
+    """
+    Replays historical bars through the same interface as Alpaca's
+    StockDataStream (subscribe_bars / run / _run_forever / stop_ws), so
+    LiveDataHandler and the live engines can be run and load-tested offline.
+
+    Bars are sent in timestamp order. With a 'speed' multiplier the gaps
+    between timestamps are replayed 'speed' times faster than they
+    happened (e.g. speed=60 plays a minute of bars per second); with
+    speed=None they are sent as fast as the handler takes them. Pacing is
+    against a fixed start time, so slow handlers do not accumulate drift.
+    """
+
+    def __init__(self, bars: pd.DataFrame, speed: float | None = None):
+        """
+        Args:
+            bars (pd.DataFrame): Bars with columns BAR_COLUMNS.
+            speed (float, optional): The replay speed multiplier, or None for
+                as fast as possible.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive, or None for no pacing")
+        self.bars = (
+            bars[BAR_COLUMNS]
+            .assign(date=pd.to_datetime(bars["date"]))
+            .sort_values(["date", "ticker"], kind="stable")
+        )
+        self.speed = speed
+        self.handler = None
+        self.symbols = None
+        self._stopping = False
+
+        # Counters for monitoring
+        self.bars_sent = 0
+        self.elapsed_seconds = 0.0
+
+    @classmethod
+    def from_parquet(
+        cls,
+        path: str | Path,
+        tickers: list[str] | None = None,
+        start: str | None = None,
+        end: str | None = None,
+        speed: float | None = None,
+    ) -> "ReplayDataStream":
+        """Replays the bars of a Parquet bar store, optionally filtered."""
+        filters = []
+        if tickers is not None:
+            filters.append(("ticker", "in", list(tickers)))
+        bars = pd.read_parquet(path, columns=BAR_COLUMNS, filters=filters or None)
+        if start is not None:
+            bars = bars[bars["date"] >= pd.Timestamp(start)]
+        if end is not None:
+            bars = bars[bars["date"] <= pd.Timestamp(end)]
+        return cls(bars, speed=speed)
+
+    def subscribe_bars(self, handler, *symbols):
+        """Registers the bar callback. '*' or no symbols subscribes to all."""
+        self.handler = handler
+        self.symbols = None if not symbols or "*" in symbols else set(symbols)
+
+    def run(self):
+        """Replays every bar. Blocks until the replay finishes."""
+        asyncio.run(self._run_forever())
+
+    async def _run_forever(self):
+        if self.handler is None:
+            raise RuntimeError("subscribe_bars() must be called before run()")
+        bars = self.bars
+        if self.symbols is not None:
+            bars = bars[bars["ticker"].isin(self.symbols)]
+
+        self._stopping = False
+        dates = bars["date"].to_numpy()
+        # The offset of every bar from the first one, in seconds
+        offsets = (
+            (dates - dates[0]) / np.timedelta64(1, "s") if len(dates) else np.empty(0)
+        )
+        columns = [bars[column].to_numpy() for column in BAR_COLUMNS]
+        timestamps = bars["date"].tolist()
+
+        start = time.perf_counter()
+        last_offset = None
+        for i, (_, ticker, open_, high, low, close, volume) in enumerate(zip(*columns)):
+            if self._stopping:
+                break
+            offset = offsets[i]
+            if offset != last_offset:
+                # A new timestamp: wait until it is due, or just yield
+                last_offset = offset
+                delay = 0.0
+                if self.speed is not None:
+                    delay = start + offset / self.speed - time.perf_counter()
+                await asyncio.sleep(max(delay, 0.0))
+            await self.handler(
+                ReplayBar(ticker, timestamps[i], open_, high, low, close, volume)
+            )
+            self.bars_sent += 1
+        self.elapsed_seconds = time.perf_counter() - start
+
+    async def stop_ws(self):
+        """Ends the replay after the bar being sent."""
+        self._stopping = True
+
+
+def synthetic_bars(
+    n_symbols: int, n_bars: int, freq: str = "1min", seed: int = 0
+) -> pd.DataFrame:
+    """
+    Random-walk bars for 'n_symbols' symbols, for load tests with symbol sets
+    larger than the bar store holds.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2025-01-02 09:30", periods=n_bars, freq=freq)
+    returns = rng.normal(0.0, 1e-3, size=(n_bars, n_symbols))
+    close = 100.0 * np.exp(np.cumsum(returns, axis=0))
+    spread = np.abs(rng.normal(0.0, 5e-4, size=close.shape)) * close
+    return pd.DataFrame(
+        {
+            "date": np.repeat(dates, n_symbols),
+            "ticker": np.tile([f"SYM{i:05d}" for i in range(n_symbols)], n_bars),
+            "open": close.ravel(),
+            "high": (close + spread).ravel(),
+            "low": (close - spread).ravel(),
+            "close": close.ravel(),
+            "volume": rng.integers(100, 10_000, size=close.size),
+        }
+    )
@@ -0,0 +1,124 @@
+# qmind_quant/execution/cost_models.py
+
+import numpy as np
+
+
+class CostModel:
+    """
+    Base class for transaction cost models.
+
+    Every method works on NumPy arrays of any (matching) shape, so a single
+    call prices one order, a batch of orders, or a whole (T x N) matrix of
+    trades from a vectorized backtest. Quantities are signed: positive for
+    buys and negative for sells.
+
+    Subclasses override one or both of:
+      - slippage(): the adverse per-share price move, as a positive number.
+      - commission(): the commission charged per order, in currency.
+    """
+
+    def slippage(self, prices, quantities, volumes) -> np.ndarray:
+        return np.zeros(np.broadcast(prices, quantities).shape)
+
+    def commission(self, prices, quantities) -> np.ndarray:
+        return np.zeros(np.broadcast(prices, quantities).shape)
+
+    def apply(self, prices, quantities, volumes=None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns (fill_prices, commissions). Buys fill above the reference
+        price and sells below it by the modelled slippage.
+        """
+        prices = np.asarray(prices, dtype=float)
+        quantities = np.asarray(quantities, dtype=float)
+        slippage = self.slippage(prices, quantities, volumes)
+        fill_prices = prices + np.sign(quantities) * slippage
+        return fill_prices, self.commission(prices, quantities)
+
+    def total_cost(self, prices, quantities, volumes=None) -> np.ndarray:
+        """The all-in cost of each trade in currency: slippage plus commission."""
+        prices = np.asarray(prices, dtype=float)
+        quantities = np.asarray(quantities, dtype=float)
+        slippage = self.slippage(prices, quantities, volumes)
+        return np.abs(quantities) * slippage + self.commission(prices, quantities)
+
+
+class FixedCommission(CostModel):
+    """A flat commission per non-empty order."""
+
+    def __init__(self, per_order: float = 1.0):
+        self.per_order = per_order
+
+    def commission(self, prices, quantities) -> np.ndarray:
+        return np.where(np.asarray(quantities) != 0, self.per_order, 0.0)
+
+
+class BpsCommission(CostModel):
+    """A commission proportional to traded notional, with an optional minimum."""
+
+    def __init__(self, bps: float, minimum: float = 0.0):
+        self.bps = bps
+        self.minimum = minimum
+
+    def commission(self, prices, quantities) -> np.ndarray:
+        quantities = np.asarray(quantities, dtype=float)
+        notional = np.abs(np.asarray(prices, dtype=float) * quantities)
+        fee = np.maximum(notional * self.bps / 1e4, self.minimum)
+        return np.where(quantities != 0, fee, 0.0)
+
+
+class SpreadCost(CostModel):
+    """Crossing half of a quoted bid-ask spread, given in basis points of price."""
+
+    def __init__(self, spread_bps: float):
+        self.spread_bps = spread_bps
+
+    def slippage(self, prices, quantities, volumes) -> np.ndarray:
+        prices = np.asarray(prices, dtype=float)
+        return np.broadcast_to(
+            prices * self.spread_bps / 2e4, np.broadcast(prices, quantities).shape
+        )
+
+
+class SquareRootImpact(CostModel):
+    """
+    The square-root market impact model:
+        impact = coefficient * volatility * sqrt(|quantity| / volume) * price
+
+    'volumes' is the bar volume (e.g. MarketEvent.volume). Trades with no
+    volume information are charged no impact.
+    """
+
+    def __init__(self, coefficient: float = 0.1, daily_volatility: float = 0.02):
+        self.coefficient = coefficient
+        self.daily_volatility = daily_volatility
+
+    def slippage(self, prices, quantities, volumes) -> np.ndarray:
+        prices = np.asarray(prices, dtype=float)
+        quantities = np.asarray(quantities, dtype=float)
+        shape = np.broadcast(prices, quantities).shape
+        if volumes is None:
+            return np.zeros(shape)
+
+        volumes = np.asarray(volumes, dtype=float)
+        participation = np.divide(
+            np.abs(quantities),
+            volumes,
+            out=np.zeros(np.broadcast(quantities, volumes).shape),
+            where=volumes > 0,
+        )
+        return (
+            self.coefficient * self.daily_volatility * np.sqrt(participation) * prices
+        )
+
+
+class CompositeCostModel(CostModel):
+    """Sums the slippage and commission of several cost models."""
+
+    def __init__(self, *models: CostModel):
+        self.models = models
+
+    def slippage(self, prices, quantities, volumes) -> np.ndarray:
+        return sum(m.slippage(prices, quantities, volumes) for m in self.models)
+
+    def commission(self, prices, quantities) -> np.ndarray:
+        return sum(m.commission(prices, quantities) for m in self.models)
@@ -1,34 +1,98 @@
 # qmind_quant/execution/execution.py
 
-from qmind_quant.core.event_types import OrderEvent, FillEvent
+import numpy as np
+
+from qmind_quant.core.event_types import OrderEvent, FillEvent, MarketEvent
 from qmind_quant.data_management.data_handler import HistoricalDataHandler
+from qmind_quant.execution.cost_models import CostModel, FixedCommission
+from qmind_quant.execution.order_book import MatchingEngine
 
 
 class SimulatedExecutionHandler:
-    def __init__(self, event_manager, data_handler: HistoricalDataHandler):
+    def __init__(
+        self,
+        event_manager,
+        data_handler: HistoricalDataHandler,
+        matching_engine: MatchingEngine | None = None,
+        cost_model: CostModel | None = None,
+    ):
         self.event_manager = event_manager
         self.data_handler = data_handler
+        # Limit and stop orders rest here until a later bar trades through them
+        self.matching_engine = matching_engine or MatchingEngine()
+        # Defaults to the historical flat $1 commission with no slippage
+        self.cost_model = cost_model or FixedCommission(1.0)
+
+    def on_market_event(self, event: MarketEvent):
+        """
+        Matches any resting limit/stop orders for the bar's ticker against its
+        OHLC range and emits a FillEvent for each execution. Costs for all of
+        the bar's executions are computed in a single cost-model call.
+        """
+        executions = self.matching_engine.on_bar(event)
+        if not executions:
+            return
+
+        orders = [execution.resting_order.order for execution in executions]
+        prices = np.array([execution.price for execution in executions])
+        quantities = np.array(
+            [
+                execution.quantity if order.direction == "BUY" else -execution.quantity
+                for execution, order in zip(executions, orders)
+            ]
+        )
+        fill_prices, commissions = self.cost_model.apply(
+            prices, quantities, event.volume
+        )
+        # A limit order guarantees its price, so it is only charged commission
+        is_limit = np.array([order.order_type == "LMT" for order in orders])
+        fill_prices = np.where(is_limit, prices, fill_prices)
+
+        for execution, order, fill_price, commission in zip(
+            executions, orders, fill_prices, commissions
+        ):
+            fill_event = FillEvent(
+                timestamp=event.timestamp,
+                ticker=order.ticker,
+                direction=order.direction,
+                quantity=execution.quantity,
+                fill_price=float(fill_price),
+                commission=float(commission),
+            )
+            self.event_manager.put(fill_event)
 
     def on_order(self, event: OrderEvent):
         """
-        Handles an OrderEvent, creating a FillEvent with a realistic price.
+        Handles an OrderEvent. Market orders fill immediately at the latest
+        close adjusted by the cost model; limit and stop orders are sent to
+        the matching engine.
         """
-        fill_price = self.data_handler.get_latest_close_price(event.ticker)
-        if fill_price is None:
+        if event.order_type != "MKT":
+            self.matching_engine.submit(event)
+            return
+
+        close_price = self.data_handler.get_latest_close_price(event.ticker)
+        if close_price is None:
             print(
                 f"  EXECUTION: Could not get price for {event.ticker}. Order cancelled."
             )
             return
 
-        # Simulate a simple fixed commission
-        commission = 1.0
+        signed_quantity = (
+            event.quantity if event.direction == "BUY" else -event.quantity
+        )
+        fill_prices, commissions = self.cost_model.apply(
+            close_price,
+            signed_quantity,
+            self.data_handler.get_latest_volume(event.ticker),
+        )
 
         fill_event = FillEvent(
             timestamp=event.timestamp,
             ticker=event.ticker,
             direction=event.direction,
             quantity=event.quantity,
-            fill_price=fill_price,
-            commission=commission,
+            fill_price=float(fill_prices),
+            commission=float(commissions),
         )
         self.event_manager.put(fill_event)
@@ -1,40 +1,312 @@
 # qmind_quant/execution/live_execution.py
 
 import os
+import asyncio
+import functools
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+import requests
 from alpaca.trading.client import TradingClient
 from alpaca.trading.requests import MarketOrderRequest
 from alpaca.trading.enums import OrderSide, TimeInForce
-from qmind_quant.core.event_types import OrderEvent
+from qmind_quant.core.event_types import OrderEvent, FillEvent
+from qmind_quant.data_management.price_cache import PriceCache
+
+# Order statuses after which an order can no longer fill, as Alpaca names them
+TERMINAL_STATUSES = {"filled", "canceled", "expired", "rejected"}
+
+# Network failures, raised before the request could get a response
+_NETWORK_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
 
 
 class LiveExecutionHandler:
     """
     Handles the execution of orders via the Alpaca API.
-    """
-
-    def __init__(self):
-        api_key = os.getenv("APCA_API_KEY_ID")
-        secret_key = os.getenv("APCA_API_SECRET_KEY")
 
-        # Connect to the paper trading endpoint
-        self.client = TradingClient(api_key, secret_key, paper=True)
+    Given an event manager, it also tracks each accepted order until it
+    reaches a final status: every increase in the order's filled quantity
+    is put on the queue as a FillEvent, checked on submission and on each
+    poll_fills() call.
+    """
 
-    def on_order(self, event: OrderEvent):
+    def __init__(
+        self, price_cache: PriceCache | None = None, client=None, event_manager=None
+    ):
         """
-        Takes an OrderEvent and executes it via the Alpaca API.
-        Note: This does not listen for fill confirmations, for simplicity.
+        Args:
+            price_cache (PriceCache, optional): Used to report each order's
+                expected notional before it is sent.
+            client (optional): A broker client with TradingClient's
+                submit_order/get_order_by_id (e.g. MockBroker). Defaults to
+                Alpaca's paper trading endpoint.
+            event_manager (optional): The queue FillEvents are put on.
+                Without one, fills are not tracked.
         """
-        print(f"--- LIVE EXECUTION: Received OrderEvent for {event.ticker} ---")
+        if client is None:
+            api_key = os.getenv("APCA_API_KEY_ID")
+            secret_key = os.getenv("APCA_API_SECRET_KEY")
 
-        order_request = MarketOrderRequest(
+            # Connect to the paper trading endpoint
+            client = TradingClient(api_key, secret_key, paper=True)
+        self.client = client
+        self.price_cache = price_cache
+        self.event_manager = event_manager
+        # order id -> (OrderEvent, quantity filled so far, notional filled so far)
+        self.open_orders = {}
+
+    def _report_notional(self, event: OrderEvent):
+        if self.price_cache is not None:
+            price = self.price_cache.get_latest_close_price(event.ticker)
+            if price is not None:
+                print(
+                    f"    {event.direction} {event.quantity} {event.ticker} "
+                    f"@ ~{price:.2f} (notional ~{price * event.quantity:,.2f})"
+                )
+
+    @staticmethod
+    def _order_request(
+        event: OrderEvent, client_order_id: str | None = None
+    ) -> MarketOrderRequest:
+        return MarketOrderRequest(
             symbol=event.ticker,
             qty=event.quantity,
             side=OrderSide.BUY if event.direction == "BUY" else OrderSide.SELL,
             time_in_force=TimeInForce.DAY,
+            client_order_id=client_order_id,
         )
 
+    def on_order(self, event: OrderEvent):
+        """
+        Takes an OrderEvent and executes it via the Alpaca API. Its fills are
+        tracked if the handler has an event manager.
+        """
+        print(f"--- LIVE EXECUTION: Received OrderEvent for {event.ticker} ---")
+        self._report_notional(event)
+
+        order_request = self._order_request(event)
+
         try:
             order = self.client.submit_order(order_data=order_request)
             print(f"--- Submitted Order: {order.id} for {order.symbol} ---")
         except Exception as e:
             print(f"!!! ERROR: Failed to submit order for {event.ticker}: {e} !!!")
+            return
+        if self.event_manager is not None:
+            self.open_orders[order.id] = (event, 0.0, 0.0)
+            self._record_fills(order)
+
+    def poll_fills(self):
+        """Checks every open order once, emitting FillEvents for new fills."""
+        for order_id in list(self.open_orders):
+            try:
+                order = self.client.get_order_by_id(order_id)
+            except Exception as e:
+                print(f"!!! ERROR: Failed to get status of order {order_id}: {e} !!!")
+                continue
+            self._record_fills(order)
+
+    def _record_fills(self, order):
+        """Emits a FillEvent for any newly filled quantity of an open order."""
+        if order.id not in self.open_orders:
+            return
+        event, filled_qty, filled_notional = self.open_orders[order.id]
+        new_filled_qty = float(order.filled_qty or 0)
+        if new_filled_qty > filled_qty and order.filled_avg_price is not None:
+            new_notional = new_filled_qty * float(order.filled_avg_price)
+            quantity = new_filled_qty - filled_qty
+            # The price of this increment, recovered from the average price
+            fill_price = (new_notional - filled_notional) / quantity
+            self.event_manager.put(
+                FillEvent(
+                    timestamp=event.timestamp,
+                    ticker=event.ticker,
+                    direction=event.direction,
+                    # Whole shares as an int; fractional fills are kept as is
+                    quantity=int(quantity) if quantity.is_integer() else quantity,
+                    fill_price=fill_price,
+                    ingress_ns=event.ingress_ns,
+                )
+            )
+            filled_qty, filled_notional = new_filled_qty, new_notional
+
+        if _status(order) in TERMINAL_STATUSES:
+            del self.open_orders[order.id]
+        else:
+            self.open_orders[order.id] = (event, filled_qty, filled_notional)
+
+    def close(self):
+        """Releases the handler's resources; the synchronous handler has none."""
+        pass
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    Rate limits, server errors and network failures are worth retrying.
+    Anything else, e.g. a rejected or invalid order or a bug, is not: it
+    would fail again, or worse, go through twice.
+    """
+    if isinstance(error, _NETWORK_ERRORS):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return status_code is not None and (status_code == 429 or status_code >= 500)
+
+
+def _status(order) -> str:
+    status = order.status
+    return str(getattr(status, "value", status)).lower()
+
+
+class AsyncLiveExecutionHandler(LiveExecutionHandler):
+    """
+    An asyncio execution handler for the live engine.
+
+    on_order() only schedules the submission and returns, so a burst of
+    orders (e.g. a kill-switch liquidation) is sent concurrently instead of
+    one round-trip at a time. At most 'max_concurrency' broker calls run at
+    once, in the handler's own threads, since the broker client blocks.
+    Failed submissions are retried with exponential backoff if the error is
+    transient; each order carries a client_order_id, so a retry of a request
+    that did reach the broker cannot create a duplicate.
+
+    Accepted orders are polled until they reach a final status, and every
+    increase in an order's filled quantity is put on the event queue as a
+    FillEvent, so the portfolio tracks what the broker actually executed.
+    """
+
+    def __init__(
+        self,
+        event_manager,
+        price_cache: PriceCache | None = None,
+        client=None,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        backoff: float = 0.25,
+        poll_interval: float = 1.0,
+    ):
+        """
+        Args:
+            event_manager: The queue FillEvents are put on.
+            price_cache (PriceCache, optional): See LiveExecutionHandler.
+            client (optional): See LiveExecutionHandler.
+            max_concurrency (int): The most broker calls in flight at once.
+            max_retries (int): Retries of a failed submission.
+            backoff (float): The first retry's delay; it doubles each retry.
+            poll_interval (float): Seconds between order status checks.
+        """
+        super().__init__(
+            price_cache=price_cache, client=client, event_manager=event_manager
+        )
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.poll_interval = poll_interval
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="broker"
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._submissions = set()
+        self._poll_task = None
+
+        # Counters for monitoring
+        self.orders_submitted = 0
+        self.orders_failed = 0
+        self.retries = 0
+
+    async def _call(self, func, *args, **kwargs):
+        """Runs a blocking broker call in the handler's threads."""
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+
+    async def on_order(self, event: OrderEvent):
+        print(f"--- LIVE EXECUTION: Received OrderEvent for {event.ticker} ---")
+        self._report_notional(event)
+        task = asyncio.create_task(self._submit(event))
+        self._submissions.add(task)
+        task.add_done_callback(self._submissions.discard)
+
+    async def _submit(self, event: OrderEvent):
+        order_request = self._order_request(event, client_order_id=str(uuid.uuid4()))
+        for attempt in range(self.max_retries + 1):
+            try:
+                order = await self._call(
+                    self.client.submit_order, order_data=order_request
+                )
+                break
+            except Exception as e:
+                if attempt == self.max_retries or not _is_retryable(e):
+                    self.orders_failed += 1
+                    print(
+                        f"!!! ERROR: Failed to submit order for {event.ticker}: {e} !!!"
+                    )
+                    return
+                self.retries += 1
+                await asyncio.sleep(self.backoff * 2**attempt)
+
+        self.orders_submitted += 1
+        print(f"--- Submitted Order: {order.id} for {order.symbol} ---")
+        self.open_orders[order.id] = (event, 0.0, 0.0)
+        self._record_fills(order)
+        if self.open_orders and (self._poll_task is None or self._poll_task.done()):
+            self._poll_task = asyncio.create_task(self._poll_open_orders())
+
+    async def _poll_open_orders(self):
+        while self.open_orders:
+            await asyncio.sleep(self.poll_interval)
+            order_ids = list(self.open_orders)
+            results = await asyncio.gather(
+                *(self._call(self.client.get_order_by_id, i) for i in order_ids),
+                return_exceptions=True,
+            )
+            for order_id, order in zip(order_ids, results):
+                if isinstance(order, Exception):
+                    print(
+                        f"!!! ERROR: Failed to get status of order {order_id}: {order} !!!"
+                    )
+                    continue
+                self._record_fills(order)
+
+    @property
+    def busy(self) -> bool:
+        """Whether any order is still being submitted or awaiting fills."""
+        return bool(self._submissions or self.open_orders)
+
+    async def _wait_idle(self):
+        while self.busy:
+            if self._submissions:
+                # Unlike gather, wait does not cancel the submissions when a
+                # drain times out, so an order the broker accepts is tracked
+                await asyncio.wait(set(self._submissions))
+            elif self._poll_task is None or self._poll_task.done():
+                self._poll_task = asyncio.create_task(self._poll_open_orders())
+            else:
+                await self._poll_task
+
+    async def drain(self, timeout: float | None = 30.0) -> bool:
+        """
+        Waits for in-flight submissions and open orders to finish, for up to
+        'timeout' seconds; orders still open after that stay with the broker.
+        A timeout only stops the polling: submissions still in flight carry
+        on, and the orders they place are tracked as usual.
+
+        Returns:
+            bool: True if nothing is left in flight.
+        """
+        try:
+            await asyncio.wait_for(self._wait_idle(), timeout)
+        except asyncio.TimeoutError:
+            print(f"--- {len(self.open_orders)} orders still open at the broker ---")
+        if self._poll_task is not None and not self._poll_task.done():
+            self._poll_task.cancel()
+        return not self.busy
+
+    def close(self):
+        """Shuts down the broker call threads, once the handler is drained."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,130 @@
+# qmind_quant/execution/mock_broker.py
+
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from qmind_quant.execution.live_execution import TERMINAL_STATUSES
+
+
+class MockBrokerError(Exception):
+    """A broker API error, with the HTTP status code Alpaca's APIError carries."""
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class MockOrder:
+    """The fields of an Alpaca Order the execution handlers read."""
+
+    id: str
+    client_order_id: str
+    symbol: str
+    qty: float
+    side: str
+    status: str = "accepted"
+    filled_qty: float = 0.0
+    filled_avg_price: float | None = None
+    submitted_at: float = field(default_factory=time.monotonic)
+
+
+class MockBroker:
+    """
+    A local stand-in for Alpaca's TradingClient, for testing and load-testing
+    order submission without a network or market hours.
+
+    Like the real client its calls block, taking 'latency' seconds each, and
+    it can be called from many threads at once. Orders fill in full
+    'fill_delay' seconds after they are accepted, at the price source's
+    latest close (e.g. a PriceCache) or 'default_price'. The first
+    'fail_first' calls fail with a 503 to exercise retries, and a repeated
+    client_order_id returns the original order, as Alpaca does.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.01,
+        fill_delay: float = 0.0,
+        price_source=None,
+        default_price: float = 100.0,
+        fail_first: int = 0,
+    ):
+        self.latency = latency
+        self.fill_delay = fill_delay
+        self.price_source = price_source
+        self.default_price = default_price
+        self._failures_left = fail_first
+
+        self._lock = threading.Lock()
+        self.orders = {}
+        self._by_client_id = {}
+
+        # Counters for monitoring
+        self.submit_calls = 0
+        self.status_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _call(self):
+        """Simulates one blocking API round-trip, failing if so configured."""
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            with self._lock:
+                if self._failures_left > 0:
+                    self._failures_left -= 1
+                    raise MockBrokerError("Service unavailable", status_code=503)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def submit_order(self, order_data) -> MockOrder:
+        """Accepts a MarketOrderRequest and returns the new order."""
+        with self._lock:
+            self.submit_calls += 1
+        self._call()
+
+        side = getattr(order_data.side, "value", order_data.side)
+        client_order_id = order_data.client_order_id or str(uuid.uuid4())
+        with self._lock:
+            existing = self._by_client_id.get(client_order_id)
+            if existing is not None:
+                return existing
+            order = MockOrder(
+                id=str(uuid.uuid4()),
+                client_order_id=client_order_id,
+                symbol=order_data.symbol,
+                qty=float(order_data.qty),
+                side=side,
+            )
+            self.orders[order.id] = order
+            self._by_client_id[client_order_id] = order
+            self._try_fill(order)
+            return order
+
+    def get_order_by_id(self, order_id: str) -> MockOrder:
+        """Returns the order's current status, filling it once it is due."""
+        with self._lock:
+            self.status_calls += 1
+        self._call()
+        with self._lock:
+            order = self.orders[order_id]
+            self._try_fill(order)
+            return order
+
+    def _try_fill(self, order: MockOrder):
+        if order.status in TERMINAL_STATUSES:
+            return
+        if time.monotonic() - order.submitted_at < self.fill_delay:
+            return
+        price = None
+        if self.price_source is not None:
+            price = self.price_source.get_latest_close_price(order.symbol)
+        order.filled_avg_price = price if price is not None else self.default_price
+        order.filled_qty = order.qty
+        order.status = "filled"
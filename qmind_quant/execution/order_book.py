@@ -0,0 +1,222 @@
+# qmind_quant/execution/order_book.py
+
+import heapq
+import itertools
+from collections import deque
+from dataclasses import dataclass
+
+from qmind_quant.core.event_types import OrderEvent, MarketEvent
+
+
+@dataclass
+class RestingOrder:
+    """An order waiting in the book, with its remaining unfilled quantity."""
+
+    order_id: int
+    order: OrderEvent
+    remaining: int
+    active: bool = True
+
+
+@dataclass
+class Execution:
+    """A (possibly partial) fill produced by the matching engine."""
+
+    resting_order: RestingOrder
+    quantity: int
+    price: float
+
+
+class _BookSide:
+    """
+    One side of a ticker's book (e.g. resting buy limits), indexed by price.
+
+    Orders at the same price share a FIFO queue, and the price levels are kept
+    in a heap ordered best-first. A bar only touches the levels it crosses, so
+    the cost per bar is O(k log n) for k crossed levels, regardless of how many
+    orders are resting further away.
+    """
+
+    def __init__(self, highest_first: bool):
+        # heapq is a min-heap, so a max-heap stores negated prices
+        self._sign = -1.0 if highest_first else 1.0
+        self._heap = []
+        self.levels = {}
+
+    def add(self, price: float, resting_order: RestingOrder):
+        level = self.levels.get(price)
+        if level is None:
+            level = self.levels[price] = deque()
+            heapq.heappush(self._heap, self._sign * price)
+        level.append(resting_order)
+
+    def best_price(self) -> float | None:
+        """Returns the best price with at least one active order."""
+        while self._heap:
+            price = self._sign * self._heap[0]
+            level = self.levels[price]
+            while level and not level[0].active:
+                level.popleft()
+            if level:
+                return price
+            heapq.heappop(self._heap)
+            del self.levels[price]
+        return None
+
+    def pop_level(self, price: float) -> deque:
+        heapq.heappop(self._heap)
+        return self.levels.pop(price)
+
+
+class OrderBook:
+    """
+    Resting limit and stop orders for a single ticker, matched against OHLC bars.
+
+    Intrabar fill rules (an order only becomes eligible on the bar after it
+    was placed):
+      - Buy limit at P fills if low <= P, at min(open, P).
+      - Sell limit at P fills if high >= P, at max(open, P).
+      - Buy stop at S triggers if high >= S and fills at max(open, S).
+      - Sell stop at S triggers if low <= S and fills at min(open, S).
+    """
+
+    def __init__(self):
+        self.buy_limits = _BookSide(highest_first=True)
+        self.sell_limits = _BookSide(highest_first=False)
+        self.buy_stops = _BookSide(highest_first=False)
+        self.sell_stops = _BookSide(highest_first=True)
+
+    def add(self, resting_order: RestingOrder):
+        order = resting_order.order
+        if order.order_type == "LMT":
+            side = self.buy_limits if order.direction == "BUY" else self.sell_limits
+            side.add(order.limit_price, resting_order)
+        else:
+            side = self.buy_stops if order.direction == "BUY" else self.sell_stops
+            side.add(order.stop_price, resting_order)
+
+    def match(self, bar: MarketEvent, liquidity: int | None) -> list[Execution]:
+        """
+        Matches the book against one bar. If liquidity is given, it caps the
+        total quantity filled on each side of the book, and orders are served
+        in price-time priority until it runs out.
+        """
+        executions = []
+        buy_liquidity = sell_liquidity = liquidity
+
+        # Stops trigger into market orders first, then resting limits fill.
+        buy_liquidity = self._match_side(
+            self.buy_stops,
+            lambda p: p <= bar.high,
+            lambda p: max(bar.open, p),
+            buy_liquidity,
+            executions,
+        )
+        sell_liquidity = self._match_side(
+            self.sell_stops,
+            lambda p: p >= bar.low,
+            lambda p: min(bar.open, p),
+            sell_liquidity,
+            executions,
+        )
+        self._match_side(
+            self.buy_limits,
+            lambda p: p >= bar.low,
+            lambda p: min(bar.open, p),
+            buy_liquidity,
+            executions,
+        )
+        self._match_side(
+            self.sell_limits,
+            lambda p: p <= bar.high,
+            lambda p: max(bar.open, p),
+            sell_liquidity,
+            executions,
+        )
+        return executions
+
+    @staticmethod
+    def _match_side(side, crosses, fill_price, liquidity, executions):
+        while liquidity is None or liquidity > 0:
+            price = side.best_price()
+            if price is None or not crosses(price):
+                break
+
+            level = side.pop_level(price)
+            while level and (liquidity is None or liquidity > 0):
+                resting_order = level[0]
+                if not resting_order.active:
+                    level.popleft()
+                    continue
+                quantity = resting_order.remaining
+                if liquidity is not None:
+                    quantity = min(quantity, liquidity)
+                    liquidity -= quantity
+                executions.append(Execution(resting_order, quantity, fill_price(price)))
+                resting_order.remaining -= quantity
+                if resting_order.remaining == 0:
+                    resting_order.active = False
+                    level.popleft()
+
+            # Put back whatever the bar's liquidity could not absorb
+            for resting_order in level:
+                side.add(price, resting_order)
+        return liquidity
+
+
+class MatchingEngine:
+    """
+    A simulated exchange holding one price-time-priority OrderBook per ticker.
+    """
+
+    def __init__(self, max_volume_pct: float | None = None):
+        """
+        Args:
+            max_volume_pct (float, optional): If set, the quantity filled per
+                bar on each side of a book is capped at this fraction of the
+                bar's volume. Otherwise every crossed order fills in full.
+        """
+        self.max_volume_pct = max_volume_pct
+        self.books = {}
+        self.orders = {}
+        self._order_ids = itertools.count(1)
+
+    def submit(self, order: OrderEvent) -> int:
+        """Adds a limit or stop order to its ticker's book and returns its id."""
+        if order.order_type == "LMT" and order.limit_price is None:
+            raise ValueError("A 'LMT' order requires a limit_price.")
+        if order.order_type == "STP" and order.stop_price is None:
+            raise ValueError("A 'STP' order requires a stop_price.")
+        if order.order_type not in ("LMT", "STP"):
+            raise ValueError(f"Unsupported resting order type: {order.order_type}")
+
+        order_id = next(self._order_ids)
+        resting_order = RestingOrder(order_id, order, order.quantity)
+        self.orders[order_id] = resting_order
+        self.books.setdefault(order.ticker, OrderBook()).add(resting_order)
+        return order_id
+
+    def cancel(self, order_id: int) -> bool:
+        """Cancels a resting order. Returns False if it was already done."""
+        resting_order = self.orders.pop(order_id, None)
+        if resting_order is None or not resting_order.active:
+            return False
+        # Lazy deletion: the book skips inactive orders when it reaches them
+        resting_order.active = False
+        return True
+
+    def on_bar(self, bar: MarketEvent) -> list[Execution]:
+        """Matches the ticker's book against a new bar."""
+        book = self.books.get(bar.ticker)
+        if book is None:
+            return []
+
+        liquidity = None
+        if self.max_volume_pct is not None:
+            liquidity = int(bar.volume * self.max_volume_pct)
+
+        executions = book.match(bar, liquidity)
+        for execution in executions:
+            if execution.resting_order.remaining == 0:
+                self.orders.pop(execution.resting_order.order_id, None)
+        return executions
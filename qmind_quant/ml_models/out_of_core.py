@@ -0,0 +1,158 @@
+# qmind_quant/ml_models/out_of_core.py
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+import xgboost as xgb
+
+from qmind_quant.config.paths import CACHE_DIR, FEATURE_STORE_DIR
+from qmind_quant.ml_models.model_trainer import FEATURES, XGBOOST_PARAMS
+
+# Rows per record batch handed to XGBoost; bounds the raw data held at once
+DEFAULT_BATCH_SIZE = 262_144
+
+# scikit-learn wrapper names of XGBOOST_PARAMS and their native equivalents
+_NATIVE_NAMES = {"n_jobs": "nthread", "random_state": "seed"}
+
+
+class ParquetFeatureIter(xgb.DataIter):
+    """
+    Streams the features and target of a Parquet feature store to XGBoost
+    one record batch at a time, as float32 arrays.
+
+    The store can be a single file or a directory of partitions (e.g.
+    written with partition_cols=["ticker"]); only the needed columns are
+    read, and 'filter' (a pyarrow expression, e.g. on 'date') is pushed
+    down to the scan.
+    """
+
+    def __init__(
+        self,
+        source,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        features: list[str] = FEATURES,
+        label: str = "target",
+        filter=None,
+        cache_prefix: str | None = None,
+    ):
+        self.dataset = ds.dataset(source, format="parquet", partitioning="hive")
+        self.batch_size = batch_size
+        self.features = list(features)
+        self.label = label
+        self.filter = filter
+        self.batches_read = 0
+        self._batches = None
+        super().__init__(cache_prefix=cache_prefix)
+
+    def reset(self):
+        self._batches = None
+
+    def next(self, input_data) -> bool:
+        if self._batches is None:
+            self._batches = self.dataset.to_batches(
+                columns=self.features + [self.label],
+                filter=self.filter,
+                batch_size=self.batch_size,
+            )
+        for batch in self._batches:
+            if batch.num_rows == 0:
+                continue
+            columns = [
+                batch.column(name).to_numpy(zero_copy_only=False)
+                for name in self.features
+            ]
+            input_data(
+                data=np.column_stack(columns).astype(np.float32, copy=False),
+                label=batch.column(self.label)
+                .to_numpy(zero_copy_only=False)
+                .astype(np.float32),
+                feature_names=self.features,
+            )
+            self.batches_read += 1
+            return True
+        return False
+
+
+class BoosterClassifier:
+    """
+    A trained Booster with the predict/predict_proba interface of
+    XGBClassifier, so MLStrategy can trade with it unchanged.
+    """
+
+    def __init__(self, booster: xgb.Booster, threshold: float = 0.5):
+        self.booster = booster
+        self.threshold = threshold
+
+    def get_booster(self) -> xgb.Booster:
+        return self.booster
+
+    def predict_proba(self, X: pd.DataFrame | np.ndarray) -> np.ndarray:
+        if isinstance(X, pd.DataFrame):
+            X = X[self.booster.feature_names]
+        up = self.booster.inplace_predict(X)
+        return np.column_stack([1.0 - up, up])
+
+    def predict(self, X: pd.DataFrame | np.ndarray) -> np.ndarray:
+        return (self.predict_proba(X)[:, 1] > self.threshold).astype(int)
+
+
+def native_params(params: dict) -> tuple[dict, int]:
+    """Converts XGBClassifier-style params to xgb.train params and rounds."""
+    params = dict(params)
+    params.pop("use_label_encoder", None)
+    num_boost_round = params.pop("n_estimators")
+    return {_NATIVE_NAMES.get(k, k): v for k, v in params.items()}, num_boost_round
+
+
+def train_xgboost_out_of_core(
+    source=FEATURE_STORE_DIR,
+    params: dict | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    external_memory: bool = False,
+    cache_dir=CACHE_DIR / "xgboost",
+    max_bin: int = 256,
+    filter=None,
+) -> BoosterClassifier:
+    """
+    Trains the XGBoost model on a feature store too large for memory, which
+    is streamed in record batches and never loaded as one DataFrame.
+
+    By default the batches are sketched and quantized into a QuantileDMatrix,
+    which keeps a histogram bin index (about a byte) per value instead of
+    an 8-byte float. With 'external_memory' the quantized pages are cached
+    to 'cache_dir' on disk instead (ExtMemQuantileDMatrix), so memory
+    stays bounded by the batch size, whatever the size of the store.
+
+    Args:
+        source: A Parquet file or a directory of Parquet partitions.
+        params (dict, optional): Hyperparameters overriding XGBOOST_PARAMS.
+        batch_size (int): Rows per batch read from the store.
+        external_memory (bool): Cache the training data on disk.
+        cache_dir: Where external memory pages are written.
+        max_bin (int): Histogram bins per feature.
+        filter: A pyarrow expression selecting the training rows, e.g.
+            ds.field("date") <= cutoff.
+
+    Returns:
+        A BoosterClassifier around the trained booster.
+    """
+    params, num_boost_round = native_params({**XGBOOST_PARAMS, **(params or {})})
+    if external_memory:
+        os.makedirs(cache_dir, exist_ok=True)
+        data_iter = ParquetFeatureIter(
+            source,
+            batch_size,
+            filter=filter,
+            cache_prefix=str(Path(cache_dir) / "train"),
+        )
+        dtrain = xgb.ExtMemQuantileDMatrix(data_iter, max_bin=max_bin)
+    else:
+        data_iter = ParquetFeatureIter(source, batch_size, filter=filter)
+        dtrain = xgb.QuantileDMatrix(data_iter, max_bin=max_bin)
+
+    print(f"  Training model on {dtrain.num_row()} samples streamed from {source}...")
+    booster = xgb.train(params, dtrain, num_boost_round=num_boost_round)
+    return BoosterClassifier(booster)
@@ -0,0 +1,247 @@
+# qmind_quant/optimization/allocation.py
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import pyswarms as ps
+
+from qmind_quant.analytics.performance_metrics import PERIODS_PER_YEAR
+from qmind_quant.optimization.portfolio_optimizer import PortfolioOptimizer
+
+METHODS = ("max_sharpe", "min_variance", "risk_parity", "pso")
+
+
+def ledoit_wolf_covariance(returns: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    The Ledoit-Wolf shrinkage estimate of a (T x K) returns matrix's
+    covariance: the sample covariance pulled towards a scaled identity by
+    the amount that minimizes the expected estimation error. With many
+    strategies and a short history the sample covariance is noisy and
+    ill-conditioned, which makes optimized weights unstable; shrinkage
+    keeps it well-conditioned.
+
+    Returns:
+        The (K x K) shrunk covariance and the shrinkage intensity in [0, 1].
+    """
+    n_periods, n_assets = returns.shape
+    centered = returns - returns.mean(axis=0)
+    sample = centered.T @ centered / n_periods
+    target_scale = np.trace(sample) / n_assets
+
+    # Distance of the sample from the target, and the sample's own variance
+    delta = np.sum((sample - target_scale * np.eye(n_assets)) ** 2)
+    squared_norms = np.sum(centered**2, axis=1)
+    beta = (np.sum(squared_norms**2) / n_periods - np.sum(sample**2)) / n_periods
+    shrinkage = 0.0 if delta == 0 else float(np.clip(beta / delta, 0.0, 1.0))
+
+    covariance = (1 - shrinkage) * sample + shrinkage * target_scale * np.eye(n_assets)
+    return covariance, shrinkage
+
+
+def project_to_simplex(weights: np.ndarray) -> np.ndarray:
+    """The closest long-only, fully invested allocation (Duchi et al., 2008)."""
+    sorted_weights = np.sort(weights)[::-1]
+    cumulative = np.cumsum(sorted_weights) - 1.0
+    ranks = np.arange(1, len(weights) + 1)
+    rho = np.nonzero(sorted_weights - cumulative / ranks > 0)[0][-1]
+    return np.maximum(weights - cumulative[rho] / (rho + 1), 0.0)
+
+
+@dataclass
+class Allocation:
+    """A solved allocation and its annualized expected statistics."""
+
+    method: str
+    names: list[str]
+    weights: np.ndarray
+    expected_return: float
+    volatility: float
+    sharpe: float
+
+    def as_series(self) -> pd.Series:
+        return pd.Series(self.weights, index=self.names, name=self.method)
+
+
+class AllocationEngine:
+    """
+    Solves capital allocations across the strategies of a PortfolioOptimizer.
+
+    The mean vector and a Ledoit-Wolf covariance are computed once; each
+    solver then works on those (K,) and (K x K) arrays only, so the cost
+    depends on the number of strategies, not the length of the history.
+    Max-Sharpe and min-variance have closed forms when shorting is allowed;
+    long-only versions are solved by projected gradient on the simplex.
+    Risk parity uses cyclical coordinate descent. PSO is kept as a fallback
+    for objectives that are not convex.
+    """
+
+    def __init__(
+        self,
+        optimizer: PortfolioOptimizer,
+        shrink: bool = True,
+        max_iter: int = 10_000,
+        tol: float = 1e-10,
+    ):
+        """
+        Args:
+            optimizer (PortfolioOptimizer): Provides the aligned returns.
+            shrink (bool): Use the Ledoit-Wolf covariance rather than the
+                sample covariance.
+            max_iter (int): The iteration limit of the iterative solvers.
+            tol (float): Stop once no weight moves by more than this.
+        """
+        self.optimizer = optimizer
+        self.names = list(optimizer.strategy_names)
+        returns = optimizer.returns_matrix
+        self.mean = returns.mean(axis=0)
+        if shrink:
+            self.covariance, self.shrinkage = ledoit_wolf_covariance(returns)
+        else:
+            self.covariance = np.atleast_2d(np.cov(returns, rowvar=False))
+            self.shrinkage = 0.0
+        self.max_iter = max_iter
+        self.tol = tol
+
+    def solve(self, method: str, **kwargs) -> Allocation:
+        """Solves the allocation with one of METHODS."""
+        if method not in METHODS:
+            raise ValueError(f"Unknown method '{method}'. Choose from {METHODS}")
+        weights = getattr(self, f"_{method}")(**kwargs)
+        return self._allocation(method, weights)
+
+    def _allocation(self, method: str, weights: np.ndarray) -> Allocation:
+        expected_return = float(weights @ self.mean) * PERIODS_PER_YEAR
+        volatility = float(np.sqrt(weights @ self.covariance @ weights)) * np.sqrt(
+            PERIODS_PER_YEAR
+        )
+        sharpe = expected_return / volatility if volatility > 0 else float("nan")
+        return Allocation(
+            method, self.names, weights, expected_return, volatility, sharpe
+        )
+
+    def _projected_gradient(
+        self, gradient: Callable[[np.ndarray], np.ndarray], start: np.ndarray
+    ) -> np.ndarray:
+        """
+        Minimizes a quadratic form in the covariance over long-only, fully
+        invested weights, with the step 1/L for its gradient's Lipschitz
+        constant L = 2 * the covariance's largest eigenvalue.
+        """
+        step = 1.0 / (2.0 * np.linalg.eigvalsh(self.covariance)[-1])
+        weights = project_to_simplex(start)
+        for _ in range(self.max_iter):
+            updated = project_to_simplex(weights - step * gradient(weights))
+            if np.max(np.abs(updated - weights)) < self.tol:
+                return updated
+            weights = updated
+        return weights
+
+    def _min_variance(self, long_only: bool = True) -> np.ndarray:
+        ones = np.ones(len(self.names))
+        weights = np.linalg.solve(self.covariance, ones)
+        weights /= weights.sum()
+        if not long_only or np.all(weights >= 0):
+            return weights
+        return self._projected_gradient(lambda w: 2 * self.covariance @ w, weights)
+
+    def _max_sharpe(self, long_only: bool = True) -> np.ndarray:
+        weights = np.linalg.solve(self.covariance, self.mean)
+        if weights.sum() > 0:
+            weights = weights / weights.sum()
+            if not long_only or np.all(weights >= 0):
+                return weights
+        elif not long_only:
+            raise ValueError("No portfolio has a positive expected return")
+
+        if np.all(self.mean <= 0):
+            # No long-only portfolio has a positive Sharpe; take the best asset
+            return np.eye(len(self.names))[np.argmax(self.mean)]
+        return self._long_only_max_sharpe()
+
+    def _long_only_max_sharpe(self) -> np.ndarray:
+        # Maximizing Sharpe over the simplex is a pseudo-concave problem, so
+        # projected gradient ascent from the best single asset reaches the
+        # global maximum.
+        def negative_sharpe_gradient(w):
+            variance = w @ self.covariance @ w
+            mean = w @ self.mean
+            return -(self.mean * variance - mean * (self.covariance @ w)) / (
+                variance**1.5
+            )
+
+        volatilities = np.sqrt(np.diag(self.covariance))
+        weights = np.eye(len(self.names))[np.argmax(self.mean / volatilities)]
+        # The step adapts: it grows after an improvement and halves otherwise
+        step = 0.1
+        best = self._sharpe(weights)
+        for _ in range(self.max_iter):
+            candidate = project_to_simplex(
+                weights - step * negative_sharpe_gradient(weights)
+            )
+            value = self._sharpe(candidate)
+            if value < best:
+                # Overshot: backtrack
+                step /= 2
+                if step < 1e-12:
+                    break
+                continue
+            moved = np.max(np.abs(candidate - weights))
+            weights, best = candidate, value
+            step *= 1.5
+            if moved < self.tol:
+                break
+        return weights
+
+    def _sharpe(self, weights: np.ndarray) -> float:
+        variance = weights @ self.covariance @ weights
+        return float(weights @ self.mean / np.sqrt(variance)) if variance > 0 else 0.0
+
+    def _risk_parity(self, budgets: np.ndarray | None = None) -> np.ndarray:
+        """
+        Equal (or 'budgets'-weighted) risk contributions, by cyclical
+        coordinate descent on 1/2 y'Cy - sum(b log y) (Griveau-Billion et
+        al., 2013); each coordinate update is the root of a quadratic.
+        """
+        n_assets = len(self.names)
+        budgets = np.full(n_assets, 1.0 / n_assets) if budgets is None else budgets
+        variances = np.diag(self.covariance)
+        y = 1.0 / np.sqrt(variances)
+        for _ in range(self.max_iter):
+            previous = y.copy()
+            for i in range(n_assets):
+                # (C y)_i without the i-th term
+                cross = self.covariance[i] @ y - variances[i] * y[i]
+                y[i] = (
+                    -cross + np.sqrt(cross**2 + 4 * variances[i] * budgets[i])
+                ) / (2 * variances[i])
+            if np.max(np.abs(y - previous)) < self.tol * np.max(y):
+                break
+        return y / y.sum()
+
+    def _pso(
+        self,
+        n_particles: int = 10,
+        iters: int = 50,
+        objective: Callable[[np.ndarray], np.ndarray] | None = None,
+        options: dict | None = None,
+    ) -> np.ndarray:
+        """
+        Particle Swarm Optimization over the PortfolioOptimizer's scores, or
+        any (P x K) -> (P,) objective to minimize. Weights are normalized to
+        sum to 1 before scoring.
+        """
+        objective = objective or self.optimizer.evaluate_many
+
+        def swarm_objective(weights_array):
+            return objective(weights_array / weights_array.sum(axis=1, keepdims=True))
+
+        swarm = ps.single.GlobalBestPSO(
+            n_particles=n_particles,
+            dimensions=len(self.names),
+            options=options or {"c1": 0.5, "c2": 0.3, "w": 0.9},
+            bounds=(np.full(len(self.names), 1e-6), np.ones(len(self.names))),
+        )
+        _, best_position = swarm.optimize(swarm_objective, iters=iters, verbose=False)
+        return best_position / best_position.sum()
@@ -0,0 +1,262 @@
+# qmind_quant/optimization/hyperparameter_search.py
+
+import json
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import optuna
+import pandas as pd
+import pyarrow.dataset as ds
+import xgboost as xgb
+from optuna.storages import JournalStorage
+from optuna.storages.journal import JournalFileBackend
+from optuna.trial import TrialState
+
+from qmind_quant.config.paths import CACHE_DIR, FEATURE_STORE_DIR, TUNED_PARAMS_FILE
+from qmind_quant.data_management.feature_engineer import EMBARGO_DAYS, TARGET_HORIZON
+from qmind_quant.ml_models.model_trainer import XGBOOST_PARAMS
+from qmind_quant.ml_models.out_of_core import ParquetFeatureIter, native_params
+
+STUDY_NAME = "xgboost"
+TUNING_JOURNAL_FILE = CACHE_DIR / "xgboost_tuning.journal"
+
+
+@dataclass(frozen=True)
+class CVSplit:
+    """
+    One purged time-series CV split: train on rows dated up to
+    train_cutoff, validate on rows dated within [valid_start, valid_end].
+    """
+
+    train_cutoff: pd.Timestamp
+    valid_start: pd.Timestamp
+    valid_end: pd.Timestamp
+
+
+def purged_cv_splits(
+    dates,
+    n_folds: int = 5,
+    horizon: int = TARGET_HORIZON,
+    embargo_days: int = EMBARGO_DAYS,
+) -> list[CVSplit]:
+    """
+    Expanding-window time-series CV: the trading calendar is cut into
+    n_folds + 1 blocks, and split k trains on blocks 0..k and validates on
+    block k + 1. As in walk-forward, the last 'horizon' training labels,
+    which look into the validation block, are purged and 'embargo_days'
+    more are dropped before them.
+    """
+    calendar = pd.to_datetime(sorted(pd.unique(dates)))
+    bounds = np.linspace(0, len(calendar), n_folds + 2).astype(int)
+    splits = []
+    for k in range(1, n_folds + 1):
+        cutoff_index = bounds[k] - horizon - embargo_days - 1
+        if cutoff_index < 0:
+            raise ValueError("Too few dates for this many folds")
+        splits.append(
+            CVSplit(
+                train_cutoff=calendar[cutoff_index],
+                valid_start=calendar[bounds[k]],
+                valid_end=calendar[bounds[k + 1] - 1],
+            )
+        )
+    return splits
+
+
+def suggest_params(trial: optuna.Trial) -> dict:
+    """The XGBoost search space, as overrides of XGBOOST_PARAMS."""
+    return {
+        "n_estimators": trial.suggest_int("n_estimators", 50, 500, log=True),
+        "max_depth": trial.suggest_int("max_depth", 2, 8),
+        "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.3, log=True),
+        "subsample": trial.suggest_float("subsample", 0.5, 1.0),
+        "colsample_bytree": trial.suggest_float("colsample_bytree", 0.5, 1.0),
+        "min_child_weight": trial.suggest_float(
+            "min_child_weight", 1.0, 20.0, log=True
+        ),
+        "reg_lambda": trial.suggest_float("reg_lambda", 1e-3, 10.0, log=True),
+    }
+
+
+class FoldDataCache:
+    """
+    Builds each split's training and validation QuantileDMatrix once per
+    process, streamed from the feature store, and reuses them for every
+    trial: quantizing the data does not depend on the hyperparameters, so
+    only the first trial in a process pays for it.
+    """
+
+    def __init__(self, source, splits: list[CVSplit], max_bin: int = 256):
+        self.source = source
+        self.splits = splits
+        self.max_bin = max_bin
+        self.builds = 0
+        self._matrices = {}
+
+    def get(self, fold: int) -> tuple[xgb.QuantileDMatrix, xgb.QuantileDMatrix]:
+        if fold not in self._matrices:
+            split = self.splits[fold]
+            date = ds.field("date")
+            train_iter = ParquetFeatureIter(
+                self.source, filter=date <= split.train_cutoff
+            )
+            valid_iter = ParquetFeatureIter(
+                self.source,
+                filter=(date >= split.valid_start) & (date <= split.valid_end),
+            )
+            dtrain = xgb.QuantileDMatrix(train_iter, max_bin=self.max_bin)
+            # Validation rows are binned with the training data's cuts
+            dvalid = xgb.QuantileDMatrix(valid_iter, ref=dtrain)
+            self._matrices[fold] = (dtrain, dvalid)
+            self.builds += 1
+        return self._matrices[fold]
+
+
+def cross_validate(
+    trial: optuna.Trial, fold_data: FoldDataCache, nthread: int = 1
+) -> float:
+    """
+    The Optuna objective: the mean validation log loss of the trial's
+    params over the purged splits. The running mean is reported after each
+    split, so the pruner can stop an unpromising trial early.
+    """
+    params, num_boost_round = native_params(
+        {**XGBOOST_PARAMS, **suggest_params(trial), "n_jobs": nthread}
+    )
+    params["eval_metric"] = "logloss"
+    losses = []
+    for fold in range(len(fold_data.splits)):
+        dtrain, dvalid = fold_data.get(fold)
+        evals_result = {}
+        xgb.train(
+            params,
+            dtrain,
+            num_boost_round=num_boost_round,
+            evals=[(dvalid, "valid")],
+            evals_result=evals_result,
+            verbose_eval=False,
+        )
+        losses.append(evals_result["valid"]["logloss"][-1])
+        trial.report(float(np.mean(losses)), step=fold)
+        if trial.should_prune():
+            raise optuna.TrialPruned()
+    return float(np.mean(losses))
+
+
+def _storage(journal_path) -> JournalStorage:
+    return JournalStorage(JournalFileBackend(str(journal_path)))
+
+
+def _pruner() -> optuna.pruners.BasePruner:
+    return optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=1)
+
+
+def _run_worker(
+    journal_path,
+    study_name: str,
+    source,
+    splits: list[CVSplit],
+    n_trials: int,
+    nthread: int,
+    max_bin: int,
+    seed: int,
+):
+    """Runs trials in one process until the study has 'n_trials' in total."""
+    study = optuna.load_study(
+        study_name=study_name,
+        storage=_storage(journal_path),
+        sampler=optuna.samplers.TPESampler(seed=seed),
+        pruner=_pruner(),
+    )
+    fold_data = FoldDataCache(source, splits, max_bin)
+    study.optimize(
+        lambda trial: cross_validate(trial, fold_data, nthread),
+        n_trials=n_trials,
+        callbacks=[
+            optuna.study.MaxTrialsCallback(
+                n_trials, states=(TrialState.COMPLETE, TrialState.PRUNED)
+            )
+        ],
+    )
+    return fold_data.builds
+
+
+def tune_xgboost(
+    source=FEATURE_STORE_DIR,
+    n_trials: int = 50,
+    n_workers: int | None = None,
+    n_folds: int = 5,
+    journal_path=TUNING_JOURNAL_FILE,
+    study_name: str = STUDY_NAME,
+    max_bin: int = 256,
+    seed: int = 42,
+    mp_context=None,
+) -> optuna.Study:
+    """
+    Tunes the XGBoost hyperparameters by purged time-series CV over the
+    feature store.
+
+    Trials run in a process pool; the workers share one study through a
+    journal file, which needs no database server and is safe for
+    concurrent writers. Each trial's XGBoost gets an equal share of the
+    cores, and each worker caches the splits' DMatrices across its trials.
+    The study resumes if the journal already has trials.
+
+    Args:
+        source: A Parquet feature file or a directory of partitions.
+        n_trials (int): Finished (complete or pruned) trials to run in total.
+        n_workers (int, optional): Worker processes; defaults to the CPU
+            count. 1 runs the trials in this process.
+        n_folds (int): Purged CV splits per trial.
+        journal_path: The study's journal file.
+        max_bin (int): Histogram bins, fixed so the cached data is reusable.
+        mp_context: The multiprocessing context, e.g. mp.get_context("spawn").
+
+    Returns:
+        The study, e.g. for study.best_params.
+    """
+    dates = ds.dataset(source, format="parquet", partitioning="hive").to_table(
+        columns=["date"]
+    )
+    splits = purged_cv_splits(dates.column("date").to_pandas(), n_folds)
+    os.makedirs(Path(journal_path).parent, exist_ok=True)
+    study = optuna.create_study(
+        study_name=study_name,
+        storage=_storage(journal_path),
+        direction="minimize",
+        load_if_exists=True,
+    )
+    n_workers = n_workers or os.cpu_count() or 1
+    nthread = max(1, (os.cpu_count() or 1) // n_workers)
+    print(
+        f"--- Tuning XGBoost: {n_trials} trials, {n_folds} purged folds, "
+        f"{n_workers} worker(s) x {nthread} thread(s) ---"
+    )
+
+    worker_args = (journal_path, study_name, source, splits, n_trials, nthread, max_bin)
+    if n_workers == 1:
+        _run_worker(*worker_args, seed)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=mp_context or mp.get_context()
+        ) as pool:
+            # Distinct seeds, so the workers do not sample the same params
+            futures = [
+                pool.submit(_run_worker, *worker_args, seed + worker)
+                for worker in range(n_workers)
+            ]
+            for future in futures:
+                future.result()
+    return study
+
+
+def save_best_params(study: optuna.Study, path=TUNED_PARAMS_FILE) -> dict:
+    """Writes the best trial's params as JSON, for load_tuned_params."""
+    os.makedirs(Path(path).parent, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(study.best_params, f, indent=2)
+    return study.best_params
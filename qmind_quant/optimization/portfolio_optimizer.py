@@ -1,74 +1,111 @@
 # qmind_quant/optimization/portfolio_optimizer.py
 
+import numpy as np
 import pandas as pd
-import quantstats as qs
-from qmind_quant.ml_models.model_trainer import train_xgboost_model
-
-# Important: We import the function from the script, not the other way around
-from scripts.run_backtest import run_backtest_and_get_curve
-from qmind_quant.config.paths import FEATURES_DATA_DIR
+from qmind_quant.analytics.performance_metrics import PERIODS_PER_YEAR
+from qmind_quant.execution.cost_models import CostModel
+from qmind_quant.optimization.returns_cache import (
+    FEATURE_DATA_FILE,
+    ReturnsCache,
+    load_strategy_returns,
+)
 
 
 class PortfolioOptimizer:
     """
     This class is responsible for evaluating the performance of a combined
     portfolio of multiple strategies given a specific capital allocation.
+
+    The strategies' daily returns are aligned once into a (T x K) matrix, and
+    only their mean vector and covariance matrix are kept for scoring: a
+    portfolio's mean return is w @ mean and its variance w @ cov @ w, so a
+    whole (P x K) swarm of allocations is scored with a few small matrix
+    products, independent of the length of the history.
     """
 
-    def __init__(self, tickers: list[str], initial_capital: float):
+    def __init__(
+        self,
+        tickers: list[str],
+        initial_capital: float,
+        cost_model: CostModel | None = None,
+        strategies: list[str] = ("xgb", "bnh"),
+        cache: ReturnsCache | None = None,
+        data_path=FEATURE_DATA_FILE,
+    ):
+        """
+        Args:
+            tickers (list[str]): The tickers the strategies trade.
+            initial_capital (float): The capital each backtest starts with.
+            cost_model (CostModel, optional): The backtests' trading costs.
+            strategies (list[str]): Names of strategies registered in
+                optimization.returns_cache to allocate between.
+            cache (ReturnsCache, optional): Where return streams are cached.
+            data_path: The feature data the strategies are computed from.
+        """
         self.tickers = tickers
         self.initial_capital = initial_capital
-
-        # Load the data once
-        full_feature_df = pd.read_parquet(FEATURES_DATA_DIR / "ml_feature_data.parquet")
+        self.cost_model = cost_model
 
         # --- Run backtests for each strategy ONCE to get their returns ---
+        # Return streams are cached on disk, so backtests only run when the
+        # data, a strategy's params or the backtest config changed.
         print("--- Pre-calculating individual strategy returns... ---")
-
-        # 1. XGBoost Strategy
-        print("Running backtest for XGBoost Strategy...")
-        xgb_model = train_xgboost_model(full_feature_df)
-        xgb_equity_curve = run_backtest_and_get_curve(
-            model=xgb_model,
-            data_df=full_feature_df.copy(),
-            tickers=self.tickers,
-            initial_capital=self.initial_capital,
+        config = {
+            "tickers": list(tickers),
+            "initial_capital": initial_capital,
+            "cost_model": cost_model,
+        }
+        self.strategy_returns = load_strategy_returns(
+            list(strategies), config, data_path, cache
         )
-        self.xgb_returns = xgb_equity_curve["returns"]
-
-        # 2. Add other strategies here in the future (e.g., MA Crossover)
-        # For now, we'll compare the XGBoost strategy to a simple Buy-and-Hold
-        print("Calculating returns for Buy-and-Hold Strategy...")
-        # For simplicity, we use SPY as the benchmark for Buy-and-Hold
-        spy_df = pd.read_parquet(FEATURES_DATA_DIR / "ml_feature_data.parquet")
-        spy_df = spy_df[spy_df["ticker"] == "SPY"].set_index("date")
-        self.bnh_returns = spy_df["close"].pct_change().fillna(0.0)
 
+        # We need to align the indexes to handle any date mismatches
+        self._set_returns(self.strategy_returns.dropna())
         print("--- Pre-calculation complete. Optimizer is ready. ---")
 
+    @classmethod
+    def from_returns(cls, returns: pd.DataFrame) -> "PortfolioOptimizer":
+        """
+        Builds an optimizer over already computed strategy returns, one
+        column per strategy, without running any backtests.
+        """
+        optimizer = cls.__new__(cls)
+        optimizer._set_returns(returns.dropna())
+        return optimizer
+
+    def _set_returns(self, returns: pd.DataFrame):
+        self.strategy_names = list(returns.columns)
+        # The aligned (T x K) returns matrix
+        self.returns_matrix = returns.to_numpy(dtype=np.float64)
+        self._mean_returns = self.returns_matrix.mean(axis=0)
+        self._covariance = np.atleast_2d(np.cov(self.returns_matrix, rowvar=False))
+
+    def evaluate_many(self, weights: np.ndarray) -> np.ndarray:
+        """
+        Scores a whole (P x K) matrix of allocations at once, returning each
+        portfolio's negative annualized Sharpe Ratio (rf=0, like
+        qs.stats.sharpe). Allocations with no defined Sharpe score 0.
+        """
+        weights = np.atleast_2d(np.asarray(weights, dtype=np.float64))
+        mean = weights @ self._mean_returns
+        variance = np.einsum("pk,kl,pl->p", weights, self._covariance, weights)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = mean / np.sqrt(np.maximum(variance, 0.0))
+        sharpe *= np.sqrt(PERIODS_PER_YEAR)
+        # We return a negative Sharpe because the PSO algorithm minimizes by default.
+        # So, minimizing a negative Sharpe is the same as maximizing a positive one.
+        return np.where(np.isnan(sharpe), 0.0, -sharpe)
+
     def evaluate(self, weights: list[float]) -> float:
         """
         The 'scorecard' function. Takes a list of weights and returns the
-        portfolio's Sharpe Ratio.
+        portfolio's (negative) Sharpe Ratio.
 
         Args:
             weights (list[float]): A list of weights, e.g., [w_xgb, w_bnh].
                                    Must sum to 1.
         """
-        # Combine the individual strategy returns using the given weights
-        # We need to align the indexes to handle any date mismatches
-        combined_returns = pd.DataFrame(
-            {"xgb": self.xgb_returns, "bnh": self.bnh_returns}
-        ).dropna()
-
-        # The core portfolio math: weighted sum of returns
-        portfolio_returns = (combined_returns * weights).sum(axis=1)
-
-        # Calculate the Sharpe Ratio for the combined portfolio
-        # We return a negative Sharpe because the PSO algorithm minimizes by default.
-        # So, minimizing a negative Sharpe is the same as maximizing a positive one.
-        sharpe = qs.stats.sharpe(portfolio_returns)
-        return -sharpe if pd.notna(sharpe) else 0
+        return float(self.evaluate_many(weights)[0])
 
 
 # --- A small test block to ensure it works ---
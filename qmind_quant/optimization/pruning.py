@@ -0,0 +1,37 @@
+# qmind_quant/optimization/pruning.py
+
+import math
+
+import optuna
+
+from qmind_quant.simulation.backtest_engine import BacktestEngine
+
+
+class OptunaPruningCallback:
+    """
+    A BacktestEngine callback that reports the running value of a
+    performance statistic (see Portfolio.stats) to an Optuna trial, and
+    stops the backtest when the study's pruner judges the trial hopeless,
+    so bad parameters only cost a fraction of the data.
+    """
+
+    def __init__(self, trial: optuna.Trial, metric: str = "sharpe"):
+        """
+        Args:
+            trial (optuna.Trial): The trial the backtest is scoring.
+            metric (str): A key of OnlinePerformanceStats.snapshot(), e.g.
+                'sharpe' or 'calmar'; it must be the study's objective.
+        """
+        self.trial = trial
+        self.metric = metric
+
+    def __call__(self, engine: BacktestEngine, periods: int):
+        value = engine.current_stats()[self.metric]
+        if value is None or math.isnan(value):
+            # Nothing to compare yet, e.g. no trades so far
+            value = 0.0
+        self.trial.report(value, step=periods)
+        if self.trial.should_prune():
+            raise optuna.TrialPruned(
+                f"Pruned after {periods} periods with {self.metric} {value:.2f}"
+            )
@@ -0,0 +1,187 @@
+# qmind_quant/optimization/returns_cache.py
+
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+from qmind_quant.config.paths import CACHE_DIR, FEATURES_DATA_DIR
+from qmind_quant.ml_models.model_trainer import XGBOOST_PARAMS, train_xgboost_model
+
+# Important: We import the function from the script, not the other way around
+from scripts.run_backtest import run_backtest_and_get_curve
+
+FEATURE_DATA_FILE = FEATURES_DATA_DIR / "ml_feature_data.parquet"
+
+# Bump to invalidate every cached return stream, e.g. after a backtester fix
+CACHE_VERSION = 1
+
+
+@dataclass
+class StrategySpec:
+    """
+    A strategy whose daily returns the portfolio optimizer can allocate to.
+
+    'compute' takes the feature data, the strategy's params and the backtest
+    config, and returns a Series of daily returns indexed by date.
+    """
+
+    name: str
+    compute: Callable[[pd.DataFrame, dict, dict], pd.Series]
+    params: dict = field(default_factory=dict)
+
+
+STRATEGY_REGISTRY: dict[str, StrategySpec] = {}
+
+
+def register_strategy(spec: StrategySpec):
+    """Makes a strategy available to the optimizer by name."""
+    STRATEGY_REGISTRY[spec.name] = spec
+
+
+def _xgboost_returns(feature_df: pd.DataFrame, params: dict, config: dict):
+    print("Running backtest for XGBoost Strategy...")
+    model = train_xgboost_model(feature_df, params)
+    equity_curve = run_backtest_and_get_curve(
+        model=model,
+        data_df=feature_df.copy(),
+        tickers=config["tickers"],
+        initial_capital=config["initial_capital"],
+        cost_model=config.get("cost_model"),
+    )
+    return equity_curve["returns"]
+
+
+def _buy_and_hold_returns(feature_df: pd.DataFrame, params: dict, config: dict):
+    print("Calculating returns for Buy-and-Hold Strategy...")
+    df = feature_df[feature_df["ticker"] == params["ticker"]].set_index("date")
+    return df["close"].pct_change().fillna(0.0)
+
+
+register_strategy(StrategySpec("xgb", _xgboost_returns, dict(XGBOOST_PARAMS)))
+# For simplicity, we use SPY as the benchmark for Buy-and-Hold
+register_strategy(StrategySpec("bnh", _buy_and_hold_returns, {"ticker": "SPY"}))
+
+
+def file_fingerprint(path: str | Path, chunk_size: int = 1 << 20) -> str:
+    """
+    Identifies a data file by a SHA-256 hash of its contents, so a rewrite
+    with the same data still hits the cache and a copy of the file shares
+    its entries. Hashing reads the file once, which is cheap next to the
+    retraining and backtests a miss costs.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _describe(value):
+    """A JSON-able description of a config value, e.g. a cost model's parameters."""
+    if isinstance(value, dict):
+        return {str(k): _describe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_describe(v) for v in value]
+    if hasattr(value, "__dict__"):
+        return {"type": type(value).__name__, **_describe(vars(value))}
+    return value
+
+
+class ReturnsCache:
+    """
+    Caches strategy return streams as Parquet files, keyed by a fingerprint
+    of the input data, the strategy's params and the backtest config, so
+    allocation studies only retrain and re-backtest when one of them changes.
+    """
+
+    def __init__(self, cache_dir: str | Path = CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, spec: StrategySpec, fingerprint: str, config: dict) -> str:
+        payload = {
+            "version": CACHE_VERSION,
+            "strategy": spec.name,
+            "params": _describe(spec.params),
+            "data": fingerprint,
+            "config": _describe(config),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()[:24]
+
+    def path(self, spec: StrategySpec, fingerprint: str, config: dict) -> Path:
+        return (
+            self.cache_dir
+            / f"{spec.name}-{self.key(spec, fingerprint, config)}.parquet"
+        )
+
+    def get_or_compute(
+        self,
+        spec: StrategySpec,
+        fingerprint: str,
+        config: dict,
+        load_data: Callable[[], pd.DataFrame],
+    ) -> pd.Series:
+        """
+        Returns the strategy's cached returns, or computes and caches them.
+        'load_data' is only called on a miss.
+        """
+        path = self.path(spec, fingerprint, config)
+        if path.exists():
+            self.hits += 1
+            return pd.read_parquet(path)["returns"].rename(spec.name)
+
+        self.misses += 1
+        returns = spec.compute(load_data(), spec.params, config).rename(spec.name)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write then rename, so a crash never leaves a truncated cache file
+        tmp_path = path.with_suffix(".tmp")
+        returns.to_frame("returns").to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+        return returns
+
+
+def load_strategy_returns(
+    strategies: list[str],
+    config: dict,
+    data_path: str | Path = FEATURE_DATA_FILE,
+    cache: ReturnsCache | None = None,
+) -> pd.DataFrame:
+    """
+    Loads the daily returns of the registered strategies, one column each,
+    from the cache where possible. The feature data is read at most once,
+    and not at all when every strategy is cached.
+
+    Args:
+        strategies (list[str]): Names of registered strategies.
+        config (dict): The backtest config (tickers, initial_capital,
+            cost_model) shared by all strategies.
+        data_path: The feature data the strategies are computed from.
+        cache (ReturnsCache, optional): Defaults to a cache in CACHE_DIR.
+    """
+    cache = cache or ReturnsCache()
+    fingerprint = file_fingerprint(data_path)
+    feature_df = None
+
+    def load_data():
+        nonlocal feature_df
+        if feature_df is None:
+            feature_df = pd.read_parquet(data_path)
+        return feature_df
+
+    columns = {}
+    for name in strategies:
+        if name not in STRATEGY_REGISTRY:
+            raise KeyError(
+                f"Unknown strategy '{name}'. Registered: {list(STRATEGY_REGISTRY)}"
+            )
+        columns[name] = cache.get_or_compute(
+            STRATEGY_REGISTRY[name], fingerprint, config, load_data
+        )
+    return pd.DataFrame(columns)
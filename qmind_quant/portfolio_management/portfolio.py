@@ -1,8 +1,17 @@
 # qmind_quant/portfolio_management/portfolio.py
 
+from collections import deque
+
 import pandas as pd
+from qmind_quant.analytics.performance_metrics import OnlinePerformanceStats
 from qmind_quant.core.event_types import SignalEvent, OrderEvent, FillEvent, MarketEvent
 from qmind_quant.data_management.data_handler import HistoricalDataHandler
+from qmind_quant.data_management.price_cache import PriceCache
+from qmind_quant.portfolio_management.risk_manager import RiskManager
+
+# Holdings records a live portfolio keeps; a long-running process would
+# otherwise grow its history without bound. The statistics cover them all.
+LIVE_HOLDINGS_HISTORY = 10_000
 
 
 class Portfolio:
@@ -13,6 +22,9 @@ class Portfolio:
         | None = None,  # Allow data_handler to be None
         initial_capital=100000.0,
         max_drawdown_pct=0.15,
+        risk_manager: RiskManager | None = None,
+        price_cache: PriceCache | None = None,
+        order_value: float | None = None,
     ):
         self.event_manager = event_manager
         self.data_handler = data_handler
@@ -20,12 +32,31 @@ class Portfolio:
         self.cash = initial_capital
 
         self.current_holdings = {}
-        self.all_holdings = []
+        # Backtests keep the whole equity curve, live trading the latest part
+        self.all_holdings = [] if data_handler else deque(maxlen=LIVE_HOLDINGS_HISTORY)
+        # Running return, drawdown and trade statistics of the equity curve,
+        # queryable mid-run without building the curve
+        self.stats = OnlinePerformanceStats()
+
+        # Running mark-to-market state. Rather than re-pricing every position
+        # on each bar, we remember the last price each ticker was valued at and
+        # adjust the total market value by the change in that one position.
+        self.last_prices = {}
+        self.market_value = 0.0
 
         self.max_drawdown_pct = max_drawdown_pct
         self.high_water_mark = initial_capital
         self.is_risk_managed = False
 
+        # Optional pre-trade risk engine (VaR/CVaR, exposure and concentration limits)
+        self.risk_manager = risk_manager
+        self.latest_risk_metrics = None
+
+        # Live price source for tickers this portfolio has not seen a bar for
+        self.price_cache = price_cache
+        # If set, orders are sized to this notional value instead of 10 shares
+        self.order_value = order_value
+
         # --- THIS IS THE FIX ---
         # Handle initialization for both backtesting and live trading
         if self.data_handler:
@@ -39,24 +70,16 @@ class Portfolio:
 
     def _update_holdings_for_timestamp(self, timestamp):
         """Records the current cash and market value, and checks for max drawdown."""
-        # For live trading, we need a valid price source to do this,
-        # which is a more advanced topic. We'll skip this logic if no data_handler.
-        if self.data_handler is None:
-            return
-
-        record = {"timestamp": timestamp, "cash": self.cash}
-
-        market_value = 0
-        for ticker, quantity in self.current_holdings.items():
-            if quantity != 0:
-                price = self.data_handler.get_latest_close_price(ticker)
-                if price:
-                    market_value += price * quantity
-
-        total_value = self.cash + market_value
-        record["market_value"] = market_value
-        record["total_value"] = total_value
-        self.all_holdings.append(record)
+        total_value = self.cash + self.market_value
+        self.all_holdings.append(
+            {
+                "timestamp": timestamp,
+                "cash": self.cash,
+                "market_value": self.market_value,
+                "total_value": total_value,
+            }
+        )
+        self.stats.update(total_value)
 
         if not self.is_risk_managed:
             self.high_water_mark = max(self.high_water_mark, total_value)
@@ -68,6 +91,29 @@ class Portfolio:
                 )
                 self._liquidate_all_positions(timestamp)
 
+    def _mark_to_market(self, ticker: str, price: float):
+        """
+        Re-values a single ticker at a new price in O(1), adjusting the running
+        market value by quantity * (new_price - old_price).
+        """
+        old_price = self.last_prices.get(ticker)
+        quantity = self.current_holdings.get(ticker, 0)
+        if quantity != 0 and old_price is not None:
+            self.market_value += quantity * (price - old_price)
+        self.last_prices[ticker] = price
+
+    def _revalue_all_positions(self) -> float:
+        """
+        Recomputes the market value from scratch using the last known prices.
+        This is O(n) in the number of positions and is only meant as a
+        consistency check against the incremental value.
+        """
+        return sum(
+            quantity * self.last_prices[ticker]
+            for ticker, quantity in self.current_holdings.items()
+            if quantity != 0 and ticker in self.last_prices
+        )
+
     def _liquidate_all_positions(self, timestamp):
         """Generates SELL orders for all current holdings."""
         print("--- LIQUIDATING ALL POSITIONS ---")
@@ -78,19 +124,41 @@ class Portfolio:
 
     def on_market_event(self, event: MarketEvent):
         # This is primarily for backtesting to update the equity curve daily
-        self._update_holdings_for_timestamp(event.timestamp)
+        self.on_prices(event.timestamp, {event.ticker: event.close})
+
+    def on_prices(self, timestamp, prices: dict[str, float]):
+        """
+        Marks the given tickers to their prices, feeds the risk manager and
+        records one holdings entry (with the drawdown check) for 'timestamp'.
+        For callers that see prices rather than bars, e.g. the sharded
+        engine's aggregator reading the shared price cache.
+        """
+        new_timestamp = False
+        for ticker, price in prices.items():
+            self._mark_to_market(ticker, price)
+            if self.risk_manager is not None:
+                new_timestamp |= self.risk_manager.on_market_event(
+                    ticker, timestamp, price
+                )
+        # Risk is re-evaluated once per timestamp, not once per ticker bar, and
+        # only once all of these prices are applied, so it sees one timestamp
+        if new_timestamp:
+            self.latest_risk_metrics = self.risk_manager.evaluate(
+                self.cash + self.market_value
+            )
+        self._update_holdings_for_timestamp(timestamp)
 
     def on_signal(self, event: SignalEvent):
         """On a SignalEvent, generate a new OrderEvent if not risk-managed."""
         if self.is_risk_managed:
             return
 
-        # For live trading, we can't get a historical price easily,
-        # so we will use a simplified position sizing logic.
-        # A production system would use the latest tick/quote price.
-        quantity = 10  # Simplified fixed quantity for live trading
-
         if event.signal_type == "LONG":
+            quantity = self._order_quantity(event.ticker)
+            if quantity <= 0:
+                return
+            if not self._passes_risk_checks(event.ticker, quantity):
+                return
             order = OrderEvent(event.timestamp, event.ticker, "MKT", "BUY", quantity)
             self.event_manager.put(order)
 
@@ -102,21 +170,72 @@ class Portfolio:
                 )
                 self.event_manager.put(order)
 
+    def _latest_price(self, ticker: str) -> float | None:
+        """The live cached price if there is one, else the last marked price."""
+        if self.price_cache is not None:
+            price = self.price_cache.get_latest_close_price(ticker)
+            if price is not None:
+                return price
+        return self.last_prices.get(ticker)
+
+    def _order_quantity(self, ticker: str) -> int:
+        """Sizes a new position: 'order_value' worth of shares, or 10 shares."""
+        if self.order_value is None:
+            return 10
+        price = self._latest_price(ticker)
+        if price is None or price <= 0:
+            print(f"  PORTFOLIO: No price to size an order for {ticker}.")
+            return 0
+        return int(self.order_value // price)
+
+    def _passes_risk_checks(self, ticker: str, quantity_change: int) -> bool:
+        """Gates a new order on the risk manager's limits, if one is configured."""
+        if self.risk_manager is None:
+            return True
+
+        price = self._latest_price(ticker)
+        if price is None:
+            print(f"  RISK: No price for {ticker}. Order rejected.")
+            return False
+
+        equity = self.cash + self.market_value
+        allowed, reason = self.risk_manager.check_order(
+            ticker, quantity_change, price, equity
+        )
+        if not allowed:
+            print(f"  RISK: Order for {ticker} rejected: {reason}.")
+        return allowed
+
     def on_fill(self, event: FillEvent):
         cost = event.fill_price * event.quantity
 
         if event.direction == "BUY":
+            quantity_change = event.quantity
             self.cash -= cost
-            self.cash -= event.commission
-            self.current_holdings[event.ticker] = (
-                self.current_holdings.get(event.ticker, 0) + event.quantity
-            )
         elif event.direction == "SELL":
+            quantity_change = -event.quantity
             self.cash += cost
-            self.cash -= event.commission
-            self.current_holdings[event.ticker] = (
-                self.current_holdings.get(event.ticker, 0) - event.quantity
-            )
+        else:
+            return
+        self.cash -= event.commission
+        self.stats.record_trade(cost)
+
+        self.current_holdings[event.ticker] = (
+            self.current_holdings.get(event.ticker, 0) + quantity_change
+        )
+
+        # The new shares are valued at the ticker's last marked price so the
+        # running market value stays consistent with the other positions.
+        # A ticker we have never seen a bar for is marked at its live cached
+        # price, or failing that at its fill price.
+        price = self.last_prices.get(event.ticker)
+        if price is None:
+            price = self._latest_price(event.ticker) or event.fill_price
+            self.last_prices[event.ticker] = price
+        self.market_value += quantity_change * price
+
+        if self.risk_manager is not None:
+            self.risk_manager.on_fill(event.ticker, quantity_change, event.fill_price)
 
     def get_equity_curve(self) -> pd.DataFrame:
         curve = pd.DataFrame(self.all_holdings)
@@ -0,0 +1,199 @@
+# qmind_quant/portfolio_management/risk_manager.py
+
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+
+
+@dataclass
+class RiskLimits:
+    """
+    Pre-trade risk limits. Exposure and loss limits are expressed as a
+    fraction of current portfolio equity; a limit of None is not enforced.
+    """
+
+    max_gross_exposure: float | None = 1.0  # Sum of |position value| / equity
+    max_net_exposure: float | None = 1.0  # |Sum of position value| / equity
+    max_position_pct: float | None = 0.25  # Largest single |position| / equity
+    max_var_pct: float | None = None  # Historical VaR / equity
+    max_cvar_pct: float | None = None  # Historical CVaR / equity
+
+
+@dataclass
+class RiskMetrics:
+    """A snapshot of portfolio risk. Loss figures are positive currency amounts."""
+
+    historical_var: float
+    historical_cvar: float
+    parametric_var: float
+    parametric_cvar: float
+    gross_exposure: float
+    net_exposure: float
+    max_concentration: float
+
+
+def _per_equity(value: float, equity: float) -> float:
+    """
+    An exposure as a fraction of equity. With no equity left any position is
+    infinitely levered, so a non-zero exposure is +/-inf rather than a
+    division by zero or a sign flip.
+    """
+    if equity > 0:
+        return float(value / equity)
+    return float(np.sign(value) * np.inf) if value else 0.0
+
+
+class RiskManager:
+    """
+    Keeps a rolling matrix of per-ticker returns and evaluates portfolio-level
+    risk (VaR/CVaR, exposures and concentration) with vectorized NumPy.
+
+    The return history is a fixed-size ring buffer of shape (window, n_tickers).
+    Each row holds the returns of every ticker for one timestamp, so the
+    portfolio P&L distribution is a single matrix-vector product.
+    """
+
+    def __init__(
+        self,
+        tickers: list[str],
+        limits: RiskLimits | None = None,
+        window: int = 252,
+        confidence: float = 0.99,
+    ):
+        self.limits = limits or RiskLimits()
+        self.window = window
+        self.confidence = confidence
+
+        self._index = {ticker: i for i, ticker in enumerate(tickers)}
+        n = len(tickers)
+        self._returns = np.zeros((window, n))
+        self._pending_row = np.zeros(n)
+        self._prices = np.full(n, np.nan)
+        self._quantities = np.zeros(n)
+        self._row = 0
+        self._count = 0
+        self._current_timestamp = None
+
+        # Constants for the parametric (Gaussian) VaR/CVaR.
+        self._z = NormalDist().inv_cdf(1 - confidence)
+        self._cvar_scale = NormalDist().pdf(self._z) / (1 - confidence)
+
+    def _column(self, ticker: str) -> int:
+        """Returns the matrix column of a ticker, growing the matrix if needed."""
+        column = self._index.get(ticker)
+        if column is None:
+            column = len(self._index)
+            self._index[ticker] = column
+            self._returns = np.pad(self._returns, ((0, 0), (0, 1)))
+            self._pending_row = np.append(self._pending_row, 0.0)
+            self._prices = np.append(self._prices, np.nan)
+            self._quantities = np.append(self._quantities, 0.0)
+        return column
+
+    def on_market_event(self, ticker: str, timestamp, price: float) -> bool:
+        """
+        Records a new bar. Returns for one timestamp accumulate in a pending
+        row that is committed to the ring buffer once the timestamp changes.
+        Returns True when this bar started a new timestamp.
+        """
+        new_timestamp = timestamp != self._current_timestamp
+        if new_timestamp:
+            if self._current_timestamp is not None:
+                self._returns[self._row] = self._pending_row
+                self._row = (self._row + 1) % self.window
+                self._count = min(self._count + 1, self.window)
+                self._pending_row[:] = 0.0
+            self._current_timestamp = timestamp
+
+        column = self._column(ticker)
+        old_price = self._prices[column]
+        if old_price > 0:
+            self._pending_row[column] = price / old_price - 1.0
+        self._prices[column] = price
+        return new_timestamp
+
+    def on_fill(self, ticker: str, quantity_change: float, fill_price: float):
+        """Keeps the position vector in sync with the portfolio's holdings."""
+        column = self._column(ticker)
+        self._quantities[column] += quantity_change
+        if np.isnan(self._prices[column]):
+            self._prices[column] = fill_price
+
+    def _exposures(self) -> np.ndarray:
+        return np.nan_to_num(self._quantities * self._prices)
+
+    def evaluate(
+        self, equity: float, exposures: np.ndarray | None = None
+    ) -> RiskMetrics:
+        """
+        Computes the risk metrics for a vector of position values (defaults to
+        the current book). Every metric is a handful of vectorized operations
+        over the (window x n_tickers) return matrix. With non-positive equity
+        the exposure ratios of any open position are infinite.
+        """
+        if exposures is None:
+            exposures = self._exposures()
+
+        abs_exposures = np.abs(exposures)
+        gross = abs_exposures.sum()
+        net = exposures.sum()
+        max_concentration = (
+            _per_equity(abs_exposures.max(), equity) if len(exposures) else 0.0
+        )
+
+        if self._count < 2:
+            hist_var = hist_cvar = param_var = param_cvar = 0.0
+        else:
+            pnl = self._returns[: self._count] @ exposures
+            cutoff = np.quantile(pnl, 1 - self.confidence)
+            hist_var = max(-cutoff, 0.0)
+            hist_cvar = max(-pnl[pnl <= cutoff].mean(), 0.0)
+
+            mu = pnl.mean()
+            sigma = pnl.std(ddof=1)
+            param_var = max(-(mu + self._z * sigma), 0.0)
+            param_cvar = max(-(mu - sigma * self._cvar_scale), 0.0)
+
+        return RiskMetrics(
+            historical_var=hist_var,
+            historical_cvar=hist_cvar,
+            parametric_var=param_var,
+            parametric_cvar=param_cvar,
+            gross_exposure=_per_equity(gross, equity),
+            net_exposure=_per_equity(net, equity),
+            max_concentration=max_concentration,
+        )
+
+    def check_order(
+        self, ticker: str, quantity_change: float, price: float, equity: float
+    ) -> tuple[bool, str]:
+        """
+        Evaluates the book as it would look after the proposed trade and
+        checks it against the limits. Returns (allowed, reason).
+        """
+        if equity <= 0:
+            return False, "non-positive equity"
+
+        column = self._column(ticker)
+        exposures = self._exposures()
+        current = exposures[column]
+        exposures[column] = (self._quantities[column] + quantity_change) * price
+
+        # Trades that only shrink a position always reduce risk.
+        if abs(exposures[column]) <= abs(current):
+            return True, ""
+
+        metrics = self.evaluate(equity, exposures)
+        limits = self.limits
+        checks = [
+            (limits.max_gross_exposure, metrics.gross_exposure, "gross exposure"),
+            (limits.max_net_exposure, abs(metrics.net_exposure), "net exposure"),
+            (limits.max_position_pct, metrics.max_concentration, "concentration"),
+            (limits.max_var_pct, metrics.historical_var / equity, "VaR"),
+            (limits.max_cvar_pct, metrics.historical_cvar / equity, "CVaR"),
+        ]
+        for limit, value, name in checks:
+            if limit is not None and value > limit:
+                return False, f"{name} {value:.2%} exceeds limit {limit:.2%}"
+        return True, ""
@@ -1,5 +1,7 @@
 # qmind_quant/simulation/backtest_engine.py
 
+from collections.abc import Callable
+
 from qmind_quant.core.event_manager import EventManager
 from qmind_quant.data_management.data_handler import HistoricalDataHandler
 from qmind_quant.strategies.base_strategy import BaseStrategy
@@ -15,12 +17,43 @@ class BacktestEngine:
         strategy: BaseStrategy,
         portfolio: Portfolio,
         execution_handler: SimulatedExecutionHandler,
+        callback: Callable[["BacktestEngine", int], None] | None = None,
+        callback_every: int = 252,
     ):
+        """
+        Args:
+            callback (callable, optional): Called as callback(engine, periods)
+                every 'callback_every' trading periods (distinct bar
+                timestamps), e.g. to report interim results. An exception
+                it raises, such as optuna.TrialPruned, ends the backtest.
+            callback_every (int): Trading periods between callbacks.
+        """
         self.event_manager = event_manager
         self.data_handler = data_handler
         self.strategy = strategy
         self.portfolio = portfolio
         self.execution_handler = execution_handler
+        self.callback = callback
+        self.callback_every = callback_every
+        self.periods_processed = 0
+        self._last_timestamp = None
+
+    def current_stats(self) -> dict:
+        """The portfolio's running performance statistics, e.g. mid-run."""
+        return self.portfolio.stats.snapshot()
+
+    def _on_new_bar(self, timestamp):
+        """
+        Counts trading periods, and runs the callback once a period is
+        complete, i.e. when the first bar of the next one arrives.
+        """
+        if timestamp == self._last_timestamp:
+            return
+        if self._last_timestamp is not None:
+            self.periods_processed += 1
+            if self.callback and self.periods_processed % self.callback_every == 0:
+                self.callback(self, self.periods_processed)
+        self._last_timestamp = timestamp
 
     def run_backtest(self):
         print("Starting backtest...")
@@ -37,11 +70,15 @@ class BacktestEngine:
 
             market_event = self.data_handler.stream_next_bar()
             if market_event is not None:
+                self._on_new_bar(market_event.timestamp)
                 self.event_manager.put(market_event)
 
             while not self.event_manager.empty():
                 event = self.event_manager.get()
                 if event.event_type == "MARKET":
+                    # Resting orders are matched against the new bar before the
+                    # strategy sees it, so they can only fill on later bars.
+                    self.execution_handler.on_market_event(event)
                     self.strategy.on_market_event(event)
                     self.portfolio.on_market_event(event)
                 elif event.event_type == "SIGNAL":
@@ -0,0 +1,246 @@
+# qmind_quant/simulation/walk_forward.py
+
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import pandas as pd
+
+from qmind_quant.data_management.bar_index import BarIndex
+from qmind_quant.data_management.feature_engineer import (
+    EMBARGO_DAYS,
+    TARGET_HORIZON,
+    FeatureEngineer,
+)
+from qmind_quant.ml_models.model_trainer import (
+    IncrementalTrainer,
+    load_tuned_params,
+    train_xgboost_model,
+)
+
+# Important: We import the function from the script, not the other way around
+from scripts.run_backtest import run_backtest_and_get_curve
+
+# Folds with fewer training rows left after feature engineering are skipped
+MIN_TRAIN_ROWS = 50
+
+
+@dataclass(frozen=True)
+class WalkForwardFold:
+    """
+    The train and test date windows of one walk-forward fold. Training rows
+    run from train_start to label_cutoff, the last date whose label does
+    not look into the test window once purged and embargoed.
+    """
+
+    number: int
+    train_start: pd.Timestamp
+    train_end: pd.Timestamp
+    test_start: pd.Timestamp
+    test_end: pd.Timestamp
+    label_cutoff: pd.Timestamp
+
+
+def make_folds(
+    dates,
+    train_period_days: int,
+    test_period_days: int,
+    horizon: int = TARGET_HORIZON,
+    embargo_days: int = EMBARGO_DAYS,
+) -> list[WalkForwardFold]:
+    """
+    Splits the trading dates into walk-forward folds. The windows are built
+    on indices, not dates, and slide forward by the test period.
+
+    A label at index i looks at the close 'horizon' bars later, so it leaks
+    the test window unless i + horizon < the test start. Those labels are
+    purged, and 'embargo_days' more are dropped before them.
+    """
+    all_dates = pd.to_datetime(sorted(pd.unique(dates)))
+    folds = []
+    start_index = 0
+    while start_index + train_period_days + test_period_days < len(all_dates):
+        train_end_index = start_index + train_period_days
+        test_end_index = train_end_index + test_period_days
+        folds.append(
+            WalkForwardFold(
+                number=len(folds) + 1,
+                train_start=all_dates[start_index],
+                train_end=all_dates[train_end_index],
+                test_start=all_dates[train_end_index],
+                test_end=all_dates[test_end_index],
+                label_cutoff=all_dates[
+                    max(train_end_index - horizon - embargo_days - 1, start_index)
+                ],
+            )
+        )
+        start_index += test_period_days
+    return folds
+
+
+# The market data, features and backtest settings of a worker process, set
+# once by _init_worker so they are not pickled again for every fold
+_worker_state: dict = {}
+
+
+def _init_worker(
+    data_index: BarIndex,
+    feature_index: BarIndex,
+    tickers: list[str],
+    initial_capital: float,
+    params: dict,
+):
+    _worker_state.update(
+        data_index=data_index,
+        feature_index=feature_index,
+        tickers=tickers,
+        initial_capital=initial_capital,
+        params=params,
+    )
+
+
+def _run_fold(fold: WalkForwardFold, model=None) -> pd.DataFrame | None:
+    """
+    Trains a model on the fold's slice of the precomputed features, unless
+    one is given, and backtests it on the test window. Returns the
+    out-of-sample equity curve, or None if the fold is skipped.
+    """
+    data_index = _worker_state["data_index"]
+    print(
+        f"  Fold #{fold.number}: Train {fold.train_start.date()} - "
+        f"{fold.train_end.date()} | Test {fold.test_start.date()} - "
+        f"{fold.test_end.date()}"
+    )
+    # Binary searches on the sorted indexes, not masks over the whole history
+    test_rows = data_index.rows(fold.test_start, fold.test_end)
+    train_feature_df = _worker_state["feature_index"].slice(
+        fold.train_start, fold.label_cutoff
+    )
+    if test_rows.start == test_rows.stop:
+        print(f"  Skipping fold #{fold.number}: Empty data slice.")
+        return None
+    if len(train_feature_df) < MIN_TRAIN_ROWS:
+        print(
+            f"  Skipping fold #{fold.number}: "
+            "Not enough data to create features for training."
+        )
+        return None
+
+    if model is None:
+        model = train_xgboost_model(train_feature_df, _worker_state["params"])
+    return run_backtest_and_get_curve(
+        model=model,
+        data_df=None,
+        tickers=_worker_state["tickers"],
+        initial_capital=_worker_state["initial_capital"],
+        bar_index=data_index,
+        start=fold.test_start,
+        end=fold.test_end,
+    )
+
+
+def stitch_equity_curves(
+    curves: list[pd.DataFrame], initial_capital: float
+) -> pd.DataFrame:
+    """
+    Chains the folds' out-of-sample equity curves into one. Every fold starts
+    again from the initial capital, so the curves' returns are compounded
+    rather than their values concatenated, which would book the reset to
+    the initial capital as a return.
+    """
+    full_curve = pd.concat(curves)
+    full_curve["returns"] = pd.concat(
+        [curve["total_value"].pct_change().fillna(0.0) for curve in curves]
+    )
+    full_curve["total_value"] = initial_capital * (1 + full_curve["returns"]).cumprod()
+    return full_curve
+
+
+def run_walk_forward(
+    full_data_df: pd.DataFrame,
+    train_period_days: int,
+    test_period_days: int,
+    tickers: list[str],
+    initial_capital: float,
+    n_workers: int | None = None,
+    mp_context=None,
+    horizon: int = TARGET_HORIZON,
+    embargo_days: int = EMBARGO_DAYS,
+    trainer: IncrementalTrainer | None = None,
+    params: dict | None = None,
+) -> pd.DataFrame | None:
+    """
+    Runs a walk-forward validation of the ML strategy with the folds
+    spread over a process pool.
+
+    The indicators are causal, so they are computed once over the whole
+    history and each fold trains on a slice of them, with the labels that
+    look into its test window purged and embargoed (see make_folds). The
+    folds are then independent, so each worker trains and backtests whole
+    folds. The bars and features are indexed once (see BarIndex), so a
+    fold's windows are binary searches, and handed to each worker once by
+    the pool's initializer (inherited without a copy where processes fork).
+    Results are collected in fold order, so the stitched curve is the same
+    for any number of workers.
+
+    Args:
+        n_workers (int, optional): Worker processes; defaults to the CPU
+            count. 1 runs the folds in this process.
+        mp_context: The multiprocessing context, e.g. mp.get_context("spawn").
+        horizon (int): How many bars ahead the training labels look.
+        embargo_days (int): Training days dropped after the purged labels.
+        trainer (IncrementalTrainer, optional): Retrain incrementally from
+            fold to fold. Each fold's model then depends on the previous
+            one, so the models are trained in order in this process and
+            only the backtests run in the pool.
+        params (dict, optional): XGBoost hyperparameters overriding
+            XGBOOST_PARAMS; defaults to the tuned ones (see
+            load_tuned_params). An IncrementalTrainer keeps its own.
+
+    Returns:
+        The stitched out-of-sample equity curve, or None if no fold ran.
+    """
+    data_index = BarIndex(full_data_df)
+    folds = make_folds(
+        data_index.calendar,
+        train_period_days,
+        test_period_days,
+        horizon,
+        embargo_days,
+    )
+    n_workers = min(n_workers or os.cpu_count() or 1, max(len(folds), 1))
+    print(f"--- Walk-forward: {len(folds)} folds on {n_workers} worker(s) ---")
+
+    if params is None:
+        params = load_tuned_params()
+    # Split the cores between the workers, so XGBoost does not oversubscribe them
+    params = {**params, "n_jobs": max(1, (os.cpu_count() or 1) // n_workers)}
+    # Features once for the whole history, instead of once per fold
+    feature_index = BarIndex(FeatureEngineer().create_features(full_data_df))
+    init_args = (data_index, feature_index, tickers, initial_capital, params)
+
+    models = [None] * len(folds)
+    if trainer is not None:
+        for i, fold in enumerate(folds):
+            train_feature_df = feature_index.slice(fold.train_start, fold.label_cutoff)
+            if len(train_feature_df) >= MIN_TRAIN_ROWS:
+                models[i] = trainer.fit(train_feature_df)
+
+    if n_workers == 1:
+        _init_worker(*init_args)
+        curves = [_run_fold(fold, model) for fold, model in zip(folds, models)]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=mp_context or mp.get_context(),
+            initializer=_init_worker,
+            initargs=init_args,
+        ) as pool:
+            # map yields results in submission order, whichever fold finishes first
+            curves = list(pool.map(_run_fold, folds, models))
+
+    curves = [curve for curve in curves if curve is not None and not curve.empty]
+    if not curves:
+        return None
+    return stitch_equity_curves(curves, initial_capital)
@@ -1,7 +1,37 @@
 # qmind_quant/strategies/base_strategy.py
 
 from abc import ABC, abstractmethod
-from qmind_quant.core.event_types import MarketEvent
+import pandas as pd
+from qmind_quant.core.event_types import MarketEvent, FillEvent
+
+# The columns of a bar frame, as stored in the Parquet bar store
+BAR_COLUMNS = ["date", "ticker", "open", "high", "low", "close", "volume"]
+
+
+class _DiscardEvents:
+    """Stands in for the event manager while a strategy replays history."""
+
+    def put(self, event):
+        pass
+
+
+def bars_to_events(bars: pd.DataFrame) -> list[MarketEvent]:
+    """Converts a bar frame (BAR_COLUMNS) into MarketEvents, in row order."""
+    return [
+        MarketEvent(*row)
+        for row in bars[BAR_COLUMNS].itertuples(index=False, name=None)
+    ]
+
+
+def events_to_bars(events) -> pd.DataFrame:
+    """Converts MarketEvents back into a bar frame (BAR_COLUMNS)."""
+    return pd.DataFrame(
+        [
+            (e.timestamp, e.ticker, e.open, e.high, e.low, e.close, e.volume)
+            for e in events
+        ],
+        columns=BAR_COLUMNS,
+    )
 
 
 class BaseStrategy(ABC):
@@ -21,3 +51,33 @@ class BaseStrategy(ABC):
         This method must be implemented by all subclasses.
         """
         raise NotImplementedError("Should implement on_market_event()")
+
+    def on_fill_event(self, event: FillEvent):
+        """
+        Actions to be taken on receipt of a FillEvent. Strategies that track
+        their own positions can override this; by default it does nothing.
+        """
+        pass
+
+    @property
+    def warmup_bars(self) -> int:
+        """How many bars per ticker the strategy needs before it can trade."""
+        return 0
+
+    def warm_start(self, bars: pd.DataFrame):
+        """
+        Loads historical bars (BAR_COLUMNS, oldest first) into the strategy's
+        state without generating any signals, so it can trade on the next
+        live bar. By default the bars are replayed through on_market_event;
+        strategies override this to load their buffers in one step.
+        """
+        event_manager, self.event_manager = self.event_manager, _DiscardEvents()
+        try:
+            for event in bars_to_events(bars):
+                self.on_market_event(event)
+        finally:
+            self.event_manager = event_manager
+
+    def recent_bars(self) -> pd.DataFrame:
+        """The bars the strategy currently holds, for a shutdown snapshot."""
+        return pd.DataFrame(columns=BAR_COLUMNS)
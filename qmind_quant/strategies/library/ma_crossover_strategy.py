@@ -25,6 +25,16 @@ class MovingAverageCrossoverStrategy(BaseStrategy):
         # Dictionary to store the last calculated moving averages for each ticker
         self.invested = {ticker: "NONE" for ticker in self.tickers}
 
+    @property
+    def warmup_bars(self) -> int:
+        return self.long_window
+
+    def warm_start(self, bars: pd.DataFrame):
+        """Fills each ticker's price window from history in one step."""
+        for ticker, closes in bars.groupby("ticker", sort=False)["close"]:
+            if ticker in self.prices:
+                self.prices[ticker].extend(closes.tolist())
+
     def on_market_event(self, event: MarketEvent):
         """
         On a new market event, update the price deque and check for a crossover.
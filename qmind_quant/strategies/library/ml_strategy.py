@@ -4,7 +4,11 @@ import joblib
 import pandas as pd
 from collections import deque
 
-from qmind_quant.strategies.base_strategy import BaseStrategy
+from qmind_quant.strategies.base_strategy import (
+    BaseStrategy,
+    bars_to_events,
+    events_to_bars,
+)
 from qmind_quant.core.event_types import MarketEvent, SignalEvent, FillEvent
 
 # Import our own custom indicator functions, making this class self-reliant
@@ -35,6 +39,19 @@ class MLStrategy(BaseStrategy):
         self.bars = {ticker: deque(maxlen=self.data_window) for ticker in self.tickers}
         self.invested = dict.fromkeys(self.tickers, "NONE")
 
+    @property
+    def warmup_bars(self) -> int:
+        return self.data_window
+
+    def warm_start(self, bars: pd.DataFrame):
+        """Fills each ticker's bar window from history in one step."""
+        for ticker, ticker_bars in bars.groupby("ticker", sort=False):
+            if ticker in self.bars:
+                self.bars[ticker].extend(bars_to_events(ticker_bars))
+
+    def recent_bars(self) -> pd.DataFrame:
+        return events_to_bars(e for window in self.bars.values() for e in window)
+
     def _calculate_features(self, ticker: str) -> pd.DataFrame | None:
         """
         Calculates the feature set for the most recent bar of data.
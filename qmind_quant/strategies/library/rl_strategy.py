@@ -5,7 +5,7 @@ import pandas as pd
 from collections import deque
 from stable_baselines3.common.base_class import BaseAlgorithm
 
-from qmind_quant.strategies.base_strategy import BaseStrategy
+from qmind_quant.strategies.base_strategy import BaseStrategy, BAR_COLUMNS
 from qmind_quant.core.event_types import MarketEvent, SignalEvent, FillEvent
 from qmind_quant.analytics.technical_indicators import (
     calculate_ema,
@@ -19,6 +19,9 @@ from qmind_quant.analytics.technical_indicators import (
     calculate_vwap,
 )
 
+# The slowest indicator (the 14-bar ADX) has no value for its first 27 bars
+INDICATOR_WARMUP_BARS = 27
+
 
 class RLStrategy(BaseStrategy):
     """
@@ -43,6 +46,32 @@ class RLStrategy(BaseStrategy):
         self.cash = 100000.0
         self.trading_halted = False
 
+    @property
+    def warmup_bars(self) -> int:
+        # Every row of the lookback window needs all of its indicators
+        return self.lookback_window + INDICATOR_WARMUP_BARS
+
+    def warm_start(self, bars: pd.DataFrame):
+        """Loads each ticker's history into its frame in one step."""
+        for ticker, ticker_bars in bars.groupby("ticker", sort=False):
+            if ticker not in self.data_frames:
+                continue
+            history = ticker_bars.rename(columns={"date": "timestamp"})
+            history["event_type"] = "MARKET"
+            self.data_frames[ticker] = pd.concat(
+                [history, self.data_frames[ticker]], ignore_index=True
+            )
+
+    def recent_bars(self) -> pd.DataFrame:
+        frames = [
+            df.tail(self.warmup_bars).rename(columns={"timestamp": "date"})[BAR_COLUMNS]
+            for df in self.data_frames.values()
+            if not df.empty
+        ]
+        if not frames:
+            return super().recent_bars()
+        return pd.concat(frames, ignore_index=True)
+
     def _get_observation(self, ticker: str) -> np.ndarray | None:
         df = self.data_frames[ticker]
         if len(df) < self.lookback_window:
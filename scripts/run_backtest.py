@@ -1,28 +1,49 @@
 # scripts/run_backtest.py
 
+from collections.abc import Callable
+
 import pandas as pd
 import quantstats as qs
+from qmind_quant.analytics.performance_metrics import sharpe
 from qmind_quant.core.event_manager import EventManager
+from qmind_quant.data_management.bar_index import BarIndex
 from qmind_quant.data_management.data_handler import HistoricalDataHandler
 from qmind_quant.simulation.backtest_engine import BacktestEngine
 from qmind_quant.strategies.library.ml_strategy import MLStrategy
+from qmind_quant.strategies.library.ma_crossover_strategy import (
+    MovingAverageCrossoverStrategy,
+)
 from qmind_quant.portfolio_management.portfolio import Portfolio
 from qmind_quant.execution.execution import SimulatedExecutionHandler
-from qmind_quant.ml_models.model_trainer import train_xgboost_model
+from qmind_quant.execution.cost_models import CostModel
+from qmind_quant.ml_models.model_trainer import load_tuned_params, train_xgboost_model
 from qmind_quant.config.paths import DATA_DIR, REPORTS_DIR, FEATURES_DATA_DIR
 
 
 def run_backtest_and_get_curve(
-    model, data_df: pd.DataFrame, tickers: list[str], initial_capital: float
+    model,
+    data_df: pd.DataFrame | None,
+    tickers: list[str],
+    initial_capital: float,
+    cost_model: CostModel | None = None,
+    bar_index: BarIndex | None = None,
+    start=None,
+    end=None,
 ) -> pd.DataFrame:
     """
     A reusable function to run a backtest and return the full equity curve.
+    The bars come from 'data_df', or from the [start, end] window of
+    'bar_index'.
     """
     event_manager = EventManager()
-    data_handler = HistoricalDataHandler(tickers=tickers, data_df=data_df)
+    data_handler = HistoricalDataHandler(
+        tickers=tickers, data_df=data_df, bar_index=bar_index, start=start, end=end
+    )
     strategy = MLStrategy(tickers=tickers, event_manager=event_manager, model=model)
     portfolio = Portfolio(event_manager, data_handler, initial_capital)
-    execution_handler = SimulatedExecutionHandler(event_manager, data_handler)
+    execution_handler = SimulatedExecutionHandler(
+        event_manager, data_handler, cost_model=cost_model
+    )
 
     engine = BacktestEngine(
         event_manager, data_handler, strategy, portfolio, execution_handler
@@ -31,6 +52,49 @@ def run_backtest_and_get_curve(
     return portfolio.get_equity_curve()
 
 
+def run_single_backtest(
+    data_file: str,
+    tickers: list[str],
+    initial_capital: float,
+    max_drawdown_pct: float,
+    short_window: int,
+    long_window: int,
+    cost_model: CostModel | None = None,
+    callback: Callable | None = None,
+    callback_every: int = 252,
+) -> float:
+    """
+    Runs one Moving Average Crossover backtest and returns its Sharpe Ratio.
+    Used as the objective by the parameter optimization script, which passes
+    a 'callback' to report interim results (see BacktestEngine).
+    """
+    event_manager = EventManager()
+    data_handler = HistoricalDataHandler(tickers=tickers, file_path=data_file)
+    strategy = MovingAverageCrossoverStrategy(
+        tickers, event_manager, short_window=short_window, long_window=long_window
+    )
+    portfolio = Portfolio(
+        event_manager, data_handler, initial_capital, max_drawdown_pct
+    )
+    execution_handler = SimulatedExecutionHandler(
+        event_manager, data_handler, cost_model=cost_model
+    )
+
+    engine = BacktestEngine(
+        event_manager,
+        data_handler,
+        strategy,
+        portfolio,
+        execution_handler,
+        callback=callback,
+        callback_every=callback_every,
+    )
+    engine.run_backtest()
+
+    sharpe_ratio = sharpe(portfolio.get_equity_curve()["returns"])
+    return sharpe_ratio if pd.notna(sharpe_ratio) else 0.0
+
+
 def main():
     """
     Main function to run a single demonstration backtest and generate a report.
@@ -41,7 +105,7 @@ def main():
     full_feature_df = pd.read_parquet(FEATURES_DATA_DIR / "ml_feature_data.parquet")
 
     print("Training model for single run...")
-    model = train_xgboost_model(full_feature_df)
+    model = train_xgboost_model(full_feature_df, load_tuned_params())
 
     print("Running backtest...")
     equity_curve = run_backtest_and_get_curve(
@@ -1,7 +1,10 @@
 # scripts/run_feature_engineering.py
 
+import argparse
 import os
+import shutil
 import pandas as pd
+from qmind_quant.config.paths import FEATURE_STORE_DIR
 from qmind_quant.data_management.feature_engineer import FeatureEngineer
 
 
@@ -9,6 +12,14 @@ def main():
     """
     Main function to run the feature engineering process.
     """
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--partitioned",
+        action="store_true",
+        help="Also write the features partitioned by ticker, for out-of-core training",
+    )
+    args = parser.parse_args()
+
     # --- Configuration ---
     project_root = os.path.join(os.path.dirname(__file__), "..")
     input_file = os.path.join(project_root, "data/processed/us_equities_daily.parquet")
@@ -28,6 +39,13 @@ def main():
 
     print(f"Saving feature-rich data to {output_file}...")
     feature_data.to_parquet(output_file, index=False)
+    if args.partitioned:
+        print(f"Saving ticker partitions to {FEATURE_STORE_DIR}...")
+        # Partitioned writes add files, so a rerun would duplicate every row
+        shutil.rmtree(FEATURE_STORE_DIR, ignore_errors=True)
+        feature_data.to_parquet(
+            FEATURE_STORE_DIR, index=False, partition_cols=["ticker"]
+        )
 
     print("Feature engineering complete.")
     print("\n--- Data Head ---")
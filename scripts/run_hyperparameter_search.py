@@ -0,0 +1,56 @@
+# scripts/run_hyperparameter_search.py
+
+import argparse
+
+from qmind_quant.config.paths import FEATURE_STORE_DIR, TUNED_PARAMS_FILE
+from qmind_quant.optimization.hyperparameter_search import (
+    TUNING_JOURNAL_FILE,
+    save_best_params,
+    tune_xgboost,
+)
+
+
+def main():
+    """
+    Tunes the XGBoost model's hyperparameters by purged time-series
+    cross-validation over the partitioned feature store (see
+    run_feature_engineering.py --partitioned) and saves the best ones,
+    which train_xgboost_model callers pick up with load_tuned_params.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--source", default=str(FEATURE_STORE_DIR))
+    parser.add_argument("--trials", type=int, default=50)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes running trials (default: CPU count)",
+    )
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument(
+        "--journal",
+        default=str(TUNING_JOURNAL_FILE),
+        help="The study's journal; an existing study is resumed",
+    )
+    args = parser.parse_args()
+
+    study = tune_xgboost(
+        args.source,
+        n_trials=args.trials,
+        n_workers=args.workers,
+        n_folds=args.folds,
+        journal_path=args.journal,
+    )
+    pruned = sum(t.state.name == "PRUNED" for t in study.trials)
+
+    print("\n--- Tuning Finished ---")
+    print(f"Trials: {len(study.trials)} ({pruned} pruned)")
+    print(f"Best mean validation log loss: {study.best_value:.4f}")
+    print("Best params:")
+    for key, value in save_best_params(study).items():
+        print(f"  {key}: {value}")
+    print(f"Saved to {TUNED_PARAMS_FILE}")
+
+
+if __name__ == "__main__":
+    main()
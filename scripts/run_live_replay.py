@@ -0,0 +1,134 @@
+# scripts/run_live_replay.py
+
+import argparse
+import asyncio
+import time
+
+from qmind_quant.config.paths import PROCESSED_DATA_DIR
+from qmind_quant.core.event_manager import AsyncEventManager
+from qmind_quant.core.latency import LatencyRecorder
+from qmind_quant.core.live_engine import LiveTradingEngine
+from qmind_quant.data_management.live_data_handler import LiveDataHandler
+from qmind_quant.data_management.price_cache import PriceCache
+from qmind_quant.data_management.redis_publisher import RedisPricePublisher
+from qmind_quant.data_management.replay_stream import (
+    ReplayDataStream,
+    synthetic_bars,
+)
+from qmind_quant.execution.execution import SimulatedExecutionHandler
+from qmind_quant.execution.live_execution import AsyncLiveExecutionHandler
+from qmind_quant.execution.mock_broker import MockBroker
+from qmind_quant.portfolio_management.portfolio import Portfolio
+from qmind_quant.strategies.library.ma_crossover_strategy import (
+    MovingAverageCrossoverStrategy,
+)
+
+
+def main():
+    """
+    Load-tests the live engine offline: replays historical (or synthetic)
+    bars through LiveDataHandler into the full live loop, with simulated
+    execution, and reports throughput, latency and backpressure counters.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--data", default=str(PROCESSED_DATA_DIR / "us_equities_daily.parquet")
+    )
+    parser.add_argument(
+        "--synthetic-symbols",
+        type=int,
+        default=0,
+        help="Replay random-walk bars for this many symbols instead of --data",
+    )
+    parser.add_argument("--synthetic-bars", type=int, default=100)
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=None,
+        help="Replay speed multiplier (default: as fast as possible)",
+    )
+    parser.add_argument(
+        "--fake-redis",
+        action="store_true",
+        help="Use fakeredis (a dev dependency: poetry install --with dev)",
+    )
+    parser.add_argument(
+        "--mock-broker",
+        action="store_true",
+        help="Send orders to a local mock broker through the async live handler",
+    )
+    parser.add_argument(
+        "--broker-latency",
+        type=float,
+        default=0.05,
+        help="Seconds per mock broker call",
+    )
+    args = parser.parse_args()
+
+    if args.synthetic_symbols:
+        stream = ReplayDataStream(
+            synthetic_bars(args.synthetic_symbols, args.synthetic_bars),
+            speed=args.speed,
+        )
+    else:
+        stream = ReplayDataStream.from_parquet(args.data, speed=args.speed)
+    tickers = sorted(stream.bars["ticker"].unique())
+
+    redis_client = None
+    if args.fake_redis:
+        import fakeredis
+
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    event_manager = AsyncEventManager()
+    price_cache = PriceCache(tickers)
+    data_handler = LiveDataHandler(
+        event_manager,
+        tickers,
+        stream=stream,
+        publisher=RedisPricePublisher(redis_client),
+        price_cache=price_cache,
+    )
+    strategy = MovingAverageCrossoverStrategy(tickers, event_manager)
+    portfolio = Portfolio(
+        event_manager,
+        data_handler=None,
+        initial_capital=100000.0,
+        price_cache=price_cache,
+    )
+    if args.mock_broker:
+        broker = MockBroker(latency=args.broker_latency, price_source=price_cache)
+        execution_handler = AsyncLiveExecutionHandler(
+            event_manager, client=broker, poll_interval=args.broker_latency
+        )
+    else:
+        execution_handler = SimulatedExecutionHandler(event_manager, price_cache)
+    latency_recorder = LatencyRecorder()
+
+    engine = LiveTradingEngine(
+        event_manager,
+        data_handler,
+        strategy,
+        portfolio,
+        execution_handler,
+        offload_strategy=False,
+        latency_recorder=latency_recorder,
+    )
+
+    start = time.perf_counter()
+    asyncio.run(engine.run())
+    elapsed = time.perf_counter() - start
+
+    print(f"\n--- Replayed {stream.bars_sent:,} bars for {len(tickers)} symbols ---")
+    print(f"  Wall time: {elapsed:.2f}s ({stream.bars_sent / elapsed:,.0f} bars/s)")
+    print(f"  Event manager: {event_manager.stats()}")
+    if args.mock_broker:
+        print(
+            f"  Broker: {execution_handler.orders_submitted} orders, "
+            f"{broker.max_in_flight} calls in flight at most"
+        )
+    print(f"  Final equity: {portfolio.cash + portfolio.market_value:,.2f}")
+
+
+if __name__ == "__main__":
+    main()
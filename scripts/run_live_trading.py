@@ -1,11 +1,25 @@
 # scripts/run_live_trading.py
 
-import time
-import threading
+import os
+import argparse
+import asyncio
+import joblib
+import redis.asyncio as aioredis
 from dotenv import load_dotenv
-from qmind_quant.core.event_manager import EventManager
+from qmind_quant.core.event_manager import AsyncEventManager
+from qmind_quant.core.latency import LatencyRecorder
+from qmind_quant.core.live_engine import LiveTradingEngine
+from qmind_quant.core.sharded_engine import ShardedLiveEngine
+from qmind_quant.data_management.bootstrap import (
+    warm_start_strategies,
+    save_bar_snapshot,
+)
 from qmind_quant.data_management.live_data_handler import LiveDataHandler
-from qmind_quant.execution.live_execution import LiveExecutionHandler
+from qmind_quant.data_management.price_cache import PriceCache
+from qmind_quant.execution.live_execution import (
+    AsyncLiveExecutionHandler,
+    LiveExecutionHandler,
+)
 from qmind_quant.strategies.library.ml_strategy import (
     MLStrategy,
 )  # Using our ML strategy
@@ -16,58 +30,129 @@ from qmind_quant.portfolio_management.portfolio import (
 # Load environment variables
 load_dotenv()
 
+# --- Configuration ---
+TICKERS = ["AAPL", "GOOG"]
+MODEL_PATH = "qmind_quant/ml_models/models/random_forest_v1.joblib"
+# The notional value of each new position, sized from the live price
+ORDER_VALUE = 5_000.0
+# The stream delivers one-minute bars, so the live strategies warm up from
+# the shutdown snapshot only, never from the daily bar store
+WARM_START_STORE = None
+
+
+# The factories below build each process's components in sharded mode.
+def make_strategy(tickers, event_manager):
+    strategy = MLStrategy(tickers, event_manager, joblib.load(MODEL_PATH))
+    warm_start_strategies([strategy], store_path=WARM_START_STORE)
+    return strategy
+
+
+def make_portfolio(event_manager, price_cache):
+    return Portfolio(
+        event_manager,
+        data_handler=None,
+        initial_capital=100000.0,
+        price_cache=price_cache,
+        order_value=ORDER_VALUE,
+    )
+
+
+def make_execution(event_manager, price_cache):
+    return LiveExecutionHandler(price_cache=price_cache, event_manager=event_manager)
+
+
+def run_sharded(tickers: list[str], n_shards: int):
+    """
+    Runs the stream in this process and the strategies in 'n_shards' worker
+    processes, with one process owning the portfolio and order execution.
+    """
+    event_manager = AsyncEventManager()
+    price_cache = PriceCache(tickers, shared=True)
+    data_handler = LiveDataHandler(event_manager, tickers, price_cache=price_cache)
+    engine = ShardedLiveEngine(
+        event_manager,
+        data_handler,
+        price_cache,
+        make_strategy,
+        make_portfolio,
+        make_execution,
+        n_shards=n_shards,
+    )
+    try:
+        print(asyncio.run(engine.run()))
+    except KeyboardInterrupt:
+        print("\n--- Halting Sharded Live Engine ---")
+    finally:
+        price_cache.close()
+        price_cache.unlink()
+
 
 def main():
-    # --- Configuration ---
-    tickers = ["AAPL", "GOOG"]
-    model_path = "qmind_quant/ml_models/models/random_forest_v1.joblib"
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Run strategies in this many worker processes (1 = single process)",
+    )
+    args = parser.parse_args()
+
+    tickers = TICKERS
+    model_path = MODEL_PATH
+    if args.shards > 1:
+        run_sharded(tickers, args.shards)
+        return
 
     # --- Initialization ---
-    event_manager = EventManager()
+    event_manager = AsyncEventManager()
+
+    # The data handler writes every bar into a shared price cache, which the
+    # portfolio and execution handler read for live PnL, sizing and risk.
+    price_cache = PriceCache(tickers)
 
     # We use live components now
-    data_handler = LiveDataHandler(event_manager, tickers)
-    execution_handler = LiveExecutionHandler()
+    data_handler = LiveDataHandler(event_manager, tickers, price_cache=price_cache)
+    execution_handler = AsyncLiveExecutionHandler(
+        event_manager, price_cache=price_cache
+    )
 
     # The Strategy and Portfolio remain largely the same
-    # NOTE: The portfolio's data_handler dependency for price is a challenge in live trading.
-    # A more advanced system would have a dedicated price cache. For now, we omit it.
-    # This means our live position sizing and PnL tracking will be simplified.
-    portfolio = Portfolio(event_manager, data_handler=None, initial_capital=100000.0)
-    strategy = MLStrategy(tickers, event_manager, model_path)
-
-    # --- Start Data Stream in a Separate Thread ---
-    data_thread = threading.Thread(target=data_handler.run)
-    data_thread.start()
-
-    print("--- Starting Live Trading Engine ---")
-
-    # --- Main Event Loop ---
-    while True:
-        try:
-            event = event_manager.get()  # This will wait until an event is available
-
-            if event.event_type == "MARKET":
-                strategy.on_market_event(event)
-                # In a live system, portfolio updates are usually driven by fills, not market data
-                # portfolio.on_market_event(event)
-
-            elif event.event_type == "SIGNAL":
-                portfolio.on_signal(event)
-
-            elif event.event_type == "ORDER":
-                execution_handler.on_order(event)
-
-            # Note: We are not handling FILL events from the broker in this version
-
-        except KeyboardInterrupt:
-            print("\n--- Halting Live Trading Engine ---")
-            data_handler.stream.stop()
-            data_thread.join()
-            break
-        except Exception as e:
-            print(f"!!! An error occurred: {e} !!!")
-            time.sleep(1)
+    portfolio = Portfolio(
+        event_manager,
+        data_handler=None,
+        initial_capital=100000.0,
+        price_cache=price_cache,
+        order_value=ORDER_VALUE,
+    )
+    strategy = MLStrategy(tickers, event_manager, joblib.load(model_path))
+
+    # Load recent history into the strategy before the stream connects, so it
+    # can trade on the first live bar instead of waiting to fill its window.
+    warm_start_strategies([strategy], store_path=WARM_START_STORE)
+
+    # Per-stage and tick-to-order latency, published to Redis for monitoring
+    redis_host = os.getenv("REDIS_HOST", "localhost")
+    latency_recorder = LatencyRecorder(
+        aioredis.Redis(host=redis_host, port=6379, db=0, decode_responses=True)
+    )
+
+    # --- Run the data stream, strategy, portfolio and execution on one event loop ---
+    # Model inference is offloaded to a worker thread so it cannot stall the stream.
+    engine = LiveTradingEngine(
+        event_manager,
+        data_handler,
+        strategy,
+        portfolio,
+        execution_handler,
+        latency_recorder=latency_recorder,
+    )
+    try:
+        asyncio.run(engine.run())
+    except KeyboardInterrupt:
+        print("\n--- Halting Live Trading Engine ---")
+    finally:
+        # Lets the next start warm up from the bars held at shutdown
+        save_bar_snapshot([strategy])
 
 
 if __name__ == "__main__":
@@ -2,7 +2,14 @@
 
 import os
 import optuna
+from qmind_quant.optimization.pruning import OptunaPruningCallback
 from scripts.run_backtest import run_single_backtest
+from qmind_quant.execution.cost_models import (
+    CompositeCostModel,
+    BpsCommission,
+    SpreadCost,
+    SquareRootImpact,
+)
 
 # --- Configuration ---
 PROJECT_ROOT = os.path.join(os.path.dirname(__file__), "..")
@@ -11,6 +18,15 @@ TICKERS = ["AAPL", "GOOG"]
 INITIAL_CAPITAL = 100000.0
 MAX_DRAWDOWN_PCT = 0.20  # Loosen drawdown for optimization runs
 N_TRIALS = 50  # The number of different parameter combinations to test
+# Trials report their interim Sharpe Ratio once per year of data, and stop
+# early if it is below the median of earlier trials at the same point
+REPORT_EVERY = 252
+# Realistic trading costs, so that high-turnover parameters are not favoured
+COST_MODEL = CompositeCostModel(
+    BpsCommission(bps=1.0, minimum=1.0),
+    SpreadCost(spread_bps=2.0),
+    SquareRootImpact(coefficient=0.1, daily_volatility=0.02),
+)
 
 
 def objective(trial: optuna.Trial) -> float:
@@ -37,6 +53,9 @@ def objective(trial: optuna.Trial) -> float:
         max_drawdown_pct=MAX_DRAWDOWN_PCT,
         short_window=short_window,
         long_window=long_window,
+        cost_model=COST_MODEL,
+        callback=OptunaPruningCallback(trial, metric="sharpe"),
+        callback_every=REPORT_EVERY,
     )
 
     print(f"Trial #{trial.number} Finished. Sharpe Ratio: {sharpe_ratio:.2f}")
@@ -46,13 +65,22 @@ def objective(trial: optuna.Trial) -> float:
 
 def main():
     # We want to maximize the Sharpe Ratio, so the direction is 'maximize'
-    study = optuna.create_study(direction="maximize")
+    study = optuna.create_study(
+        direction="maximize",
+        # Steps are periods and pruning starts at the warm-up step, so this
+        # skips the first, noisiest year's report (at step REPORT_EVERY)
+        pruner=optuna.pruners.MedianPruner(
+            n_startup_trials=5, n_warmup_steps=REPORT_EVERY + 1
+        ),
+    )
 
     # Start the optimization process
     study.optimize(objective, n_trials=N_TRIALS)
 
     print("\n--- Optimization Finished ---")
     print(f"Number of finished trials: {len(study.trials)}")
+    pruned = study.get_trials(states=(optuna.trial.TrialState.PRUNED,))
+    print(f"Number of pruned trials: {len(pruned)}")
     print("Best trial:")
     trial = study.best_trial
 
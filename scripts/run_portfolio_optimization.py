@@ -1,62 +1,74 @@
 # scripts/run_portfolio_optimization.py
 
-import numpy as np
-import pyswarms as ps
+import argparse
+
+from qmind_quant.optimization.allocation import METHODS, AllocationEngine
 from qmind_quant.optimization.portfolio_optimizer import PortfolioOptimizer
+from qmind_quant.execution.cost_models import (
+    CompositeCostModel,
+    BpsCommission,
+    SpreadCost,
+    SquareRootImpact,
+)
 
 
 def objective_function(weights_array, optimizer_instance):
     """
     This is the function the swarm will try to minimize.
     It takes an array of weights from the swarm and returns the score
-    from our portfolio evaluator.
+    from our portfolio evaluator, scoring every particle in one call.
     """
-    scores = []
-    for weights in weights_array:
-        # The swarm doesn't know that weights must sum to 1, so we normalize them.
-        normalized_weights = weights / np.sum(weights)
-        score = optimizer_instance.evaluate(normalized_weights)
-        scores.append(score)
-    return np.array(scores)
+    # The swarm doesn't know that weights must sum to 1, so we normalize them.
+    normalized_weights = weights_array / weights_array.sum(axis=1, keepdims=True)
+    return optimizer_instance.evaluate_many(normalized_weights)
 
 
 def main():
     """
-    Main function to set up and run the Particle Swarm Optimization.
+    Main function to set up the strategies and solve their allocation.
     """
-    print("--- Initializing Portfolio Optimizer ---")
-    optimizer_instance = PortfolioOptimizer(
-        tickers=["AAPL", "GOOG"], initial_capital=100000.0
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--method",
+        choices=METHODS,
+        default="max_sharpe",
+        help="Allocation solver; 'pso' runs Particle Swarm Optimization",
     )
-
-    # --- PSO Configuration ---
-    options = {"c1": 0.5, "c2": 0.3, "w": 0.9}
-    n_particles = 10
-    dimensions = 2
-
-    optimizer = ps.single.GlobalBestPSO(
-        n_particles=n_particles, dimensions=dimensions, options=options
+    parser.add_argument(
+        "--allow-short",
+        action="store_true",
+        help="Allow negative weights (max_sharpe / min_variance only)",
     )
+    args = parser.parse_args()
 
-    print("\n--- Starting Particle Swarm Optimization ---")
-
-    # --- THIS IS THE FIX ---
-    # We pass our extra arguments directly to the optimize method,
-    # and pyswarms will forward them to our objective_function.
-    best_cost, best_pos = optimizer.optimize(
-        objective_func=objective_function,
-        iters=50,
-        optimizer_instance=optimizer_instance,  # Pass directly, not in a 'kwargs' dict
+    print("--- Initializing Portfolio Optimizer ---")
+    # Backtest the strategies with realistic trading costs, not a flat commission
+    cost_model = CompositeCostModel(
+        BpsCommission(bps=1.0, minimum=1.0),
+        SpreadCost(spread_bps=2.0),
+        SquareRootImpact(coefficient=0.1, daily_volatility=0.02),
+    )
+    optimizer_instance = PortfolioOptimizer(
+        tickers=["AAPL", "GOOG"], initial_capital=100000.0, cost_model=cost_model
     )
+    engine = AllocationEngine(optimizer_instance)
+    print(f"Ledoit-Wolf shrinkage intensity: {engine.shrinkage:.3f}")
 
-    # Normalize the final best position to get the allocation
-    final_allocation = best_pos / np.sum(best_pos)
+    print(f"\n--- Solving the '{args.method}' allocation ---")
+    kwargs = {}
+    if args.method in ("max_sharpe", "min_variance"):
+        kwargs["long_only"] = not args.allow_short
+    elif args.method == "pso":
+        kwargs["objective"] = lambda w: objective_function(w, optimizer_instance)
+    allocation = engine.solve(args.method, **kwargs)
 
     print("\n--- Optimization Complete ---")
-    print(f"Best (Negative) Sharpe Ratio Found: {best_cost:.4f}")
+    print(f"Expected annual return: {allocation.expected_return:.2%}")
+    print(f"Expected annual volatility: {allocation.volatility:.2%}")
+    print(f"Expected Sharpe Ratio: {allocation.sharpe:.4f}")
     print("\nOptimal Portfolio Allocation:")
-    print(f"  - XGBoost Strategy: {final_allocation[0]:.2%}")
-    print(f"  - Buy-and-Hold Strategy: {final_allocation[1]:.2%}")
+    for name, weight in zip(allocation.names, allocation.weights):
+        print(f"  - {name}: {weight:.2%}")
 
 
 if __name__ == "__main__":
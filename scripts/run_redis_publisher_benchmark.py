@@ -0,0 +1,107 @@
+# scripts/run_redis_publisher_benchmark.py
+
+import argparse
+import asyncio
+import os
+import time
+
+import redis.asyncio as aioredis
+
+from qmind_quant.data_management.redis_publisher import (
+    RedisPricePublisher,
+    LIVE_PRICES_KEY,
+)
+
+
+async def monitor_loop_lag(interval: float, lags: list[float], stop: asyncio.Event):
+    """Measures how late the event loop wakes a task that sleeps for 'interval'."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def run_benchmark(make_client, mode: str, n_symbols: int, n_rounds: int):
+    """
+    Simulates 'n_rounds' bars for each of 'n_symbols' symbols arriving on the
+    event loop, publishing every price either directly (one awaited HSET per
+    bar) or through the batched RedisPricePublisher.
+    """
+    # Clients are bound to the loop they connect on, so each run makes its own
+    redis_client = make_client()
+    symbols = [f"SYM{i:05d}" for i in range(n_symbols)]
+    publisher = RedisPricePublisher(redis_client)
+    await publisher.start()
+
+    lags = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(monitor_loop_lag(0.001, lags, stop))
+
+    start = time.perf_counter()
+    for round_number in range(n_rounds):
+        for i, symbol in enumerate(symbols):
+            price = 100.0 + round_number + i * 1e-3
+            if mode == "direct":
+                await redis_client.hset(LIVE_PRICES_KEY, symbol, price)
+            else:
+                publisher.publish(symbol, price)
+        # Yield to the loop between bursts, as a WebSocket read would
+        await asyncio.sleep(0)
+    await publisher.stop()
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await monitor
+
+    updates = n_symbols * n_rounds
+    lags.sort()
+    print(f"\n--- Mode: {mode} ---")
+    print(f"  Updates: {updates:,} in {elapsed:.3f}s ({updates / elapsed:,.0f}/s)")
+    if lags:
+        p99 = lags[int(0.99 * (len(lags) - 1))]
+        print(f"  Loop lag: p99 {p99 * 1e3:.2f} ms, max {lags[-1] * 1e3:.2f} ms")
+    if mode == "batched":
+        print(
+            f"  Flushes: {publisher.flushes}, coalesced: {publisher.updates_coalesced:,}, "
+            f"slowest flush: {publisher.max_flush_seconds * 1e3:.2f} ms"
+        )
+
+
+def main():
+    """
+    Compares per-bar Redis writes with the batched publisher, measuring
+    throughput and event-loop lag. Uses a local Redis server by default, or
+    an in-process fakeredis server with --fake.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbols", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument(
+        "--fake",
+        action="store_true",
+        help="Use fakeredis (a dev dependency: poetry install --with dev)",
+    )
+    args = parser.parse_args()
+
+    if args.fake:
+        import fakeredis
+
+        server = fakeredis.FakeServer()
+
+        def make_client():
+            return fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+
+    else:
+        redis_host = os.getenv("REDIS_HOST", "localhost")
+
+        def make_client():
+            return aioredis.Redis(
+                host=redis_host, port=6379, db=0, decode_responses=True
+            )
+
+    for mode in ("direct", "batched"):
+        asyncio.run(run_benchmark(make_client, mode, args.symbols, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
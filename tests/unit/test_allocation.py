@@ -0,0 +1,59 @@
+# tests/unit/test_allocation.py
+
+import numpy as np
+import pandas as pd
+from sklearn.covariance import ledoit_wolf
+
+from qmind_quant.optimization.allocation import (
+    AllocationEngine,
+    ledoit_wolf_covariance,
+)
+from qmind_quant.optimization.portfolio_optimizer import PortfolioOptimizer
+
+
+def _engine(n_strategies=12, n_days=500, seed=11):
+    rng = np.random.default_rng(seed)
+    factor = rng.normal(0, 0.01, (n_days, 1))
+    returns = (
+        rng.normal(2e-4, 4e-4, n_strategies)
+        + factor * rng.uniform(0.2, 1.0, n_strategies)
+        + rng.normal(0, 0.01, (n_days, n_strategies))
+        * rng.uniform(0.5, 2, n_strategies)
+    )
+    names = [f"s{i}" for i in range(n_strategies)]
+    optimizer = PortfolioOptimizer.from_returns(pd.DataFrame(returns, columns=names))
+    return AllocationEngine(optimizer), returns
+
+
+def test_ledoit_wolf_matches_sklearn():
+    _, returns = _engine()
+    covariance, shrinkage = ledoit_wolf_covariance(returns)
+    expected_covariance, expected_shrinkage = ledoit_wolf(returns)
+    np.testing.assert_allclose(covariance, expected_covariance, rtol=1e-10)
+    assert abs(shrinkage - expected_shrinkage) < 1e-12
+
+
+def test_long_only_solvers_beat_random_allocations():
+    engine, _ = _engine()
+    candidates = np.random.default_rng(0).dirichlet(np.ones(12), size=20_000)
+
+    max_sharpe = engine.solve("max_sharpe")
+    min_variance = engine.solve("min_variance")
+    for allocation in (max_sharpe, min_variance):
+        assert np.all(allocation.weights >= 0)
+        assert abs(allocation.weights.sum() - 1) < 1e-9
+
+    cov, mean = engine.covariance, engine.mean
+    sharpes = (candidates @ mean) / np.sqrt(
+        np.einsum("pk,kl,pl->p", candidates, cov, candidates)
+    )
+    assert engine._sharpe(max_sharpe.weights) >= sharpes.max() - 1e-9
+    variances = np.einsum("pk,kl,pl->p", candidates, cov, candidates)
+    assert min_variance.weights @ cov @ min_variance.weights <= variances.min()
+
+
+def test_risk_parity_equalizes_risk_contributions():
+    engine, _ = _engine()
+    weights = engine.solve("risk_parity").weights
+    contributions = weights * (engine.covariance @ weights)
+    np.testing.assert_allclose(contributions, contributions.mean(), rtol=1e-6)
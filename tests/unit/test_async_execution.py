@@ -0,0 +1,116 @@
+# tests/unit/test_async_execution.py
+
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from qmind_quant.core.event_manager import EventManager
+from qmind_quant.core.event_types import OrderEvent
+from qmind_quant.execution.live_execution import (
+    AsyncLiveExecutionHandler,
+    _is_retryable,
+)
+from qmind_quant.execution.mock_broker import MockBroker, MockBrokerError
+
+
+def test_burst_is_submitted_concurrently_with_retries_and_tracked_to_fills():
+    n_orders, latency = 40, 0.02
+    broker = MockBroker(latency=latency, fill_delay=0.03, fail_first=3)
+    event_manager = EventManager()
+    handler = AsyncLiveExecutionHandler(
+        event_manager,
+        client=broker,
+        max_concurrency=8,
+        backoff=0.001,
+        poll_interval=0.01,
+    )
+    orders = [
+        OrderEvent(datetime(2025, 1, 2), f"T{i}", "MKT", "SELL", 10)
+        for i in range(n_orders)
+    ]
+
+    async def liquidate():
+        for order in orders:
+            await handler.on_order(order)
+        return await handler.drain(timeout=10.0)
+
+    start = time.perf_counter()
+    assert asyncio.run(liquidate())
+    elapsed = time.perf_counter() - start
+
+    # Submitting one round-trip at a time would take n_orders * latency
+    assert elapsed < n_orders * latency
+    assert 1 < broker.max_in_flight <= 8
+    # The failed submissions were retried, without creating duplicate orders
+    assert handler.retries == 3
+    assert handler.orders_submitted == n_orders == len(broker.orders)
+
+    fills = [event_manager.get() for _ in range(n_orders)]
+    assert event_manager.empty()
+    assert sorted(fill.ticker for fill in fills) == sorted(o.ticker for o in orders)
+    assert all(f.direction == "SELL" and f.quantity == 10 for f in fills)
+    assert all(f.fill_price == 100.0 for f in fills)
+    assert not handler.busy
+
+
+@pytest.mark.parametrize(
+    "error, retryable",
+    [
+        (MockBrokerError("rate limited", 429), True),
+        (MockBrokerError("unavailable", 503), True),
+        (ConnectionError("reset"), True),
+        (TimeoutError("timed out"), True),
+        (MockBrokerError("insufficient buying power", 403), False),
+        (ValueError("bad quantity"), False),
+        (AttributeError("bug"), False),
+    ],
+)
+def test_only_transient_errors_are_retried(error, retryable):
+    assert _is_retryable(error) == retryable
+
+
+def test_fractional_fills_are_not_truncated_and_close_stops_threads():
+    broker = MockBroker(latency=0.0)
+    event_manager = EventManager()
+    handler = AsyncLiveExecutionHandler(
+        event_manager, client=broker, poll_interval=0.01
+    )
+
+    async def trade():
+        await handler.on_order(
+            OrderEvent(datetime(2025, 1, 2), "AAPL", "MKT", "BUY", 2.5)
+        )
+        return await handler.drain(timeout=5.0)
+
+    assert asyncio.run(trade())
+    assert event_manager.get().quantity == 2.5
+
+    handler.close()
+    with pytest.raises(RuntimeError):
+        handler._executor.submit(time.sleep, 0)
+
+
+def test_drain_timeout_does_not_lose_orders_in_flight():
+    broker = MockBroker(latency=0.1, fill_delay=60.0)
+    event_manager = EventManager()
+    handler = AsyncLiveExecutionHandler(
+        event_manager, client=broker, poll_interval=60.0
+    )
+    orders = [
+        OrderEvent(datetime(2025, 1, 2), f"T{i}", "MKT", "BUY", 10) for i in range(4)
+    ]
+
+    async def drain_too_early():
+        for order in orders:
+            await handler.on_order(order)
+        idle = await handler.drain(timeout=0.02)
+        # The submissions were not cancelled; let them reach the broker
+        await asyncio.wait(set(handler._submissions))
+        handler._poll_task.cancel()
+        return idle
+
+    assert not asyncio.run(drain_too_early())
+    assert handler.orders_submitted == len(orders) == len(broker.orders)
+    assert set(handler.open_orders) == set(broker.orders)
@@ -0,0 +1,54 @@
+# tests/unit/test_bar_index.py
+
+import pandas as pd
+
+from qmind_quant.data_management.bar_index import BarIndex
+from qmind_quant.data_management.data_handler import HistoricalDataHandler
+from qmind_quant.data_management.replay_stream import synthetic_bars
+
+
+def test_slices_match_boolean_masks():
+    bars = synthetic_bars(n_symbols=4, n_bars=60, freq="B", seed=1)
+    bars = bars.sample(frac=1.0, random_state=0)  # Any input order
+    index = BarIndex(bars)
+    start, end = pd.Timestamp("2025-01-10"), pd.Timestamp("2025-02-14")
+
+    def expected(tickers):
+        mask = (bars["date"] >= start) & (bars["date"] <= end)
+        mask &= bars["ticker"].isin(tickers)
+        return bars[mask].sort_values(["date", "ticker"]).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(
+        index.slice(start, end).reset_index(drop=True), expected(index.tickers)
+    )
+    subset = ["SYM00003", "SYM00001"]
+    pd.testing.assert_frame_equal(
+        index.slice(start, end, subset).reset_index(drop=True), expected(subset)
+    )
+    assert index.calendar.is_monotonic_increasing
+    assert len(index.calendar) == 60
+    assert len(index.ticker_rows("SYM00002", end=index.calendar[6])) == 7
+    assert index.slice(end=pd.Timestamp("2024-12-31")).empty
+    assert index.slice(start, end, ["UNKNOWN"]).empty
+
+
+def test_data_handler_replays_a_window_of_a_bar_index():
+    bars = synthetic_bars(n_symbols=3, n_bars=20, freq="B", seed=2)
+    index = BarIndex(bars)
+    start, end = index.calendar[5], index.calendar[9]
+    handler = HistoricalDataHandler(
+        ["SYM00000", "SYM00002"], bar_index=index, start=start, end=end
+    )
+    mask = (bars["date"] >= start) & (bars["date"] <= end)
+    reference = HistoricalDataHandler(
+        ["SYM00000", "SYM00002"], data_df=bars[mask].reset_index(drop=True)
+    )
+
+    def replay(data_handler):
+        events = []
+        while (event := data_handler.stream_next_bar()) is not None:
+            events.append((event.timestamp, event.ticker, event.close))
+        return events
+
+    assert replay(handler) == replay(reference)
+    assert handler.start_date == start
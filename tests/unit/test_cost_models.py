@@ -0,0 +1,43 @@
+# tests/unit/test_cost_models.py
+
+import numpy as np
+import pytest
+
+from qmind_quant.execution.cost_models import (
+    CompositeCostModel,
+    BpsCommission,
+    FixedCommission,
+    SpreadCost,
+    SquareRootImpact,
+)
+
+
+def test_composite_model_prices_a_batch_in_one_call():
+    model = CompositeCostModel(
+        FixedCommission(1.0),
+        BpsCommission(bps=10.0),
+        SpreadCost(spread_bps=20.0),
+        SquareRootImpact(coefficient=1.0, daily_volatility=0.02),
+    )
+    prices = np.array([100.0, 100.0, 50.0])
+    quantities = np.array([100, -100, 0])
+    volumes = np.array([10_000, 10_000, 10_000])
+
+    fill_prices, commissions = model.apply(prices, quantities, volumes)
+
+    # Half spread = 0.10, impact = 1.0 * 0.02 * sqrt(100 / 10_000) * 100 = 0.20
+    assert fill_prices == pytest.approx([100.30, 99.70, 50.0])
+    # $1 fixed + 10 bps of $10,000 notional; nothing for an empty order
+    assert commissions == pytest.approx([11.0, 11.0, 0.0])
+    assert model.total_cost(prices, quantities, volumes) == pytest.approx(
+        [41.0, 41.0, 0.0]
+    )
+
+
+def test_models_broadcast_over_a_trade_matrix():
+    model = SpreadCost(spread_bps=10.0)
+    prices = np.full((4, 3), 20.0)
+    trades = np.array([[10, -10, 0]] * 4)
+    costs = model.total_cost(prices, trades)
+    assert costs.shape == (4, 3)
+    assert costs[0] == pytest.approx([0.1, 0.1, 0.0])
@@ -0,0 +1,33 @@
+# tests/unit/test_latency.py
+
+import numpy as np
+
+from qmind_quant.core.latency import LatencyHistogram, LatencyRecorder
+
+
+def test_histogram_percentiles_are_within_bucket_precision():
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(mean=11, sigma=1.5, size=50_000).astype(np.int64)
+    histogram = LatencyHistogram()
+    for value in values.tolist():
+        histogram.record(value)
+
+    sorted_values = np.sort(values)
+    for quantile in (0.5, 0.99, 0.999):
+        exact = sorted_values[int(np.ceil(quantile * len(values))) - 1]
+        estimate = histogram.percentile(quantile)
+        assert abs(estimate - exact) <= exact / 64 + 1
+    assert histogram.percentile(1.0) == values.max()
+    assert histogram.count == len(values)
+
+
+def test_recorder_snapshot_reports_microseconds():
+    recorder = LatencyRecorder()
+    for value in (1_000, 2_000, 3_000):
+        recorder.record("strategy", value)
+
+    snapshot = recorder.snapshot()
+    assert snapshot["strategy"]["count"] == 3
+    assert 2.0 <= snapshot["strategy"]["p50_us"] <= 2.0 * (1 + 1 / 64)
+    assert snapshot["strategy"]["max_us"] == 3.0
+    assert snapshot["execution"]["p99_us"] is None
@@ -0,0 +1,196 @@
+# tests/unit/test_live_engine.py
+
+import asyncio
+import dataclasses
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from qmind_quant.core.event_manager import AsyncEventManager
+from qmind_quant.core.event_types import (
+    FillEvent,
+    MarketEvent,
+    OrderEvent,
+    SignalEvent,
+)
+from qmind_quant.core.latency import LatencyRecorder
+from qmind_quant.core.live_engine import LiveTradingEngine
+from qmind_quant.data_management.live_data_handler import LiveDataHandler
+from qmind_quant.data_management.redis_publisher import RedisPricePublisher
+from qmind_quant.portfolio_management.portfolio import Portfolio
+from qmind_quant.strategies.library.ma_crossover_strategy import (
+    MovingAverageCrossoverStrategy,
+)
+
+
+class FakeDataStream:
+    """
+    Plays a fixed list of bars through the StockDataStream interface. Given an
+    event manager, it waits for the engine to pick up each bar before sending
+    the next, like a real feed that sends one bar a minute.
+    """
+
+    def __init__(self, bars, event_manager=None):
+        self.bars = bars
+        self.event_manager = event_manager
+        self.handler = None
+
+    def subscribe_bars(self, handler, *symbols):
+        self.handler = handler
+
+    async def _run_forever(self):
+        for bar in self.bars:
+            await self.handler(bar)
+            await asyncio.sleep(0)
+            while self.event_manager is not None and not self.event_manager.empty():
+                await asyncio.sleep(0.001)
+
+    async def stop_ws(self):
+        pass
+
+
+class FakeRedis:
+    """The subset of the asyncio Redis client used by RedisPricePublisher."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.pipelines_executed = 0
+
+    async def delete(self, key):
+        self.hashes.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.commands = []
+
+    def hset(self, key, mapping):
+        self.commands.append((key, mapping))
+
+    async def execute(self):
+        self.redis_client.pipelines_executed += 1
+        for key, mapping in self.commands:
+            self.redis_client.hashes.setdefault(key, {}).update(mapping)
+
+
+class FakeBroker:
+    """Fills every order immediately at the last price it saw for the ticker."""
+
+    def __init__(self, event_manager, prices):
+        self.event_manager = event_manager
+        self.prices = prices
+        self.orders = []
+
+    async def on_order(self, event: OrderEvent):
+        self.orders.append(event)
+        await asyncio.sleep(0)  # Simulate the network round-trip
+        self.event_manager.put(
+            FillEvent(
+                event.timestamp,
+                event.ticker,
+                event.direction,
+                event.quantity,
+                self.prices[event.ticker],
+            )
+        )
+
+
+def test_live_engine_runs_end_to_end_against_fake_feed_and_broker():
+    closes = [100, 101, 102, 110, 120]
+    bars = [
+        SimpleNamespace(
+            symbol="TEST",
+            timestamp=datetime(2025, 1, 2, 9, 30) + timedelta(minutes=i),
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=1000,
+        )
+        for i, close in enumerate(closes)
+    ]
+
+    event_manager = AsyncEventManager()
+    redis_client = FakeRedis()
+    publisher = RedisPricePublisher(redis_client, flush_interval=60.0)
+    data_handler = LiveDataHandler(
+        event_manager,
+        ["TEST"],
+        stream=FakeDataStream(bars, event_manager),
+        publisher=publisher,
+    )
+    strategy = MovingAverageCrossoverStrategy(
+        ["TEST"], event_manager, short_window=2, long_window=4
+    )
+    portfolio = Portfolio(event_manager, data_handler=None, initial_capital=10_000.0)
+    broker = FakeBroker(event_manager, {"TEST": closes[-1]})
+
+    recorder = LatencyRecorder()
+    engine = LiveTradingEngine(
+        event_manager,
+        data_handler,
+        strategy,
+        portfolio,
+        broker,
+        latency_recorder=recorder,
+    )
+    asyncio.run(engine.run())
+
+    assert [order.direction for order in broker.orders] == ["BUY"]
+    assert portfolio.current_holdings == {"TEST": 10}
+    assert portfolio.cash == 10_000.0 - 10 * closes[-1]
+    # All five updates were coalesced into the final flush on shutdown
+    assert redis_client.hashes["qmind:live_prices"]["TEST"] == closes[-1]
+    assert redis_client.pipelines_executed == 1
+    assert publisher.updates_coalesced == len(closes) - 1
+    # The one order was timed from the bar that triggered it
+    latency = recorder.snapshot()
+    assert latency["tick_to_order"]["count"] == 1
+    assert latency["strategy"]["count"] == len(closes)
+    assert latency["tick_to_order"]["p50_us"] >= latency["execution"]["p50_us"]
+
+
+def _bar(minute, close, volume=100):
+    return MarketEvent(
+        datetime(2025, 1, 2, 9, 30) + timedelta(minutes=minute),
+        "TEST",
+        close,
+        close + 1,
+        close - 1,
+        close,
+        volume,
+    )
+
+
+def test_event_manager_coalesces_pending_bars():
+    async def drain(event_manager):
+        return [await event_manager.get() for _ in range(3)]
+
+    event_manager = AsyncEventManager(max_pending_bars=2)
+    event_manager.put(_bar(0, 100))
+    event_manager.put(_bar(1, 105))  # Merged into the pending bar
+    other = dataclasses.replace(_bar(1, 50), ticker="OTHER")
+    event_manager.put(other)
+    signal = SignalEvent(datetime(2025, 1, 2), "TEST", "LONG")
+    event_manager.put(signal)
+    event_manager.put(dataclasses.replace(_bar(2, 10), ticker="THIRD"))
+
+    # Signals are handed out first, then bars oldest first; the lane holds two
+    # bars, so the oldest ('TEST') was dropped to make room for 'THIRD'
+    events = asyncio.run(drain(event_manager))
+    assert events[0] is signal
+    assert [e.ticker for e in events[1:]] == ["OTHER", "THIRD"]
+    assert event_manager.empty()
+    assert event_manager.stats()["bars_dropped"] == 1
+
+    event_manager = AsyncEventManager()
+    event_manager.put(_bar(0, 100, volume=100))
+    event_manager.put(_bar(1, 105, volume=50))
+    merged = asyncio.run(event_manager.get())
+    assert (merged.open, merged.high, merged.low, merged.close) == (100, 106, 99, 105)
+    assert merged.volume == 150
+    assert merged.timestamp == _bar(1, 105).timestamp
+    assert event_manager.bars_merged == 1 and event_manager.max_bar_depth == 1
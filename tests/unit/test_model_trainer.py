@@ -0,0 +1,59 @@
+# tests/unit/test_model_trainer.py
+
+import numpy as np
+import pandas as pd
+
+from qmind_quant.ml_models.model_trainer import (
+    FEATURES,
+    IncrementalTrainer,
+    population_stability_index,
+)
+
+
+def _features(dates, rng, shift=0.0):
+    df = pd.DataFrame(
+        rng.normal(shift, 1.0, size=(len(dates), len(FEATURES))), columns=FEATURES
+    )
+    df["date"] = dates
+    df["target"] = (df["rsi_14"] + rng.normal(0, 0.5, len(df)) > shift).astype(int)
+    return df
+
+
+def test_population_stability_index():
+    rng = np.random.default_rng(0)
+    reference = rng.normal(0, 1, 5000)
+    assert population_stability_index(reference, rng.normal(0, 1, 1000)) < 0.05
+    assert population_stability_index(reference, rng.normal(1.5, 1, 1000)) > 1.0
+
+
+def test_incremental_trainer_updates_and_refits_on_drift():
+    rng = np.random.default_rng(1)
+    dates = pd.date_range("2024-01-01", periods=600)
+    history = _features(dates[:500], rng)
+    trainer = IncrementalTrainer(
+        params={"n_estimators": 30}, update_trees=10, nthread=1
+    )
+
+    trainer.fit(history)
+    # The window slides forward by rows from the same distribution
+    window = pd.concat([history, _features(dates[500:550], rng)]).iloc[50:]
+    model = trainer.fit(window)
+    assert model.get_booster().num_boosted_rounds() == 40
+    assert trainer.fit(window) is model  # Nothing new, nothing to do
+
+    # New rows from a shifted distribution force a refit
+    drifted = pd.concat([window, _features(dates[550:], rng, shift=2.0)])
+    model = trainer.fit(drifted)
+    assert model.get_booster().num_boosted_rounds() == 30
+
+    assert [h["mode"] for h in trainer.history] == [
+        "full",
+        "update",
+        "unchanged",
+        "full",
+    ]
+    assert trainer.history[1]["new_rows"] == 50
+    report = trainer.report()
+    assert (report["fits"], report["full_fits"], report["updates"]) == (4, 2, 1)
+    assert report["estimated_full_retrain_seconds"] > 0
+    assert model.predict_proba(drifted[FEATURES]).shape == (len(drifted), 2)
@@ -0,0 +1,55 @@
+# tests/unit/test_order_book.py
+
+from datetime import datetime
+
+from qmind_quant.core.event_types import MarketEvent, OrderEvent
+from qmind_quant.execution.order_book import MatchingEngine
+
+
+def _bar(open_, high, low, close, volume=1000):
+    return MarketEvent(datetime(2025, 1, 2), "TEST", open_, high, low, close, volume)
+
+
+def _limit(direction, quantity, price):
+    return OrderEvent(datetime(2025, 1, 1), "TEST", "LMT", direction, quantity, price)
+
+
+def test_limit_and_stop_orders_follow_ohlc_fill_rules():
+    engine = MatchingEngine()
+    engine.submit(_limit("BUY", 10, 99.0))  # Crossed intrabar -> fills at limit
+    engine.submit(_limit("BUY", 10, 90.0))  # Never reached -> keeps resting
+    engine.submit(_limit("SELL", 10, 95.0))  # Open gaps through -> fills at open
+    engine.submit(
+        OrderEvent(datetime(2025, 1, 1), "TEST", "STP", "SELL", 5, stop_price=98.0)
+    )
+
+    executions = engine.on_bar(_bar(100.0, 101.0, 97.0, 98.5))
+
+    fills = {
+        (e.resting_order.order.order_type, e.resting_order.order.direction): e
+        for e in executions
+    }
+    assert fills[("LMT", "BUY")].price == 99.0
+    assert fills[("LMT", "SELL")].price == 100.0
+    assert fills[("STP", "SELL")].price == 98.0
+    assert len(executions) == 3
+    assert len(engine.orders) == 1
+
+
+def test_volume_cap_fills_in_price_time_priority():
+    engine = MatchingEngine(max_volume_pct=0.1)  # 100 shares per bar
+    first = engine.submit(_limit("BUY", 60, 99.0))
+    second = engine.submit(_limit("BUY", 60, 99.0))
+    better = engine.submit(_limit("BUY", 30, 99.5))
+    cancelled = engine.submit(_limit("BUY", 30, 99.5))
+    engine.cancel(cancelled)
+
+    executions = engine.on_bar(_bar(100.0, 100.0, 98.0, 99.0))
+    filled = [(e.resting_order.order_id, e.quantity) for e in executions]
+    assert filled == [(better, 30), (first, 60), (second, 10)]
+
+    executions = engine.on_bar(_bar(100.0, 100.0, 98.0, 99.0))
+    assert [(e.resting_order.order_id, e.quantity) for e in executions] == [
+        (second, 50)
+    ]
+    assert engine.orders == {}
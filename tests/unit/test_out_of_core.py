@@ -0,0 +1,70 @@
+# tests/unit/test_out_of_core.py
+
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+
+from qmind_quant.ml_models.model_trainer import FEATURES, train_xgboost_model
+from qmind_quant.ml_models.out_of_core import (
+    ParquetFeatureIter,
+    train_xgboost_out_of_core,
+)
+
+
+def _feature_store(path, n_rows=3000):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(n_rows, len(FEATURES))), columns=FEATURES)
+    df["date"] = np.tile(pd.date_range("2020-01-01", periods=n_rows // 3), 3)
+    df["ticker"] = np.repeat(["AAPL", "GOOG", "MSFT"], n_rows // 3)
+    df["target"] = df["rsi_14"] - df["macd"] + rng.normal(0, 0.3, n_rows) > 0
+    df["target"] = df["target"].astype(int)
+    df.to_parquet(path, partition_cols=["ticker"])
+    return df
+
+
+def test_iterator_streams_float32_batches(tmp_path):
+    _feature_store(tmp_path / "store")
+    batches = []
+    data_iter = ParquetFeatureIter(tmp_path / "store", batch_size=400)
+    while data_iter.next(lambda **kwargs: batches.append(kwargs)):
+        pass
+
+    assert len(batches) == 9  # 3 partitions of 1000 rows
+    assert all(b["data"].dtype == np.float32 for b in batches)
+    assert all(b["data"].shape[1] == len(FEATURES) for b in batches)
+    assert sum(len(b["label"]) for b in batches) == 3000
+
+
+def test_out_of_core_model_matches_in_memory_training(tmp_path):
+    df = _feature_store(tmp_path / "store")
+    params = {"n_estimators": 30, "n_jobs": 1}
+    in_memory = train_xgboost_model(df, params)
+    X = df[FEATURES]
+
+    for external_memory in (False, True):
+        model = train_xgboost_out_of_core(
+            tmp_path / "store",
+            params,
+            batch_size=500,
+            external_memory=external_memory,
+            cache_dir=tmp_path / "cache",
+        )
+        agreement = np.mean(model.predict(X) == in_memory.predict(X))
+        assert agreement > 0.97
+        np.testing.assert_allclose(
+            model.predict_proba(X), in_memory.predict_proba(X), atol=0.1
+        )
+        # The one-row DataFrame MLStrategy predicts on
+        assert model.predict(X.iloc[[-1]])[0] in (0, 1)
+
+
+def test_filter_is_pushed_down_to_the_scan(tmp_path):
+    df = _feature_store(tmp_path / "store")
+    cutoff = pd.Timestamp("2020-06-30")
+    labels = []
+    data_iter = ParquetFeatureIter(
+        tmp_path / "store", filter=ds.field("date") <= cutoff
+    )
+    while data_iter.next(lambda **kwargs: labels.extend(kwargs["label"])):
+        pass
+    assert len(labels) == (df["date"] <= cutoff).sum()
@@ -0,0 +1,57 @@
+# tests/unit/test_performance_metrics.py
+
+import numpy as np
+import pandas as pd
+import pytest
+import quantstats as qs
+
+from qmind_quant.analytics import performance_metrics as pm
+
+
+@pytest.fixture
+def returns():
+    rng = np.random.default_rng(11)
+    dates = pd.date_range("2022-01-01", periods=500, freq="D")
+    values = rng.normal(4e-4, 0.012, size=(500, 4))
+    values[0, 1] = -0.05  # A loss on the first day is a drawdown
+    values[rng.random((500, 4)) < 0.1] = 0.0  # Days out of the market
+    return pd.DataFrame(values, index=dates, columns=["a", "b", "c", "d"])
+
+
+@pytest.mark.parametrize(
+    "metric, reference",
+    [
+        (pm.sharpe, qs.stats.sharpe),
+        (pm.sortino, qs.stats.sortino),
+        (pm.volatility, qs.stats.volatility),
+        (pm.max_drawdown, qs.stats.max_drawdown),
+        (pm.cagr, qs.stats.cagr),
+        (pm.calmar, qs.stats.calmar),
+        (pm.win_rate, qs.stats.win_rate),
+    ],
+)
+def test_metrics_match_quantstats(returns, metric, reference):
+    expected = [reference(returns[column]) for column in returns]
+    # The whole matrix at once, and one curve at a time
+    np.testing.assert_allclose(metric(returns).to_numpy(), expected, rtol=1e-9)
+    np.testing.assert_allclose(metric(returns.to_numpy()), expected, rtol=1e-9)
+    assert metric(returns["b"]) == pytest.approx(expected[1], rel=1e-9)
+
+
+def test_max_drawdown_duration_matches_quantstats(returns):
+    for column in returns:
+        details = qs.stats.drawdown_details(
+            qs.stats.to_drawdown_series(returns[column])
+        )
+        assert pm.max_drawdown_duration(returns[column]) == details["days"].max()
+
+
+def test_turnover_and_summary(returns):
+    weights = np.array([[0.5, 0.5], [0.6, 0.4], [0.6, 0.4], [0.0, 1.0]])
+    assert pm.turnover(weights) == pytest.approx((0.1 + 0.0 + 0.6) / 3)
+    stacked = np.stack([weights, weights[::-1]], axis=2)
+    np.testing.assert_allclose(pm.turnover(stacked), [0.7 / 3, 0.7 / 3])
+
+    table = pm.summary(returns)
+    assert list(table.columns) == ["a", "b", "c", "d"]
+    assert table.loc["sharpe", "c"] == pytest.approx(pm.sharpe(returns["c"]))
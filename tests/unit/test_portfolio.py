@@ -0,0 +1,101 @@
+# tests/unit/test_portfolio.py
+
+import random
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from qmind_quant.analytics import performance_metrics as pm
+from qmind_quant.core.event_manager import EventManager
+from qmind_quant.core.event_types import MarketEvent, FillEvent
+from qmind_quant.data_management.data_handler import HistoricalDataHandler
+from qmind_quant.portfolio_management.portfolio import Portfolio
+
+
+def _make_portfolio(tickers):
+    data_df = pd.DataFrame(
+        {
+            "date": [datetime(2025, 1, 1)] * len(tickers),
+            "ticker": tickers,
+            "open": 1.0,
+            "high": 1.0,
+            "low": 1.0,
+            "close": 1.0,
+            "volume": 1,
+        }
+    )
+    data_handler = HistoricalDataHandler(tickers=tickers, data_df=data_df)
+    return Portfolio(EventManager(), data_handler, initial_capital=1_000_000.0)
+
+
+def test_incremental_market_value_matches_full_revaluation():
+    """
+    The running market value must equal a from-scratch revaluation of every
+    position at its latest close, after any mix of bars and fills.
+    """
+    rng = random.Random(7)
+    tickers = [f"T{i}" for i in range(20)]
+    portfolio = _make_portfolio(tickers)
+    prices = {ticker: 100.0 for ticker in tickers}
+    timestamp = datetime(2025, 1, 2)
+
+    for step in range(2000):
+        ticker = rng.choice(tickers)
+        timestamp += timedelta(minutes=1)
+        if rng.random() < 0.7:
+            prices[ticker] *= 1 + rng.uniform(-0.05, 0.05)
+            portfolio.on_market_event(
+                MarketEvent(timestamp, ticker, 0, 0, 0, prices[ticker], 1000)
+            )
+        else:
+            direction = rng.choice(["BUY", "SELL"])
+            quantity = rng.randint(1, 50)
+            portfolio.on_fill(
+                FillEvent(timestamp, ticker, direction, quantity, prices[ticker], 1.0)
+            )
+
+    assert portfolio.market_value == pytest.approx(
+        portfolio._revalue_all_positions(), rel=1e-9
+    )
+    expected = sum(
+        quantity * prices[ticker]
+        for ticker, quantity in portfolio.current_holdings.items()
+    )
+    assert portfolio.market_value == pytest.approx(expected, rel=1e-9)
+    assert portfolio.all_holdings[-1]["total_value"] == pytest.approx(
+        portfolio.cash + portfolio.all_holdings[-1]["market_value"]
+    )
+
+
+def test_online_stats_match_metrics_over_the_equity_curve():
+    rng = random.Random(3)
+    tickers = ["A", "B", "C"]
+    portfolio = _make_portfolio(tickers)
+    prices = dict.fromkeys(tickers, 100.0)
+    timestamp = datetime(2025, 1, 2)
+    for ticker in tickers:
+        portfolio.on_fill(FillEvent(timestamp, ticker, "BUY", 3000, 100.0, 1.0))
+
+    def check():
+        returns = portfolio.get_equity_curve()["returns"]
+        stats = portfolio.stats.snapshot()
+        for name in ("sharpe", "sortino", "cagr", "volatility", "calmar"):
+            assert stats[name] == pytest.approx(getattr(pm, name)(returns), rel=1e-9)
+        assert stats["max_drawdown"] == pytest.approx(pm.max_drawdown(returns))
+        assert stats["max_drawdown_duration"] == pm.max_drawdown_duration(returns)
+        assert stats["win_rate"] == pm.win_rate(returns)
+        assert stats["periods"] == len(returns)
+
+    for step in range(600):
+        ticker = rng.choice(tickers)
+        timestamp += timedelta(minutes=1)
+        prices[ticker] *= 1 + rng.gauss(0.0002, 0.01)
+        portfolio.on_market_event(
+            MarketEvent(timestamp, ticker, 0, 0, 0, prices[ticker], 1000)
+        )
+        if step == 299:
+            check()  # Mid-run
+    check()
+    assert portfolio.stats.trades == 3
+    assert portfolio.stats.traded_value == pytest.approx(900_000.0)
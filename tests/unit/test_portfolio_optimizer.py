@@ -0,0 +1,77 @@
+# tests/unit/test_portfolio_optimizer.py
+
+import numpy as np
+import pandas as pd
+import quantstats as qs
+
+from qmind_quant.execution.cost_models import BpsCommission
+from qmind_quant.optimization import returns_cache
+from qmind_quant.optimization.portfolio_optimizer import PortfolioOptimizer
+from qmind_quant.optimization.returns_cache import (
+    ReturnsCache,
+    StrategySpec,
+    load_strategy_returns,
+)
+
+
+def test_evaluate_many_matches_per_particle_quantstats_sharpe():
+    rng = np.random.default_rng(3)
+    dates = pd.date_range("2024-01-01", periods=300)
+    returns = pd.DataFrame(
+        {
+            "xgb": rng.normal(5e-4, 0.01, len(dates)),
+            "bnh": rng.normal(3e-4, 0.012, len(dates)),
+        },
+        index=dates,
+    )
+    returns.iloc[:3, 0] = np.nan  # Dates one strategy did not trade
+    optimizer = PortfolioOptimizer.from_returns(returns)
+
+    weights = rng.random((25, 2))
+    weights /= weights.sum(axis=1, keepdims=True)
+    scores = optimizer.evaluate_many(weights)
+
+    aligned = returns.dropna()
+    expected = [-qs.stats.sharpe((aligned * w).sum(axis=1)) for w in weights]
+    np.testing.assert_allclose(scores, expected, rtol=1e-9)
+    assert optimizer.evaluate(weights[0]) == scores[0]
+
+
+def test_strategy_returns_are_cached_by_data_params_and_config(tmp_path, monkeypatch):
+    data_path = tmp_path / "features.parquet"
+    pd.DataFrame(
+        {"date": pd.date_range("2024-01-01", periods=5), "close": range(1, 6)}
+    ).to_parquet(data_path)
+    calls = []
+
+    def momentum(feature_df, params, config):
+        calls.append(config["cost_model"].bps)
+        returns = feature_df.set_index("date")["close"].pct_change().fillna(0.0)
+        return returns * params["leverage"]
+
+    # Registered for this test only
+    monkeypatch.setitem(
+        returns_cache.STRATEGY_REGISTRY,
+        "test_momentum",
+        StrategySpec("test_momentum", momentum, {"leverage": 2.0}),
+    )
+    cache = ReturnsCache(tmp_path / "cache")
+
+    def load(bps):
+        config = {"tickers": ["SPY"], "cost_model": BpsCommission(bps=bps)}
+        return load_strategy_returns(["test_momentum"], config, data_path, cache)
+
+    first = load(1.0)
+    second = load(1.0)
+    pd.testing.assert_frame_equal(first, second, check_freq=False)
+    assert calls == [1.0] and cache.hits == 1
+    assert first["test_momentum"].iloc[1] == 2.0
+
+    # A different cost model is a different backtest
+    load(5.0)
+    assert calls == [1.0, 5.0]
+
+    # A rewrite of the same data is the same data
+    pd.read_parquet(data_path).to_parquet(data_path)
+    load(5.0)
+    assert calls == [1.0, 5.0] and cache.hits == 2
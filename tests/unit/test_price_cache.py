@@ -0,0 +1,57 @@
+# tests/unit/test_price_cache.py
+
+from datetime import datetime
+
+from qmind_quant.core.event_manager import EventManager
+from qmind_quant.core.event_types import SignalEvent
+from qmind_quant.data_management.price_cache import PriceCache
+from qmind_quant.portfolio_management import portfolio as portfolio_module
+from qmind_quant.portfolio_management.portfolio import Portfolio
+
+
+def test_shared_cache_is_visible_to_attached_readers():
+    tickers = ["AAPL", "MSFT"]
+    cache = PriceCache(tickers, shared=True)
+    try:
+        reader = PriceCache.attach(cache.name, tickers)
+        assert reader.get_latest_close_price("AAPL") is None
+
+        cache.update("AAPL", 190.5, 1_000)
+        cache.update("UNKNOWN", 1.0)
+        assert reader.get_latest_close_price("AAPL") == 190.5
+        assert reader.get_latest_volume("AAPL") == 1_000
+        assert reader.get_last_update_time("AAPL") is not None
+        assert reader.get_latest_close_price("UNKNOWN") is None
+        reader.close()
+    finally:
+        cache.close()
+        cache.unlink()
+
+
+def test_live_portfolio_sizes_orders_from_cache():
+    cache = PriceCache(["AAPL"])
+    event_manager = EventManager()
+    portfolio = Portfolio(
+        event_manager, data_handler=None, price_cache=cache, order_value=1_000.0
+    )
+
+    cache.update("AAPL", 200.0)
+    portfolio.on_signal(SignalEvent(datetime(2025, 1, 2), "AAPL", "LONG", 1.0))
+
+    order = event_manager.get()
+    assert order.quantity == 5
+
+
+def test_live_portfolio_caps_its_holdings_history(monkeypatch):
+    monkeypatch.setattr(portfolio_module, "LIVE_HOLDINGS_HISTORY", 3)
+    cache = PriceCache(["AAPL"])
+    portfolio = Portfolio(EventManager(), data_handler=None, price_cache=cache)
+
+    for day in range(1, 6):
+        portfolio.on_prices(datetime(2025, 1, day), {"AAPL": 100.0 + day})
+
+    assert len(portfolio.all_holdings) == 3
+    assert portfolio.stats.count == 6
+    assert list(portfolio.get_equity_curve().index) == [
+        datetime(2025, 1, day) for day in (3, 4, 5)
+    ]
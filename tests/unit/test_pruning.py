@@ -0,0 +1,72 @@
+# tests/unit/test_pruning.py
+
+import optuna
+import pytest
+
+from qmind_quant.data_management.replay_stream import synthetic_bars
+from qmind_quant.optimization.pruning import OptunaPruningCallback
+from scripts.run_backtest import run_single_backtest
+
+
+class _RecordingCallback(OptunaPruningCallback):
+    """Keeps the engine it is called with, to inspect after the run."""
+
+    def __call__(self, engine, periods):
+        self.engine = engine
+        super().__call__(engine, periods)
+
+
+class _PruneFrom(optuna.pruners.BasePruner):
+    """Prunes every trial once it has reported at 'step' or later."""
+
+    def __init__(self, step):
+        self.step = step
+
+    def prune(self, study, trial):
+        return (trial.last_step or 0) >= self.step
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "bars.parquet"
+    synthetic_bars(n_symbols=2, n_bars=500, freq="B", seed=4).to_parquet(path)
+    return str(path)
+
+
+def _run(data_file, callback):
+    return run_single_backtest(
+        data_file=data_file,
+        tickers=["SYM00000", "SYM00001"],
+        initial_capital=100000.0,
+        max_drawdown_pct=0.5,
+        short_window=5,
+        long_window=20,
+        callback=callback,
+        callback_every=100,
+    )
+
+
+def test_backtest_reports_interim_sharpe_every_period_block(data_file):
+    study = optuna.create_study(direction="maximize", pruner=optuna.pruners.NopPruner())
+    trial = study.ask()
+    sharpe = _run(data_file, OptunaPruningCallback(trial))
+    study.tell(trial, sharpe)
+
+    reported = study.trials[0].intermediate_values
+    assert sorted(reported) == [100, 200, 300, 400]
+    assert all(isinstance(value, float) for value in reported.values())
+
+
+def test_pruned_trial_stops_the_backtest_early(data_file):
+    study = optuna.create_study(direction="maximize", pruner=_PruneFrom(200))
+    trial = study.ask()
+    callback = _RecordingCallback(trial)
+    with pytest.raises(optuna.TrialPruned):
+        _run(data_file, callback)
+    study.tell(trial, state=optuna.trial.TrialState.PRUNED)
+
+    assert sorted(study.trials[0].intermediate_values) == [100, 200]
+    # Only the first 200 of the 499 periods were backtested: the portfolio
+    # saw 2 x 200 of the 2 x 500 bars, after its initial record
+    assert callback.engine.periods_processed == 200
+    assert callback.engine.portfolio.stats.count == 1 + 2 * 200
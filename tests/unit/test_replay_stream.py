@@ -0,0 +1,61 @@
+# tests/unit/test_replay_stream.py
+
+import asyncio
+
+import pandas as pd
+
+from qmind_quant.data_management.replay_stream import ReplayDataStream
+
+
+def _write_bars(path):
+    dates = pd.date_range("2025-01-02 09:30", periods=3, freq="1s")
+    bars = pd.DataFrame(
+        {
+            "date": list(dates) * 2,
+            "ticker": ["AAA"] * 3 + ["BBB"] * 3,
+            "open": [1.0, 2.0, 3.0, 10.0, 20.0, 30.0],
+            "high": 1.0,
+            "low": 1.0,
+            "close": [1.0, 2.0, 3.0, 10.0, 20.0, 30.0],
+            "volume": 100,
+        }
+    )
+    bars.to_parquet(path, index=False)
+
+
+def test_replay_sends_subscribed_bars_in_time_order_at_speed(tmp_path):
+    path = tmp_path / "bars.parquet"
+    _write_bars(path)
+    received = []
+
+    async def handler(bar):
+        received.append((bar.symbol, bar.close))
+
+    # Fast as possible: every bar of every ticker, interleaved by time
+    stream = ReplayDataStream.from_parquet(path)
+    stream.subscribe_bars(handler, "*")
+    stream.run()
+    assert [close for _, close in received] == [1.0, 10.0, 2.0, 20.0, 3.0, 30.0]
+
+    # Two seconds of bars at 20x take at least 0.1 seconds
+    received.clear()
+    stream = ReplayDataStream.from_parquet(path, tickers=["BBB"], speed=20.0)
+    stream.subscribe_bars(handler, "BBB")
+    stream.run()
+    assert received == [("BBB", 10.0), ("BBB", 20.0), ("BBB", 30.0)]
+    assert stream.elapsed_seconds >= 0.095
+
+
+def test_stop_ws_ends_the_replay(tmp_path):
+    path = tmp_path / "bars.parquet"
+    _write_bars(path)
+    stream = ReplayDataStream.from_parquet(path)
+    received = []
+
+    async def handler(bar):
+        received.append(bar)
+        await stream.stop_ws()
+
+    stream.subscribe_bars(handler)
+    asyncio.run(stream._run_forever())
+    assert len(received) == 1 and stream.bars_sent == 1
@@ -0,0 +1,86 @@
+# tests/unit/test_risk_manager.py
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from qmind_quant.core.event_manager import EventManager
+from qmind_quant.core.event_types import FillEvent
+from qmind_quant.portfolio_management.portfolio import Portfolio
+from qmind_quant.portfolio_management.risk_manager import RiskManager, RiskLimits
+
+
+def _feed_random_walk(risk_manager, tickers, n_days, seed=0):
+    rng = np.random.default_rng(seed)
+    prices = np.full(len(tickers), 100.0)
+    history = []
+    for day in range(n_days):
+        returns = rng.normal(0, 0.02, len(tickers))
+        prices = prices * (1 + returns)
+        for ticker, price in zip(tickers, prices):
+            risk_manager.on_market_event(ticker, day, price)
+        history.append(returns)
+    return np.array(history)
+
+
+def test_historical_var_matches_direct_computation():
+    tickers = ["A", "B", "C"]
+    risk_manager = RiskManager(tickers, window=50, confidence=0.95)
+    history = _feed_random_walk(risk_manager, tickers, n_days=80)
+    risk_manager.on_fill("A", 100, 100.0)
+    risk_manager.on_fill("B", -50, 100.0)
+
+    metrics = risk_manager.evaluate(equity=100_000.0)
+
+    # The last completed 50 rows (the final day is still pending)
+    exposures = risk_manager._exposures()
+    pnl = history[-51:-1] @ exposures
+    expected_var = -np.quantile(pnl, 0.05)
+    assert metrics.historical_var == pytest.approx(expected_var)
+    assert metrics.gross_exposure == pytest.approx(np.abs(exposures).sum() / 1e5)
+    assert metrics.net_exposure == pytest.approx(exposures.sum() / 1e5)
+
+
+def test_check_order_enforces_concentration_but_allows_reductions():
+    risk_manager = RiskManager(["A"], limits=RiskLimits(max_position_pct=0.10))
+    risk_manager.on_market_event("A", 0, 100.0)
+
+    allowed, _ = risk_manager.check_order("A", 50, 100.0, equity=100_000.0)
+    assert allowed
+    allowed, reason = risk_manager.check_order("A", 200, 100.0, equity=100_000.0)
+    assert not allowed and "concentration" in reason
+
+    risk_manager.on_fill("A", 200, 100.0)
+    allowed, _ = risk_manager.check_order("A", -100, 100.0, equity=100_000.0)
+    assert allowed
+
+
+def test_evaluate_without_equity_reports_infinite_exposure():
+    risk_manager = RiskManager(["A", "B"])
+    risk_manager.on_market_event("A", 0, 100.0)
+    risk_manager.on_fill("A", -10, 100.0)
+
+    for equity in (0.0, -500.0):
+        metrics = risk_manager.evaluate(equity)
+        assert metrics.gross_exposure == np.inf
+        assert metrics.net_exposure == -np.inf
+        assert metrics.max_concentration == np.inf
+    assert RiskManager(["A"]).evaluate(0.0).gross_exposure == 0.0
+
+
+def test_portfolio_evaluates_risk_once_all_prices_are_marked():
+    tickers = ["A", "B"]
+    portfolio = Portfolio(
+        EventManager(), risk_manager=RiskManager(tickers), max_drawdown_pct=1.0
+    )
+    portfolio.on_prices(datetime(2025, 1, 2), {"A": 100.0, "B": 100.0})
+    for ticker in tickers:
+        portfolio.on_fill(FillEvent(datetime(2025, 1, 2), ticker, "BUY", 10, 100.0))
+
+    portfolio.on_prices(datetime(2025, 1, 3), {"A": 110.0, "B": 50.0})
+
+    equity = portfolio.cash + portfolio.market_value
+    assert portfolio.latest_risk_metrics.gross_exposure == pytest.approx(
+        (10 * 110.0 + 10 * 50.0) / equity
+    )
@@ -0,0 +1,203 @@
+# tests/unit/test_sharded_engine.py
+
+import asyncio
+from datetime import datetime, timedelta
+
+from qmind_quant.core.event_manager import AsyncEventManager
+from qmind_quant.core.event_types import FillEvent, MarketEvent, OrderEvent
+from qmind_quant.core.sharded_engine import ShardedLiveEngine, net_orders, shard_for
+from qmind_quant.data_management.price_cache import PriceCache
+from qmind_quant.execution.execution import SimulatedExecutionHandler
+from qmind_quant.execution.live_execution import LiveExecutionHandler
+from qmind_quant.execution.mock_broker import MockBroker
+from qmind_quant.portfolio_management.portfolio import Portfolio
+from qmind_quant.strategies.base_strategy import BaseStrategy
+from qmind_quant.strategies.library.ma_crossover_strategy import (
+    MovingAverageCrossoverStrategy,
+)
+
+START = datetime(2025, 1, 2, 9, 30)
+
+
+class ReplayedFeed:
+    """Replays bars into the price cache and event queue, like LiveDataHandler."""
+
+    def __init__(self, event_manager, price_cache, bars):
+        self.event_manager = event_manager
+        self.price_cache = price_cache
+        self.bars = bars
+
+    async def run_async(self):
+        for bar in self.bars:
+            self.price_cache.update(bar.ticker, bar.close, bar.volume)
+            self.event_manager.put(bar)
+            await asyncio.sleep(0)
+
+
+def make_strategy(tickers, event_manager):
+    return MovingAverageCrossoverStrategy(
+        tickers, event_manager, short_window=2, long_window=4
+    )
+
+
+def make_portfolio(event_manager, price_cache):
+    return Portfolio(
+        event_manager,
+        data_handler=None,
+        initial_capital=100_000.0,
+        price_cache=price_cache,
+    )
+
+
+def make_execution(event_manager, price_cache):
+    return SimulatedExecutionHandler(event_manager, price_cache)
+
+
+def make_live_execution(event_manager, price_cache):
+    """A live handler whose orders fill shortly after submission."""
+    broker = MockBroker(latency=0.0, fill_delay=0.05, price_source=price_cache)
+    return LiveExecutionHandler(price_cache, client=broker, event_manager=event_manager)
+
+
+class SilentStrategy(BaseStrategy):
+    def on_market_event(self, event):
+        pass
+
+
+def make_silent_strategy(tickers, event_manager):
+    return SilentStrategy(tickers, event_manager)
+
+
+def make_invested_portfolio(event_manager, price_cache):
+    """A portfolio already holding 100 shares of each ticker, bought at 100."""
+    portfolio = Portfolio(
+        event_manager,
+        data_handler=None,
+        initial_capital=100_000.0,
+        max_drawdown_pct=0.05,
+        price_cache=price_cache,
+    )
+    for ticker in price_cache.tickers:
+        portfolio.on_fill(FillEvent(START, ticker, "BUY", 100, 100.0))
+    return portfolio
+
+
+def test_sharded_engine_trades_every_ticker_once():
+    tickers = [f"T{i}" for i in range(6)]
+    bars = [
+        MarketEvent(START + timedelta(minutes=m), t, c, c, c, c, 1000)
+        for m, c in enumerate([100, 101, 102, 110])
+        for t in tickers
+    ]
+    assert len({shard_for(t, 2) for t in tickers}) == 2
+
+    event_manager = AsyncEventManager()
+    price_cache = PriceCache(tickers, shared=True)
+    try:
+        engine = ShardedLiveEngine(
+            event_manager,
+            ReplayedFeed(event_manager, price_cache, bars),
+            price_cache,
+            make_strategy,
+            make_portfolio,
+            make_execution,
+            n_shards=2,
+        )
+        result = asyncio.run(engine.run())
+    finally:
+        price_cache.close()
+        price_cache.unlink()
+
+    assert sum(engine.bars_routed) == len(bars)
+    assert result["holdings"] == {t: 10 for t in tickers}
+    assert result["fills"] == len(tickers)
+    assert result["cash"] == 100_000.0 - len(tickers) * (10 * 110 + 1.0)
+
+
+def test_sharded_engine_books_live_fills_in_the_aggregator():
+    """
+    The live handler's fills arrive after submission; the aggregator polls
+    for them, so its holdings and cash follow what the broker executed.
+    """
+    tickers = [f"T{i}" for i in range(6)]
+    bars = [
+        MarketEvent(START + timedelta(minutes=m), t, c, c, c, c, 1000)
+        for m, c in enumerate([100, 101, 102, 110])
+        for t in tickers
+    ]
+
+    event_manager = AsyncEventManager()
+    price_cache = PriceCache(tickers, shared=True)
+    try:
+        engine = ShardedLiveEngine(
+            event_manager,
+            ReplayedFeed(event_manager, price_cache, bars),
+            price_cache,
+            make_strategy,
+            make_portfolio,
+            make_live_execution,
+            n_shards=2,
+        )
+        result = asyncio.run(engine.run())
+    finally:
+        price_cache.close()
+        price_cache.unlink()
+
+    assert result["orders_sent"] == len(tickers)
+    assert result["open_orders"] == 0
+    assert result["fills"] == len(tickers)
+    assert result["holdings"] == {t: 10 for t in tickers}
+    assert result["cash"] == 100_000.0 - len(tickers) * 10 * 110
+
+
+def test_net_orders_crosses_opposite_market_orders():
+    ts = datetime(2025, 1, 2)
+    orders = [
+        OrderEvent(ts, "A", "MKT", "BUY", 10),
+        OrderEvent(ts, "A", "MKT", "SELL", 4),
+        OrderEvent(ts, "B", "MKT", "BUY", 5),
+        OrderEvent(ts, "B", "MKT", "SELL", 5),
+        OrderEvent(ts, "C", "LMT", "BUY", 1, limit_price=9.0),
+    ]
+    netted = net_orders(orders)
+    assert [(o.ticker, o.direction, o.quantity) for o in netted] == [
+        ("A", "BUY", 6),
+        ("C", "BUY", 1),
+    ]
+
+
+def test_sharded_engine_liquidates_on_drawdown():
+    """
+    The aggregator marks its portfolio to the cached prices once per
+    timestamp, so the drawdown check fires without any signal.
+    """
+    tickers = ["T0", "T1", "T2"]
+    bars = [
+        MarketEvent(START + timedelta(minutes=m), t, c, c, c, c, 1000)
+        for m, c in enumerate([100, 100, 80, 80])
+        for t in tickers
+    ]
+
+    event_manager = AsyncEventManager()
+    price_cache = PriceCache(tickers, shared=True)
+    try:
+        engine = ShardedLiveEngine(
+            event_manager,
+            ReplayedFeed(event_manager, price_cache, bars),
+            price_cache,
+            make_silent_strategy,
+            make_invested_portfolio,
+            make_execution,
+            n_shards=2,
+        )
+        result = asyncio.run(engine.run())
+    finally:
+        price_cache.close()
+        price_cache.unlink()
+
+    assert result["signals_received"] == 0
+    assert result["marks"] >= 1
+    # A 20% fall on 30,000 of stock is a 6% drawdown, past the 5% limit
+    assert result["stats"]["max_drawdown"] < -0.05
+    assert result["holdings"] == {}
+    assert result["fills"] == len(tickers)
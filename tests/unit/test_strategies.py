@@ -1,7 +1,14 @@
 # tests/unit/test_strategies.py
 
+import pandas as pd
+
 from qmind_quant.core.event_manager import EventManager
 from qmind_quant.core.event_types import MarketEvent, SignalEvent
+from qmind_quant.data_management.bootstrap import (
+    load_recent_bars,
+    save_bar_snapshot,
+    warm_start_strategies,
+)
 from qmind_quant.strategies.library.ma_crossover_strategy import (
     MovingAverageCrossoverStrategy,
 )
@@ -45,3 +52,77 @@ def test_ma_crossover_generates_long_signal():
     assert isinstance(signal, SignalEvent), "Event should be a SignalEvent"
     assert signal.ticker == "TEST", "Signal ticker should be correct"
     assert signal.signal_type == "LONG", "Signal type should be LONG"
+
+
+def test_warm_start_from_parquet_lets_strategy_trade_on_first_bar(tmp_path):
+    """
+    A strategy warmed up from the bar store and a shutdown snapshot must hold
+    the newest bars and signal on the first live bar, as if it had seen them.
+    """
+    dates = pd.date_range("2025-01-01", periods=6)
+    store = pd.DataFrame(
+        {
+            "date": list(dates[:5]) * 2,
+            "ticker": ["TEST"] * 5 + ["OTHER"] * 5,
+            "open": 100.0,
+            "high": 100.0,
+            "low": 100.0,
+            "close": [90.0, 100.0, 100.0, 100.0, 100.0] * 2,
+            "volume": 1000,
+        }
+    )
+    store_path = tmp_path / "bars.parquet"
+    store.to_parquet(store_path, index=False)
+    # The snapshot overlaps the store and adds one newer bar
+    snapshot = store[store["ticker"] == "TEST"].tail(1)
+    snapshot = pd.concat([snapshot, snapshot.assign(date=dates[5])])
+    snapshot_path = tmp_path / "snapshot.parquet"
+    snapshot.to_parquet(snapshot_path, index=False)
+
+    event_manager = EventManager()
+    strategy = MovingAverageCrossoverStrategy(
+        ["TEST"], event_manager, short_window=2, long_window=4
+    )
+    bars = warm_start_strategies([strategy], store_path, snapshot_path)
+
+    assert list(bars["date"]) == list(dates[2:6].tz_localize("UTC"))
+    assert list(strategy.prices["TEST"]) == [100.0] * 4
+    assert event_manager.empty()
+
+    strategy.on_market_event(
+        MarketEvent(datetime(2025, 1, 7), "TEST", 110, 110, 110, 110, 1000)
+    )
+    assert event_manager.get().signal_type == "LONG"
+
+    # The crossover strategy keeps only closes, so it has no bars to snapshot
+    save_bar_snapshot([strategy], tmp_path / "empty.parquet")
+    assert not (tmp_path / "empty.parquet").exists()
+
+
+def test_load_recent_bars_merges_naive_store_with_aware_snapshot(tmp_path):
+    """
+    The bar store is tz-naive and the snapshot holds the stream's UTC
+    timestamps; both are read as UTC, so they merge and deduplicate.
+    """
+    dates = pd.date_range("2025-01-01", periods=3)
+    store = pd.DataFrame(
+        {
+            "date": dates,
+            "ticker": "TEST",
+            "open": 100.0,
+            "high": 100.0,
+            "low": 100.0,
+            "close": [100.0, 101.0, 102.0],
+            "volume": 1000,
+        }
+    )
+    store_path = tmp_path / "bars.parquet"
+    store.to_parquet(store_path, index=False)
+    snapshot = store.tail(1).assign(date=dates[2:].tz_localize("UTC"), close=103.0)
+    snapshot_path = tmp_path / "snapshot.parquet"
+    snapshot.to_parquet(snapshot_path, index=False)
+
+    bars = load_recent_bars(["TEST"], 5, store_path, snapshot_path)
+
+    assert list(bars["date"]) == list(dates.tz_localize("UTC"))
+    assert list(bars["close"]) == [100.0, 101.0, 103.0]
@@ -0,0 +1,97 @@
+# tests/unit/test_walk_forward.py
+
+import numpy as np
+import pandas as pd
+
+from qmind_quant.data_management.feature_engineer import FeatureEngineer
+from qmind_quant.data_management.replay_stream import synthetic_bars
+from qmind_quant.ml_models.model_trainer import IncrementalTrainer
+from qmind_quant.simulation import walk_forward
+from qmind_quant.simulation.walk_forward import make_folds, run_walk_forward
+
+
+def test_parallel_walk_forward_matches_sequential_in_fold_order():
+    bars = synthetic_bars(n_symbols=2, n_bars=330, freq="B", seed=5)
+    tickers = sorted(bars["ticker"].unique())
+    folds = make_folds(bars["date"], train_period_days=150, test_period_days=80)
+    assert [fold.number for fold in folds] == [1, 2]
+    assert folds[1].test_start == folds[0].test_end
+
+    kwargs = dict(
+        full_data_df=bars,
+        train_period_days=150,
+        test_period_days=80,
+        tickers=tickers,
+        initial_capital=100000.0,
+    )
+    sequential = run_walk_forward(**kwargs, n_workers=1)
+    parallel = run_walk_forward(**kwargs, n_workers=2)
+
+    pd.testing.assert_frame_equal(sequential, parallel)
+    # Stitched in fold order, with the folds' returns compounded
+    test_dates = pd.DatetimeIndex(sequential.index)
+    assert test_dates.min() == folds[0].test_start
+    assert test_dates.max() == folds[1].test_end
+    assert test_dates.is_monotonic_increasing
+    np.testing.assert_allclose(
+        sequential["total_value"].iloc[-1],
+        100000.0 * (1 + sequential["returns"]).prod(),
+    )
+
+
+def test_features_are_computed_once_and_labels_purged(monkeypatch):
+    bars = synthetic_bars(n_symbols=2, n_bars=330, freq="B", seed=5)
+    all_dates = pd.DatetimeIndex(sorted(bars["date"].unique()))
+    feature_calls = []
+    create_features = FeatureEngineer.create_features
+
+    def counting_create_features(self, df, *args, **kwargs):
+        feature_calls.append(len(df))
+        return create_features(self, df, *args, **kwargs)
+
+    last_label_dates = []
+    train = walk_forward.train_xgboost_model
+
+    def recording_train(feature_df, params=None):
+        last_label_dates.append(feature_df["date"].max())
+        return train(feature_df, params)
+
+    monkeypatch.setattr(FeatureEngineer, "create_features", counting_create_features)
+    monkeypatch.setattr(walk_forward, "train_xgboost_model", recording_train)
+
+    walk_forward.run_walk_forward(
+        bars,
+        150,
+        80,
+        sorted(bars["ticker"].unique()),
+        100000.0,
+        n_workers=1,
+        horizon=5,
+        embargo_days=3,
+    )
+
+    assert feature_calls == [len(bars)]
+    folds = make_folds(bars["date"], 150, 80, horizon=5, embargo_days=3)
+    assert len(last_label_dates) == len(folds)
+    for fold, last_label in zip(folds, last_label_dates):
+        # The last label's 5-day horizon ends 3 embargoed days before the test
+        label_end = all_dates.get_loc(last_label) + 5
+        assert label_end == all_dates.get_loc(fold.test_start) - 3 - 1
+
+
+def test_incremental_walk_forward_is_independent_of_worker_count():
+    bars = synthetic_bars(n_symbols=2, n_bars=410, freq="B", seed=5)
+    kwargs = dict(
+        full_data_df=bars,
+        train_period_days=150,
+        test_period_days=80,
+        tickers=sorted(bars["ticker"].unique()),
+        initial_capital=100000.0,
+    )
+    # Never refit on drift, so every fold after the first is an update
+    trainers = [IncrementalTrainer(drift_threshold=np.inf, nthread=1) for _ in range(2)]
+    sequential = run_walk_forward(**kwargs, n_workers=1, trainer=trainers[0])
+    parallel = run_walk_forward(**kwargs, n_workers=2, trainer=trainers[1])
+
+    pd.testing.assert_frame_equal(sequential, parallel)
+    assert [h["mode"] for h in trainers[0].history] == ["full", "update", "update"]